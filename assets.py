@@ -0,0 +1,102 @@
+"""
+Gerenciador de imagens para o jogo DVD Bounce Simulation.
+
+Cada arquivo é decodificado (pygame.image.load + convert_alpha) uma única vez,
+e as versões redimensionadas ficam em cache por (caminho, tamanho). As
+superfícies são compartilhadas entre quadrados e entre partidas, então
+reiniciar o jogo ou mudar as configurações não decodifica os PNGs de novo.
+As variantes usadas no desenho (imagem esticada pela compressão, com flash ou
+brilho) também são pré-compostas uma vez por (caminho, tamanho, efeito).
+"""
+import pygame
+from cache import LRUCache, surface_bytes
+
+
+class AssetManager:
+    """Cache de imagens decodificadas e de suas versões redimensionadas."""
+    def __init__(self, max_decoded_bytes=32 * 1024 * 1024, max_scaled_bytes=16 * 1024 * 1024,
+                 max_variant_bytes=16 * 1024 * 1024):
+        """
+        Inicializa os caches vazios.
+
+        Args:
+            max_decoded_bytes (int, optional): Memória máxima das imagens originais
+            max_scaled_bytes (int, optional): Memória máxima das versões redimensionadas
+            max_variant_bytes (int, optional): Memória máxima das variantes com efeito
+        """
+        self.decoded = LRUCache(max_bytes=max_decoded_bytes, sizeof=surface_bytes)
+        self.scaled = LRUCache(max_bytes=max_scaled_bytes, sizeof=surface_bytes)
+        self.variants = LRUCache(max_bytes=max_variant_bytes, sizeof=surface_bytes)
+
+    def load(self, path):
+        """
+        Retorna a imagem decodificada e convertida para o formato da tela.
+
+        A superfície é compartilhada e não deve ser modificada.
+
+        Raises:
+            pygame.error, FileNotFoundError: Se o arquivo não puder ser carregado
+        """
+        return self.decoded.get_or_create(path, lambda: pygame.image.load(path).convert_alpha())
+
+    def get_scaled(self, path, size):
+        """
+        Retorna a imagem redimensionada (criada uma única vez por tamanho).
+
+        A superfície é compartilhada e não deve ser modificada.
+
+        Args:
+            path (str): Caminho do arquivo de imagem
+            size (tuple): Tamanho (largura, altura) desejado
+        """
+        size = (int(size[0]), int(size[1]))
+        return self.scaled.get_or_create(
+            (path, size), lambda: pygame.transform.scale(self.load(path), size))
+
+    def get_variant(self, path, base_size, size, effect=None, builder=None):
+        """
+        Retorna a imagem base esticada para size, opcionalmente com um efeito.
+
+        A versão esticada é feita a partir da imagem em base_size (a mesma que
+        o quadrado usa parado), e o efeito é aplicado por cima dela. Cada
+        combinação é criada uma única vez; a superfície é compartilhada e não
+        deve ser modificada.
+
+        Args:
+            path (str): Caminho do arquivo de imagem
+            base_size (tuple): Tamanho (largura, altura) da imagem base
+            size (tuple): Tamanho final (largura, altura)
+            effect (str, optional): Nome do efeito (parte da chave do cache)
+            builder (callable, optional): Recebe a imagem esticada e retorna uma
+                nova superfície com o efeito (obrigatório se effect for usado)
+        """
+        if effect is None and size == base_size:
+            return self.get_scaled(path, base_size)
+
+        key = (path, base_size, size, effect)
+        sprite = self.variants.get(key)
+        if sprite is None:
+            if effect is None:
+                sprite = pygame.transform.scale(self.get_scaled(path, base_size), size)
+            else:
+                sprite = builder(self.get_variant(path, base_size, size))
+            self.variants.put(key, sprite)
+        return sprite
+
+    def clear(self):
+        """Descarta todas as imagens (as estatísticas são mantidas)."""
+        self.decoded.clear()
+        self.scaled.clear()
+        self.variants.clear()
+
+    def stats(self):
+        """Retorna acertos, falhas e memória ocupada de cada cache."""
+        return {
+            'decoded': self.decoded.stats(),
+            'scaled': self.scaled.stats(),
+            'variants': self.variants.stats()
+        }
+
+
+# Gerenciador compartilhado pelo jogo
+ASSETS = AssetManager()
@@ -0,0 +1,363 @@
+"""
+Benchmark de tempo por frame para o jogo DVD Bounce Simulation.
+
+Monta cenas com 2, 100, 1000 e 10000 quadrados, com e sem tempestade de
+partículas, em cada mapa de AVAILABLE_MAPS, e mede separadamente Game.update()
+e cada etapa de Game.render() (inclusive render_player_info). O resultado sai
+em JSON com p50/p95/p99 em milissegundos e pode ser comparado com uma base
+gravada: qualquer etapa mais lenta que a tolerância faz o programa sair com erro
+(código 1). Uma base pedida com --base que não existe, ou que não tem alguma
+cena ou etapa medida, também é erro (código 2);
+sem --base, a comparação usa benchmark_baseline.json se ele existir.
+
+Com --trajetoria, cada cena também grava a trajetória (etapa 'trajectory') e o
+relatório mostra o custo da gravação em relação ao update.
+
+Roda sem janela visível (driver de vídeo "dummy" do SDL):
+    python benchmark.py [--frames N] [--escalas 2 100] [--saida resultado.json]
+    python benchmark.py --trajetoria [--trajetoria-passo N] --sem-tempestade
+    python benchmark.py --gravar-base            # grava benchmark_baseline.json
+    python benchmark.py --base benchmark_baseline.json --tolerancia 0.25
+"""
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import argparse
+import contextlib
+import json
+import platform
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from game import Game
+from maps import AVAILABLE_MAPS
+from trajectory import DEFAULT_STRIDES, TrajectoryRecorder
+
+# Quantidades de quadrados e o tamanho usado em cada uma (para caberem na área)
+SCALES = {2: 50, 100: 30, 1000: 12, 10000: 4}
+
+# Partículas criadas por frame durante a tempestade (mantém o pool perto do limite)
+STORM_PARTICLES = 200
+
+DEFAULT_BASELINE = "benchmark_baseline.json"
+PERCENTILES = (50, 95, 99)
+
+
+def build_scene(map_index, square_count, physics='python', seed=0):
+    """
+    Cria um jogo com a janela dummy e square_count quadrados no mapa escolhido.
+
+    Returns:
+        Game: Jogo pronto para update()/render()
+    """
+    game = Game(physics=physics, seed=seed)
+    game.verbose = False
+    game.apply_config({
+        'map_index': map_index,
+        'square_size': SCALES.get(square_count, 50),
+        'lives': 1000  # Evitar que a cena acabe durante a medição
+    })
+    game.create_squares()
+
+    # Quadrados extras sem busca de posição livre (seria O(n²) com milhares)
+    for i in range(len(game.squares), square_count):
+        square = game.create_square(color_index=i, name=f"Q{i}", avoid_overlap=False)
+        square.lives = square.max_lives = 1000
+        game.squares.append(square)
+    return game
+
+
+def feed_storm(game, rng):
+    """Cria partículas de explosão em pontos aleatórios da área."""
+    for _ in range(STORM_PARTICLES // 50):
+        x = rng.uniform(game.area_x, game.area_x + game.area_size)
+        y = rng.uniform(game.area_y, game.area_y + game.area_size)
+        game.particle_system.spawn_explosion(x, y, 20, (255, 160, 40), 50)
+
+
+def measure_scene(game, frames, storm=False, warmup=10, seed=0, trajectory=None):
+    """
+    Mede os tempos de update e de cada etapa do render por frame.
+
+    Args:
+        game (Game): Cena criada por build_scene
+        frames (int): Frames medidos
+        storm (bool, optional): Criar uma tempestade de partículas a cada frame
+        warmup (int, optional): Frames iniciais descartados (caches frios)
+        seed (int, optional): Semente das posições da tempestade
+        trajectory (TrajectoryRecorder, optional): Gravador chamado após cada
+            update (etapa 'trajectory', medida separadamente)
+
+    Returns:
+        dict: Para cada etapa ('update', 'trajectory', 'render.<etapa>', 'render'),
+              a lista de tempos em milissegundos
+    """
+    timings = {}
+    clock = time.perf_counter
+    storm_rng = random.Random(seed)
+
+    for frame in range(warmup + frames):
+        if storm:
+            feed_storm(game, storm_rng)
+
+        samples = {}
+        start = clock()
+        game.update()
+        samples['update'] = clock() - start
+
+        if trajectory is not None:
+            start = clock()
+            trajectory.record(game)
+            samples['trajectory'] = clock() - start
+
+        render_start = clock()
+        for name, render_pass in game.render_passes():
+            start = clock()
+            render_pass()
+            samples[f'render.{name}'] = clock() - start
+        samples['render'] = clock() - render_start
+
+        if frame >= warmup:
+            for name, seconds in samples.items():
+                timings.setdefault(name, []).append(seconds * 1000.0)
+
+    return timings
+
+
+def summarize_timings(timings):
+    """Converte listas de tempos em p50/p95/p99/média (ms)."""
+    summary = {}
+    for name, values in timings.items():
+        values = np.asarray(values)
+        stats = {f'p{p}': float(np.percentile(values, p)) for p in PERCENTILES}
+        stats['mean'] = float(values.mean())
+        summary[name] = stats
+    return summary
+
+
+def scene_key(map_index, square_count, storm):
+    """Nome da cena usado no JSON e na comparação com a base."""
+    return f"mapa={map_index}/quadrados={square_count}/tempestade={int(storm)}"
+
+
+def run_benchmark(scales, map_indices, frames, physics='python', storms=(False, True),
+                  trajectory_stride=None):
+    """
+    Mede todas as cenas pedidas.
+
+    Args:
+        trajectory_stride (int, optional): Se informado, cada cena também grava a
+            trajetória com este passo (em um diretório temporário)
+
+    Returns:
+        dict: Relatório com 'meta' e 'scenes' (nome da cena -> etapas -> estatísticas)
+    """
+    report = {
+        'meta': {
+            'frames': frames,
+            'physics': physics,
+            'python': platform.python_version(),
+            'machine': platform.machine(),
+            'video_driver': os.environ.get("SDL_VIDEODRIVER"),
+            'trajectory_stride': trajectory_stride
+        },
+        'scenes': {}
+    }
+
+    for map_index in map_indices:
+        for square_count in scales:
+            for storm in storms:
+                key = scene_key(map_index, square_count, storm)
+                game = build_scene(map_index, square_count, physics)
+                started = time.perf_counter()
+                if trajectory_stride is None:
+                    summary = summarize_timings(measure_scene(game, frames, storm))
+                else:
+                    directory = tempfile.mkdtemp(prefix="trajetoria_")
+                    trajectory = TrajectoryRecorder(directory, stride=trajectory_stride)
+                    try:
+                        timings = measure_scene(game, frames, storm, trajectory=trajectory)
+                        trajectory.close()
+                    finally:
+                        shutil.rmtree(directory, ignore_errors=True)
+                    summary = summarize_timings(timings)
+                    # Custo médio da gravação (inclusive os flushes) em relação ao update
+                    summary['trajectory_overhead'] = (summary['trajectory']['mean']
+                                                      / summary['update']['mean'])
+                summary['map'] = AVAILABLE_MAPS[map_index].name
+                report['scenes'][key] = summary
+                extra = ""
+                if 'trajectory_overhead' in summary:
+                    extra = f"trajetória +{100 * summary['trajectory_overhead']:.1f}% do update "
+                print(f"{key}: update p50={summary['update']['p50']:.2f}ms "
+                      f"render p50={summary['render']['p50']:.2f}ms {extra}"
+                      f"({time.perf_counter() - started:.1f}s)", file=sys.stderr)
+    return report
+
+
+def compare_with_baseline(report, baseline, tolerance=0.25, min_delta=0.05, stat='p50'):
+    """
+    Compara um relatório com a base gravada.
+
+    Args:
+        report (dict): Relatório atual
+        baseline (dict): Relatório de referência
+        tolerance (float, optional): Aumento relativo permitido (0.25 = 25%)
+        min_delta (float, optional): Diferença mínima em ms para contar como
+            regressão (evita ruído em etapas de microssegundos)
+        stat (str, optional): Estatística comparada
+
+    Returns:
+        list: Descrições das regressões encontradas (vazia se nenhuma)
+    """
+    regressions = []
+    for key, scene in report['scenes'].items():
+        base_scene = baseline.get('scenes', {}).get(key)
+        if base_scene is None:
+            continue
+        for name, stats in scene.items():
+            base_stats = base_scene.get(name)
+            if not isinstance(stats, dict) or not isinstance(base_stats, dict):
+                continue
+            current, reference = stats[stat], base_stats[stat]
+            if current > reference * (1 + tolerance) and current - reference > min_delta:
+                regressions.append(f"{key} {name}: {stat} {reference:.3f}ms -> {current:.3f}ms")
+    return regressions
+
+
+def missing_from_baseline(report, baseline):
+    """
+    Lista o que foi medido agora e não pode ser comparado com a base.
+
+    Uma cena nova (ou renomeada) sem par na base, ou uma etapa que aparece
+    só de um dos lados, passaria sem comparação pela checagem de regressões.
+    Cenas da base que não foram medidas agora (ex.: --escalas 2) não contam.
+
+    Args:
+        report (dict): Relatório atual
+        baseline (dict): Relatório de referência
+
+    Returns:
+        list: Descrições das cenas e etapas sem correspondência (vazia se nenhuma)
+    """
+    missing = []
+    base_scenes = baseline.get('scenes', {})
+    for key, scene in report['scenes'].items():
+        base_scene = base_scenes.get(key)
+        if base_scene is None:
+            missing.append(f"{key}: cena ausente na base")
+            continue
+        stages = {name for name, stats in scene.items() if isinstance(stats, dict)}
+        base_stages = {name for name, stats in base_scene.items() if isinstance(stats, dict)}
+        for name in sorted(stages - base_stages):
+            missing.append(f"{key} {name}: etapa ausente na base")
+        for name in sorted(base_stages - stages):
+            missing.append(f"{key} {name}: etapa da base não foi medida")
+    return missing
+
+
+def parse_args(argv=None):
+    """Lê os argumentos da linha de comando."""
+    parser = argparse.ArgumentParser(description="Benchmark de frame do DVD Bounce Simulation")
+    parser.add_argument("--escalas", type=int, nargs="+", default=list(SCALES),
+                        help="quantidades de quadrados a medir")
+    parser.add_argument("--mapas", type=int, nargs="+", default=None,
+                        help="índices dos mapas (padrão: todos)")
+    parser.add_argument("--frames", type=int, default=120,
+                        help="frames medidos por cena")
+    parser.add_argument("--fisica", choices=["python", "numpy"], default="python",
+                        help="backend de física")
+    parser.add_argument("--sem-tempestade", action="store_true",
+                        help="mede apenas as cenas sem tempestade de partículas")
+    parser.add_argument("--saida", metavar="ARQUIVO", default=None,
+                        help="grava o relatório JSON neste arquivo (padrão: saída padrão)")
+    parser.add_argument("--base", metavar="ARQUIVO", default=None,
+                        help="relatório de referência para detectar regressões "
+                             f"(erro se não existir; padrão: {DEFAULT_BASELINE}, se existir)")
+    parser.add_argument("--gravar-base", action="store_true",
+                        help="grava o resultado como nova base em vez de comparar")
+    parser.add_argument("--trajetoria", action="store_true",
+                        help="grava a trajetória em cada cena e mede o custo da gravação")
+    parser.add_argument("--trajetoria-passo", type=int, default=None, metavar="N",
+                        help="passo da gravação (padrão: DEFAULT_STRIDES do backend de física)")
+    parser.add_argument("--tolerancia", type=float, default=0.25,
+                        help="aumento relativo permitido antes de acusar regressão")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """
+    Executa o benchmark e retorna o código de saída.
+
+    Returns:
+        int: 0 sem regressões, 1 se houve regressão, 2 se a base pedida não existe
+            ou não tem alguma das cenas ou etapas medidas
+    """
+    args = parse_args(argv)
+    base_path = args.base or DEFAULT_BASELINE
+    map_indices = args.mapas if args.mapas is not None else range(len(AVAILABLE_MAPS))
+    storms = (False,) if args.sem_tempestade else (False, True)
+
+    # Mensagens do jogo (carregamento de imagens etc.) não podem misturar-se ao JSON
+    with contextlib.redirect_stdout(sys.stderr):
+        stride = None
+        if args.trajetoria:
+            stride = args.trajetoria_passo or DEFAULT_STRIDES[args.fisica]
+        report = run_benchmark(args.escalas, map_indices, args.frames, args.fisica, storms, stride)
+
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.saida:
+        with open(args.saida, "w", encoding="utf-8") as output:
+            output.write(text)
+    else:
+        print(text)
+
+    if args.gravar_base:
+        with open(base_path, "w", encoding="utf-8") as output:
+            output.write(text)
+        print(f"Base gravada em {base_path}", file=sys.stderr)
+        return 0
+
+    if not os.path.exists(base_path):
+        if args.base is not None:
+            # A comparação foi pedida: sem base, o resultado não pode passar
+            print(f"ERRO: base {base_path} não encontrada; nenhuma comparação foi feita "
+                  "(use --gravar-base para criar uma)", file=sys.stderr)
+            return 2
+        print(f"AVISO: sem base em {base_path}, nenhuma comparação foi feita "
+              "(use --gravar-base para criar uma)", file=sys.stderr)
+        return 0
+
+    with open(base_path, encoding="utf-8") as base_file:
+        baseline = json.load(base_file)
+
+    missing = missing_from_baseline(report, baseline)
+    if missing:
+        print(f"ERRO: {len(missing)} cena(s)/etapa(s) sem comparação com {base_path} "
+              "(grave uma nova base com --gravar-base):", file=sys.stderr)
+        for entry in missing:
+            print(f"  {entry}", file=sys.stderr)
+
+    regressions = compare_with_baseline(report, baseline, args.tolerancia)
+    if regressions:
+        print(f"REGRESSÃO DE DESEMPENHO ({len(regressions)} etapa(s)):", file=sys.stderr)
+        for regression in regressions:
+            print(f"  {regression}", file=sys.stderr)
+        return 1
+    if missing:
+        return 2
+
+    print(f"Sem regressões em relação a {base_path}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
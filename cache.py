@@ -0,0 +1,111 @@
+"""
+Cache LRU limitado para o jogo DVD Bounce Simulation.
+
+Usado pelos caches de sprites, textos e imagens: guarda valores já prontos
+(normalmente superfícies do pygame) e descarta os menos usados recentemente
+quando o número de itens ou a memória ocupada passa do limite.
+"""
+from collections import OrderedDict
+
+
+def surface_bytes(surface):
+    """Retorna a memória aproximada ocupada pelos pixels de uma superfície."""
+    width, height = surface.get_size()
+    return width * height * surface.get_bytesize()
+
+
+class LRUCache:
+    """Cache com política LRU e contadores de acertos e falhas."""
+    def __init__(self, max_items=None, max_bytes=None, sizeof=None):
+        """
+        Inicializa o cache vazio.
+
+        Args:
+            max_items (int, optional): Número máximo de itens guardados
+            max_bytes (int, optional): Memória máxima ocupada pelos itens
+            sizeof (callable, optional): Função que calcula os bytes de um item
+                (obrigatória se max_bytes for usado)
+        """
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof or (lambda value: 0)
+        self.items = OrderedDict()
+        self.bytes = 0
+
+        # Estatísticas
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        """Retorna o número de itens guardados."""
+        return len(self.items)
+
+    def __contains__(self, key):
+        """Verifica se a chave está no cache (sem contar como acesso)."""
+        return key in self.items
+
+    def get(self, key, default=None):
+        """Retorna o valor da chave (marcando-o como recente) ou default."""
+        value = self.items.get(key)
+        if value is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self.items.move_to_end(key)
+        return value
+
+    def put(self, key, value):
+        """Guarda um valor, descartando os itens mais antigos se necessário."""
+        old = self.items.pop(key, None)
+        if old is not None:
+            self.bytes -= self.sizeof(old)
+
+        self.items[key] = value
+        self.bytes += self.sizeof(value)
+        self._evict()
+        return value
+
+    def get_or_create(self, key, factory):
+        """
+        Retorna o valor da chave, criando-o com factory() se não existir.
+
+        Args:
+            key: Chave do item
+            factory (callable): Função sem argumentos que cria o valor
+        """
+        value = self.items.get(key)
+        if value is not None:
+            self.hits += 1
+            self.items.move_to_end(key)
+            return value
+
+        self.misses += 1
+        return self.put(key, factory())
+
+    def _evict(self):
+        """Remove os itens menos usados até respeitar os limites."""
+        while self.items and (
+            (self.max_items is not None and len(self.items) > self.max_items) or
+            (self.max_bytes is not None and self.bytes > self.max_bytes)
+        ):
+            _, value = self.items.popitem(last=False)
+            self.bytes -= self.sizeof(value)
+            self.evictions += 1
+
+    def clear(self):
+        """Remove todos os itens (as estatísticas são mantidas)."""
+        self.items.clear()
+        self.bytes = 0
+
+    def stats(self):
+        """Retorna as estatísticas do cache."""
+        total = self.hits + self.misses
+        return {
+            'items': len(self.items),
+            'bytes': self.bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / total if total else 0.0
+        }
@@ -1,10 +1,7 @@
 """
 Constantes e configurações globais para o jogo DVD Bounce Simulation.
 """
-import pygame
-
-# Inicializar o Pygame (para fontes)
-pygame.init()
+from fonts import LazyFont
 
 # Configurações da janela
 WIDTH = 1000    
@@ -20,12 +17,20 @@ SQUARE_SIZE = 50
 MIN_SPEED = 1.5
 MAX_SPEED = 4.5
 
+# Simulação em passo fixo (os temporizadores abaixo são contados em ticks)
+TICK_RATE = 60  # Ticks de simulação por segundo, independente do FPS de render
+MAX_TICKS_PER_FRAME = 5  # Máximo de ticks recuperados por iteração do loop
+MAX_SKIPPED_RENDERS = 3  # Renders seguidos que podem ser pulados sob carga
+
 # Temporizadores
 POWERUP_INTERVAL = 240  # 4 segundos a 60 FPS
 SPIKE_DURATION = 300  # 5 segundos a 60 FPS
 SPEED_BOOST_DURATION = 360  # 6 segundos a 60 FPS
 COLLISION_FLASH_DURATION = 15  # Duração do flash de colisão (aumentado para efeito mais visível)
 
+# Partículas
+PARTICLE_CAPACITY = 4096  # Máximo de partículas vivas ao mesmo tempo (pool pré-alocado)
+
 # Cores
 BLACK = (0, 0, 0)
 WHITE = (255, 255, 255)
@@ -43,7 +48,7 @@ VIBRANT_COLORS = [
     (255, 50, 255)    # Magenta vibrante
 ]
 
-# Fontes
-MENU_FONT = pygame.font.SysFont("Arial", 24)
-TITLE_FONT = pygame.font.SysFont("Arial", 32, bold=True)
-INFO_FONT = pygame.font.SysFont("Arial", 16)
\ No newline at end of file
+# Fontes (carregadas no primeiro uso, ver fonts.py)
+MENU_FONT = LazyFont("Arial", 24)
+TITLE_FONT = LazyFont("Arial", 32, bold=True)
+INFO_FONT = LazyFont("Arial", 16)
\ No newline at end of file
@@ -0,0 +1,82 @@
+"""
+Atualização parcial da tela (retângulos sujos) para o jogo DVD Bounce Simulation.
+
+A janela continua sendo redesenhada inteira na memória a cada frame, mas só
+as regiões que mudaram (onde as entidades estão agora e onde estavam no frame
+anterior) são enviadas ao display com pygame.display.update(rects).
+"""
+import pygame
+
+
+def merge_rects(rects):
+    """
+    Une os retângulos que se sobrepõem.
+    
+    Args:
+        rects (list): Retângulos (pygame.Rect)
+        
+    Returns:
+        list: Retângulos sem sobreposição entre si
+    """
+    merged = []
+    for rect in rects:
+        rect = pygame.Rect(rect)
+        # Absorver todos os retângulos já unidos que tocam este
+        hit = rect.collidelist(merged)
+        while hit >= 0:
+            rect.union_ip(merged.pop(hit))
+            hit = rect.collidelist(merged)
+        merged.append(rect)
+    return merged
+
+
+class DirtyRectTracker:
+    """Envia ao display apenas as regiões alteradas entre dois frames."""
+    def __init__(self, max_rects=64):
+        """
+        Inicializa o rastreador.
+        
+        Args:
+            max_rects (int, optional): Acima deste número de retângulos unidos,
+                um flip completo é mais barato que a atualização parcial
+        """
+        self.max_rects = max_rects
+        self.previous = []
+        self.full_redraw = True
+        
+        # Estatísticas do último frame
+        self.last_rect_count = 0
+        self.last_full = True
+    
+    def invalidate(self):
+        """Força um flip completo no próximo frame (janela redimensionada, menu etc.)."""
+        self.full_redraw = True
+    
+    def present(self, rects, screen_rect):
+        """
+        Atualiza a tela com os retângulos deste frame e do anterior.
+        
+        Args:
+            rects (list): Regiões desenhadas pelas entidades neste frame
+            screen_rect (pygame.Rect): Área da janela (os retângulos são recortados nela)
+        """
+        rects = [rect for rect in rects if rect is not None]
+        
+        if self.full_redraw:
+            pygame.display.flip()
+            self.full_redraw = False
+            self.last_rect_count = 0
+            self.last_full = True
+        else:
+            merged = [rect.clip(screen_rect) for rect in merge_rects(self.previous + rects)]
+            merged = [rect for rect in merged if rect.width > 0 and rect.height > 0]
+            
+            if len(merged) > self.max_rects:
+                pygame.display.flip()
+                self.last_full = True
+            else:
+                pygame.display.update(merged)
+                self.last_full = False
+            self.last_rect_count = len(merged)
+        
+        self.previous = rects
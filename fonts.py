@@ -0,0 +1,121 @@
+"""
+Fontes com carregamento tardio para o jogo DVD Bounce Simulation.
+
+pygame.font.SysFont enumera todas as fontes do sistema na primeira chamada, o
+que custa centenas de milissegundos. Aqui as fontes só são criadas quando algo
+é desenhado com elas (LazyFont), e o arquivo escolhido pelo SysFont para cada
+(nome, negrito, itálico) fica guardado em disco: nas execuções seguintes a
+fonte é aberta direto pelo caminho, sem enumerar o sistema.
+"""
+import json
+import os
+import time
+import pygame
+from startup import STARTUP
+
+# Cache em disco dos caminhos resolvidos
+FONT_CACHE_PATH = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "dvd_bounce", "fonts.json"
+)
+
+_resolved = None  # chave -> [caminho ou None, forçar negrito, forçar itálico]
+_fonts = {}  # (nome, tamanho, negrito, itálico) -> pygame.font.Font
+
+
+def _load_cache():
+    """Lê o cache de caminhos do disco (vazio se não existir ou estiver corrompido)."""
+    try:
+        with open(FONT_CACHE_PATH, encoding="utf-8") as cache_file:
+            data = json.load(cache_file)
+        return data if isinstance(data, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cache():
+    """Grava o cache de caminhos (falhas de escrita são ignoradas)."""
+    try:
+        os.makedirs(os.path.dirname(FONT_CACHE_PATH), exist_ok=True)
+        with open(FONT_CACHE_PATH, "w", encoding="utf-8") as cache_file:
+            json.dump(_resolved, cache_file, indent=1)
+    except OSError:
+        pass
+
+
+def resolve_font(name, bold=False, italic=False):
+    """
+    Retorna o arquivo que pygame.font.SysFont usaria para a fonte.
+
+    Returns:
+        tuple: (caminho ou None para a fonte padrão, forçar negrito, forçar itálico)
+    """
+    global _resolved
+    if _resolved is None:
+        _resolved = _load_cache()
+
+    key = f"{name}|{int(bold)}|{int(italic)}"
+    entry = _resolved.get(key)
+    if entry is not None and (entry[0] is None or os.path.exists(entry[0])):
+        return tuple(entry)
+
+    # Deixar o SysFont escolher o arquivo, mas sem criar a fonte
+    started = time.perf_counter()
+    entry = pygame.font.SysFont(name, 1, bold, italic,
+                                constructor=lambda path, size, b, i: (path, b, i))
+    STARTUP.add(f"SysFont {name}" + (" negrito" if bold else "") + (" itálico" if italic else ""),
+                time.perf_counter() - started)
+
+    _resolved[key] = list(entry)
+    _save_cache()
+    return entry
+
+
+def get_font(name, size, bold=False, italic=False):
+    """
+    Retorna a fonte (criada uma única vez), equivalente a pygame.font.SysFont.
+
+    Args:
+        name (str): Nome da fonte do sistema
+        size (int): Tamanho em pontos
+        bold (bool, optional): Negrito
+        italic (bool, optional): Itálico
+    """
+    key = (name, size, bold, italic)
+    font = _fonts.get(key)
+    if font is None:
+        if not pygame.font.get_init():
+            pygame.font.init()
+        path, set_bold, set_italic = resolve_font(name, bold, italic)
+        font = pygame.font.Font(path, size)
+        if set_bold:
+            font.set_bold(True)
+        if set_italic:
+            font.set_italic(True)
+        _fonts[key] = font
+    return font
+
+
+class LazyFont:
+    """Fonte que só é carregada no primeiro uso (repassa tudo para pygame.font.Font)."""
+    def __init__(self, name, size, bold=False, italic=False):
+        """
+        Guarda a descrição da fonte.
+
+        Args:
+            name (str): Nome da fonte do sistema
+            size (int): Tamanho em pontos
+            bold (bool, optional): Negrito
+            italic (bool, optional): Itálico
+        """
+        self._spec = (name, size, bold, italic)
+        self._font = None
+
+    def __getattr__(self, attr):
+        """Carrega a fonte na primeira vez e repassa o atributo (render, size...)."""
+        if attr.startswith('_'):
+            raise AttributeError(attr)
+        font = self._font
+        if font is None:
+            font = self._font = get_font(*self._spec)
+        return getattr(font, attr)
@@ -1,29 +1,68 @@
 """
 Implementação da classe Game para o jogo DVD Bounce Simulation.
 """
-import random
 import pygame
 import os
 import sys
+import time
 from constants import (
     WIDTH, HEIGHT, MARGIN, AREA_SIZE, AREA_X, AREA_Y, SQUARE_SIZE,
     MIN_SPEED, MAX_SPEED, POWERUP_INTERVAL, SPIKE_DURATION, SPEED_BOOST_DURATION,
-    BLACK, WHITE, DARK_GRAY, LIGHT_GRAY, VIBRANT_COLORS, INFO_FONT
+    BLACK, WHITE, DARK_GRAY, LIGHT_GRAY, VIBRANT_COLORS, INFO_FONT, PARTICLE_CAPACITY,
+    TICK_RATE, MAX_TICKS_PER_FRAME, MAX_SKIPPED_RENDERS
 )
 from square import Square
 from powerup import PowerUp
-from menu import show_menu
+from particles import ParticleSystem
+from menu import SettingsMenu, max_menu_margin, wait_events
 from maps import AVAILABLE_MAPS
+from spatial_hash import SpatialHash
+from text_cache import render_text
+from dirty_rects import DirtyRectTracker
+from rng import MatchRandom
+from profiler import FrameProfiler
+from fonts import LazyFont
+from startup import STARTUP
 
 nome1 = "Luisao"
 nome2 = "Matheus Nneuman"
 
 class Game:
     """Classe principal que gerencia o jogo."""
-    def __init__(self):
-        """Inicializa o jogo e suas configurações."""
-        # Inicializar o pygame
-        pygame.init()
+    def __init__(self, headless=False, physics='python', dirty_rects=False, render_fps=60,
+                 seed=None, replay=None, trajectory=None):
+        """
+        Inicializa o jogo e suas configurações.
+        
+        Args:
+            headless (bool, optional): Se True, não abre janela nem carrega imagens;
+                o jogo só pode ser simulado com simulate()
+            physics (str, optional): Backend de física: 'python' (um objeto por vez)
+                ou 'numpy' (arrays vetorizados; mais rápido só com milhares de quadrados)
+            dirty_rects (bool, optional): Se True, envia ao display só as regiões
+                alteradas em vez de um flip completo a cada frame
+            render_fps (int, optional): Taxa máxima de renderização; a simulação
+                roda sempre a TICK_RATE ticks por segundo
+            seed (int, optional): Semente da partida (aleatória se None)
+            replay (ReplayRecorder, optional): Gravador que recebe a semente, a
+                configuração inicial e as ações do jogador
+            trajectory (TrajectoryRecorder, optional): Gravador do estado de
+                quadrados e power-ups a cada frame
+        """
+        # Modo sem janela (simulação pura, sem render nem limite de FPS)
+        self.headless = headless
+        
+        # Inicializar só o display (as fontes iniciam no primeiro uso; áudio e
+        # joystick não são usados). Sem janela nenhum subsistema é necessário.
+        if not headless and not pygame.display.get_init():
+            with STARTUP.phase("pygame.display.init"):
+                pygame.display.init()
+        self.verbose = not headless
+        
+        # Fluxos aleatórios da partida (física e efeitos separados)
+        self.rng = MatchRandom(seed)
+        self.replay = replay
+        self.trajectory = trajectory
         
         # Configurações do jogo
         self.width = WIDTH
@@ -46,12 +85,34 @@ class Game:
         self.squares = []
         self.powerups = []
         
+        # Backend de física: vetorizado com NumPy ou um objeto por vez em Python puro
+        # (o módulo physics só é carregado quando usado)
+        self.physics_backend = physics
+        if physics == 'numpy':
+            from physics import SquareArrays
+            self.physics = SquareArrays(seed=self.rng.derive_seed('physics'))
+        elif physics == 'python':
+            self.physics = None
+        else:
+            raise ValueError(f"Backend de física desconhecido: {physics}")
+        
+        # Pool de partículas compartilhado por todos os quadrados (gerador próprio,
+        # separado da física: efeitos visuais não mudam o resultado)
+        self.particle_system = ParticleSystem(PARTICLE_CAPACITY, seed=self.rng.derive_seed('particles'))
+        
+        # Broad phase das colisões entre quadrados (grade do tamanho dos quadrados)
+        self.broad_phase = SpatialHash(self.square_size)
+        
         # Ajustar a área do jogo para acomodar o cabeçalho
         self.adjust_game_area()
         
-        # Configurar a janela
-        self.window = pygame.display.set_mode((self.width, self.height), pygame.RESIZABLE)
-        pygame.display.set_caption("Simulação de Colisão - Estilo DVD")
+        # Configurar a janela (não existe no modo headless)
+        if self.headless:
+            self.window = None
+        else:
+            with STARTUP.phase("janela"):
+                self.window = pygame.display.set_mode((self.width, self.height), pygame.RESIZABLE)
+                pygame.display.set_caption("Simulação de Colisão - Estilo DVD")
         
         # Temporizadores
         self.powerup_timer = 0
@@ -62,20 +123,60 @@ class Game:
         self.respawn_timer = 0
         self.respawn_interval = 180  # 3 segundos a 60 FPS
         
-        # Controle de FPS
+        # Controle de FPS e do passo fixo da simulação
         self.clock = pygame.time.Clock()
         self.running = False
+        self.render_fps = render_fps
+        self.tick_duration = 1.0 / TICK_RATE
+        self.previous_positions = []  # Posições antes do último tick (interpolação)
+        self.previous_squares = None  # Lista de quadrados a que essas posições pertencem
+        self.tick_count = 0
+        self.render_count = 0
+        self.skipped_renders = 0
+        self.report_startup = False  # Imprimir o tempo de inicialização após o primeiro frame
         
         # Estado de fim de jogo
         self.game_over = False
         self.winner = None
         
-        # Carregar fontes
-        self.title_font = pygame.font.SysFont("Arial", 20, bold=True)
-        self.info_font = pygame.font.SysFont("Arial", 16)
+        # Profiler por etapa do frame (None enquanto o overlay está desligado, F3 liga)
+        self.profiler = None
+        
+        # Menu de configurações, desenhado pelo próprio loop principal (None se fechado)
+        self.menu = None
+        self.menu_background = None  # Último frame do jogo, fundo do menu com a simulação parada
+        self.simulate_in_menu = False  # Continuar a simulação com o menu aberto (espectadores)
+        
+        # Estatísticas da partida atual (reiniciadas em create_squares)
+        self.collision_count = 0
+        self.powerups_collected = 0
+        
+        # Fontes (carregadas no primeiro texto desenhado)
+        self.title_font = LazyFont("Arial", 20, bold=True)
+        self.info_font = LazyFont("Arial", 16)
+        self.game_over_font = LazyFont("Arial", 48, bold=True)
+        self.winner_font = LazyFont("Arial", 36)
+        self.restart_font = LazyFont("Arial", 24)
+        
+        # Tela de fim de jogo pré-composta (recriada só se o vencedor ou a janela mudar)
+        self.game_over_surface = None
+        self.game_over_key = None
+        
+        # Camadas do cabeçalho em cache (recriadas só quando algo muda)
+        self.header_gradient = None
+        self.header_gradient_key = None
+        self.header_surface = None
+        self.header_state = None
+        self.player_panels = {}
+        self.player_icons = {}
+        self.header_changed = True
+        
+        # Atualização parcial da tela (opcional)
+        self.dirty_tracker = DirtyRectTracker() if dirty_rects else None
+        self.presented_state = None
         
         # Verificar se a pasta de imagens existe
-        if not os.path.exists('images'):
+        if not self.headless and not os.path.exists('images'):
             try:
                 os.makedirs('images')
                 print("Pasta 'images' criada com sucesso. Por favor, coloque suas imagens nela e reinicie o jogo.")
@@ -83,7 +184,9 @@ class Game:
                 print(f"Erro ao criar pasta 'images': {e}")
         
         # Configurações personalizadas para os quadrados
-        self.verify_images()
+        if not self.headless:
+            with STARTUP.phase("verificar imagens"):
+                self.verify_images()
         
         # Define as configurações dos quadrados
         self.square_configs = [
@@ -104,7 +207,8 @@ class Game:
         if 0 <= map_index < len(AVAILABLE_MAPS):
             self.map_index = map_index
             self.current_map = AVAILABLE_MAPS[map_index]
-            print(f"Mapa alterado para: {self.current_map.name}")
+            if self.verbose:
+                print(f"Mapa alterado para: {self.current_map.name}")
             return True
         return False
     
@@ -196,7 +300,33 @@ class Game:
         self.game_over = False
         self.winner = None
     
-    def create_square(self, color_index=None, name=None, image_path=None):
+    def apply_config(self, configs):
+        """
+        Aplica um dicionário de configurações (mesmo formato retornado pelo menu).
+        
+        Args:
+            configs (dict): Configurações com as chaves 'margin', 'square_size',
+                'min_speed', 'max_speed' e, opcionalmente, 'lives' e 'map_index'
+        """
+        self.margin = configs.get('margin', self.margin)
+        self.square_size = configs.get('square_size', self.square_size)
+        self.min_speed = configs.get('min_speed', self.min_speed)
+        self.max_speed = configs.get('max_speed', self.max_speed)
+        
+        # Atualizar o número de vidas se foi alterado
+        if 'lives' in configs and configs['lives'] != self.lives:
+            self.lives = configs['lives']
+            if self.verbose:
+                print(f"Número de vidas atualizado para: {self.lives}")
+        
+        # Atualizar o mapa se foi alterado
+        if 'map_index' in configs and configs['map_index'] != self.map_index:
+            self.change_map(configs['map_index'])
+        
+        # Atualizar dimensões da área
+        self.update_area_dimensions()
+    
+    def create_square(self, color_index=None, name=None, image_path=None, avoid_overlap=True):
         """
         Cria um novo quadrado com posição aleatória.
         
@@ -204,10 +334,12 @@ class Game:
             color_index (int, optional): Índice da cor
             name (str, optional): Nome personalizado do quadrado
             image_path (str, optional): Caminho para a imagem
+            avoid_overlap (bool, optional): Tentar posições até não sobrepor outro
+                quadrado (desligado ao criar milhares de quadrados, ex.: benchmark)
         """
         # Determinar a cor do novo quadrado
         if color_index is None:
-            color_index = random.randint(0, len(VIBRANT_COLORS) - 1)
+            color_index = self.rng.physics.randint(0, len(VIBRANT_COLORS) - 1)
             
         color = VIBRANT_COLORS[color_index % len(VIBRANT_COLORS)]
         
@@ -217,8 +349,12 @@ class Game:
         new_square = None
         
         while overlap and attempts < 10:
-            x = random.randint(self.area_x, self.area_x + self.area_size - self.square_size)
-            y = random.randint(self.area_y, self.area_y + self.area_size - self.square_size)
+            # Descartar a tentativa anterior que ficou sobreposta
+            if new_square is not None and self.physics is not None:
+                self.physics.release(new_square)
+            
+            x = self.rng.physics.randint(self.area_x, self.area_x + self.area_size - self.square_size)
+            y = self.rng.physics.randint(self.area_y, self.area_y + self.area_size - self.square_size)
             
             # Garantir que name seja uma string válida
             if name is not None:
@@ -226,7 +362,14 @@ class Game:
             else:
                 square_name = f"Jogador {color_index+1}"
                 
-            new_square = Square(x, y, self.square_size, color, name=square_name, color_index=color_index)
+            if self.physics is not None:
+                from physics import ArraySquare
+                new_square = ArraySquare(self.physics, x, y, self.square_size, color,
+                                         name=square_name, color_index=color_index,
+                                         rng=self.rng.physics)
+            else:
+                new_square = Square(x, y, self.square_size, color, name=square_name,
+                                    color_index=color_index, rng=self.rng.physics)
             
             # Definir o número de vidas personalizado
             new_square.lives = self.lives
@@ -235,15 +378,12 @@ class Game:
             # Configurar a área para o novo quadrado
             new_square.set_area(self.area_x, self.area_y, self.area_size)
             new_square.set_speed_limits(self.min_speed, self.max_speed)
-            
-            # Configurar a imagem se fornecida
-            if image_path and os.path.exists(image_path):
-                success = new_square.set_image(image_path)
-                if success:
-                    print(f"Imagem aplicada ao quadrado: {square_name}")
+            new_square.set_particle_system(self.particle_system)
             
             # Verificar sobreposição com quadrados existentes
             overlap = False
+            if not avoid_overlap:
+                break
             for sq in self.squares:
                 if sq.is_alive and new_square.check_collision(sq):
                     overlap = True
@@ -251,11 +391,35 @@ class Game:
             
             attempts += 1
         
+        # Configurar a imagem se fornecida, só na posição final (sem janela não há
+        # como converter a imagem)
+        if not self.headless and image_path and os.path.exists(image_path):
+            success = new_square.set_image(image_path)
+            if success:
+                print(f"Imagem aplicada ao quadrado: {square_name}")
+        
         return new_square
     
     def create_squares(self):
         """Cria os quadrados iniciais com configurações personalizadas."""
         self.squares = []
+        self.previous_positions = []
+        self.previous_squares = None
+        if self.physics is not None:
+            self.physics.clear()
+        self.particle_system.clear()
+        
+        # Os painéis em cache pertencem aos quadrados antigos
+        self.player_panels = {}
+        self.player_icons = {}
+        self.header_state = None
+        
+        # A célula da grade acompanha o tamanho atual dos quadrados
+        self.broad_phase.cell_size = max(1, int(self.square_size))
+        
+        # Nova partida: zerar as estatísticas
+        self.collision_count = 0
+        self.powerups_collected = 0
         
         # Usar as configurações personalizadas para cada quadrado
         for i, config in enumerate(self.square_configs):
@@ -284,7 +448,7 @@ class Game:
             # Escolher um tipo de power-up que não esteja já ativo
             available_types = [p_type for p_type in ['spikes', 'speed'] if p_type not in active_powerup_types]
             if available_types:
-                powerup_type = random.choice(available_types)
+                powerup_type = self.rng.physics.choice(available_types)
                 
                 # Tentar encontrar uma posição válida (fora de obstáculos)
                 max_attempts = 20
@@ -294,8 +458,8 @@ class Game:
                 powerup_size = 20  # Tamanho aproximado do power-up
                 
                 while not valid_position and attempt < max_attempts:
-                    x = random.randint(self.area_x + 10, self.area_x + self.area_size - powerup_size - 10)
-                    y = random.randint(self.area_y + 10, self.area_y + self.area_size - powerup_size - 10)
+                    x = self.rng.physics.randint(self.area_x + 10, self.area_x + self.area_size - powerup_size - 10)
+                    y = self.rng.physics.randint(self.area_y + 10, self.area_y + self.area_size - powerup_size - 10)
                     
                     # Verificar se a posição não está dentro de um obstáculo
                     if not self.current_map.is_position_blocked(x, y, powerup_size):
@@ -304,94 +468,172 @@ class Game:
                         attempt += 1
                         
                 if valid_position:
-                    new_powerup = PowerUp(x, y, powerup_type)
+                    new_powerup = PowerUp(x, y, powerup_type, rng=self.rng.physics)
                     self.powerups.append(new_powerup)
-                    print(f"Novo power-up gerado: {powerup_type} na posição ({x}, {y})")
+                    if self.verbose:
+                        print(f"Novo power-up gerado: {powerup_type} na posição ({x}, {y})")
                     return new_powerup
-                else:
+                elif self.verbose:
                     print(f"Não foi possível encontrar uma posição válida para o power-up {powerup_type} após {max_attempts} tentativas")
         
         return None
     
-    def handle_events(self):
-        """Processa os eventos do pygame."""
-        for event in pygame.event.get():
+    def get_config(self):
+        """Retorna as configurações atuais no formato usado pelo menu."""
+        return {
+            'margin': self.margin,
+            'square_size': self.square_size,
+            'min_speed': self.min_speed,
+            'max_speed': self.max_speed,
+            'lives': self.lives,
+            'map_index': self.map_index  # Incluir o mapa atual
+        }
+    
+    def resize(self, width, height):
+        """Redimensiona a janela (se existir) e recalcula a área de jogo."""
+        self.width, self.height = width, height
+        if not self.headless:
+            self.window = pygame.display.set_mode((self.width, self.height), pygame.RESIZABLE)
+        
+        # Recalcular as áreas de jogo
+        self.adjust_game_area()
+        self.update_area_dimensions()
+        
+        self.invalidate_display()
+    
+    def perform(self, action, *args):
+        """
+        Executa uma ação do jogador que altera a simulação, registrando-a no replay.
+        
+        Toda entrada que muda o resultado da partida passa por aqui, para que a
+        partida possa ser reproduzida a partir da semente e dessas ações.
+        
+        Args:
+            action (str): 'resize', 'config', 'reset', 'restart' ou 'quit'
+            *args: Argumentos da ação (tamanho da janela ou configurações)
+        """
+        if self.replay is not None:
+            self.replay.record(self.tick_count, action, *args)
+        
+        if action == 'quit':
+            self.running = False
+        elif action == 'resize':
+            self.resize(*args)
+        elif action == 'reset':
+            # Restaurar configurações padrão
+            self.reset_config()
+        elif action == 'config':
+            # Atualizar configurações
+            self.apply_config(args[0])
+            
+            # Recriar quadrados com as novas configurações
+            self.create_squares()
+            
+            # Resetar estado de fim de jogo
+            self.game_over = False
+            self.winner = None
+        elif action == 'restart':
+            # Reiniciar o jogo
+            self.game_over = False
+            self.winner = None
+            self.create_squares()
+        else:
+            raise ValueError(f"Ação desconhecida: {action}")
+    
+    def handle_events(self, events=None):
+        """
+        Processa os eventos do pygame.
+        
+        Args:
+            events (list, optional): Eventos já lidos da fila (todos os pendentes se None)
+        """
+        if events is None:
+            events = pygame.event.get()
+        for event in events:
             if event.type == pygame.QUIT:
-                self.running = False
+                self.perform('quit')
             elif event.type == pygame.VIDEORESIZE:
                 # Atualizar as dimensões da janela
                 old_width, old_height = self.width, self.height
-                self.width, self.height = event.size
-                self.window = pygame.display.set_mode((self.width, self.height), pygame.RESIZABLE)
-                
-                # Recalcular as áreas de jogo
-                self.adjust_game_area()
-                self.update_area_dimensions()
+                self.perform('resize', *event.size)
                 
                 print(f"Janela redimensionada: {old_width}x{old_height} -> {self.width}x{self.height}")
+                
+                if self.menu is not None:
+                    # Refazer o fundo e o layout do menu no novo tamanho
+                    self.menu_background = None
+                    self.menu.needs_redraw = True
+                    self.menu.max_margin = max_menu_margin((self.width, self.height))
+            elif self.menu is not None:
+                # Com o menu aberto, as teclas vão para ele
+                self.menu.handle_event(event)
+                if self.menu.done:
+                    self.close_menu()
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
-                    # Preparar configurações atuais para o menu
-                    current_config = {
-                        'margin': self.margin,
-                        'square_size': self.square_size,
-                        'min_speed': self.min_speed,
-                        'max_speed': self.max_speed,
-                        'lives': self.lives,
-                        'map_index': self.map_index  # Incluir o mapa atual
-                    }
-                    
                     # Abrir o menu de configurações
-                    continue_game, configs, reset_config = show_menu(self.window, current_config)
-                    
-                    if not continue_game:
-                        self.running = False
-                    elif reset_config:
-                        # Restaurar configurações padrão
-                        self.reset_config()
-                    elif configs:
-                        # Atualizar configurações
-                        self.margin = configs['margin']
-                        self.square_size = configs['square_size']
-                        self.min_speed = configs['min_speed']
-                        self.max_speed = configs['max_speed']
-                        
-                        # Atualizar o número de vidas se foi alterado
-                        if 'lives' in configs and configs['lives'] != self.lives:
-                            self.lives = configs['lives']
-                            print(f"Número de vidas atualizado para: {self.lives}")
-                        
-                        # Atualizar o mapa se foi alterado
-                        if 'map_index' in configs and configs['map_index'] != self.map_index:
-                            self.change_map(configs['map_index'])
-                        
-                        # Atualizar dimensões da área
-                        self.update_area_dimensions()
-                        
-                        # Recriar quadrados com as novas configurações
-                        self.create_squares()
-                        
-                        # Resetar estado de fim de jogo
-                        self.game_over = False
-                        self.winner = None
+                    self.open_menu()
                 
                 elif event.key == pygame.K_r and self.game_over:
-                    # Reiniciar o jogo
-                    self.game_over = False
-                    self.winner = None
-                    self.create_squares()
+                    self.perform('restart')
+                
+                elif event.key == pygame.K_F3:
+                    self.toggle_profiler()
+    
+    def open_menu(self):
+        """Abre o menu de configurações por cima do jogo, sem sair do loop principal."""
+        self.menu = SettingsMenu(self.get_config(), max_menu_margin((self.width, self.height)))
+        self.menu_background = None
+        self.invalidate_display()
+    
+    def close_menu(self):
+        """Fecha o menu e aplica o que foi escolhido nele."""
+        continue_game, configs, reset_config = self.menu.result
+        self.menu = None
+        self.menu_background = None
+        
+        # O menu cobria a janela inteira
+        self.invalidate_display()
+        
+        if not continue_game:
+            self.perform('quit')
+        elif reset_config:
+            self.perform('reset')
+        elif configs:
+            self.perform('config', configs)
+    
+    def toggle_profiler(self):
+        """Liga ou desliga o overlay do profiler (o histórico recomeça ao ligar)."""
+        self.profiler = FrameProfiler() if self.profiler is None else None
+        self.invalidate_display()
     
     def update(self):
+        """Avança um frame da simulação e grava a trajetória, se ativada."""
+        self.update_state()
+        if self.trajectory is not None:
+            self.trajectory.record(self)
+    
+    def update_state(self):
         """Atualiza o estado do jogo."""
+        profiler = self.profiler
+        if profiler is not None:
+            profiler.lap('other')
+        
         # Se o jogo acabou, só atualizar partículas para animação
         if self.game_over:
-            for square in self.squares:
-                if not square.is_alive:
-                    square.update()
+            self.particle_system.update()
+            if profiler is not None:
+                profiler.lap('particle_update')
             return
             
+        # Garantir que a geometria do mapa corresponde à área atual (sem custo se não mudou)
+        self.current_map.compile(self.area_x, self.area_y, self.area_size)
+        
         # Verificar se todos os quadrados vivos foram destruídos
-        alive_squares = sum(1 for square in self.squares if square.is_alive)
+        if self.physics is not None:
+            alive_squares = self.physics.alive_count()
+        else:
+            alive_squares = sum(1 for square in self.squares if square.is_alive)
         
         # Verificar condição de fim de jogo
         if alive_squares < 2:
@@ -409,24 +651,50 @@ class Game:
                     break
         
         # Atualizar todos os quadrados
-        for square in self.squares:
-            square.update()
+        if self.physics is not None:
+            # Backend vetorizado: integra todos os quadrados vivos de uma vez
+            self.physics.step()
+            if profiler is not None:
+                profiler.lap('integrate')
             
-            # Verificar colisão com elementos do mapa
-            if square.is_alive:
+            # Verificar colisão com o mapa só para quem toca algum obstáculo
+            for square in self.physics.squares_touching(self.current_map.obstacles):
                 self.current_map.check_collision(square)
+        else:
+            for square in self.squares:
+                square.update()
+            if profiler is not None:
+                profiler.lap('integrate')
+            
+            # Verificar colisão com elementos do mapa
+            for square in self.squares:
+                if square.is_alive:
+                    self.current_map.check_collision(square)
+        if profiler is not None:
+            profiler.lap('map_collisions')
         
-        # Verificar colisão entre todos os pares de quadrados vivos
-        for i in range(len(self.squares)):
-            if not self.squares[i].is_alive:
-                continue
-                
-            for j in range(i + 1, len(self.squares)):
-                if not self.squares[j].is_alive:
+        # Atualizar as partículas de explosões e colisões com parede
+        self.particle_system.update()
+        if profiler is not None:
+            profiler.lap('particle_update')
+        
+        # Verificar colisão entre quadrados
+        if self.physics is not None:
+            # Backend vetorizado: broad phase, teste e resposta sobre os arrays
+            collisions, winner = self.physics.resolve_collisions()
+            self.collision_count += collisions
+            if winner is not None:
+                self.game_over = True
+                self.winner = winner
+        else:
+            # Verificar colisão apenas entre os pares candidatos da grade espacial
+            for i, j in self.broad_phase.candidate_pairs(self.squares):
+                if not self.squares[i].is_alive or not self.squares[j].is_alive:
                     continue
                     
                 if self.squares[i].check_collision(self.squares[j]):
                     self.squares[i].handle_collision(self.squares[j])
+                    self.collision_count += 1
                     
                     # Verificar se o quadrado j foi eliminado pelo quadrado i
                     if not self.squares[j].is_alive and self.squares[j].killed_by == self.squares[i]:
@@ -437,32 +705,63 @@ class Game:
                     if not self.squares[i].is_alive and self.squares[i].killed_by == self.squares[j]:
                         self.game_over = True
                         self.winner = self.squares[j]
+        if profiler is not None:
+            profiler.lap('pair_collisions')
         
-        # Flag para rastrear se um power-up foi coletado neste frame
-        powerup_collected = False
-        collected_powerup_type = None
+        self.update_powerups()
+    
+    def powerup_hits(self):
+        """
+        Gera os pares (quadrado, power-up) de coletas, na ordem dos quadrados.
+        
+        Cada power-up fica com o primeiro quadrado vivo que o toca.
+        """
+        if self.physics is not None:
+            # Backend vetorizado: um teste sobre os arrays por power-up
+            hits = []
+            for powerup in self.powerups:
+                square = self.physics.first_overlapping(powerup.x, powerup.y, powerup.size)
+                if powerup.active and square is not None:
+                    hits.append((square._slot, square, powerup))
+            for _, square, powerup in sorted(hits, key=lambda hit: hit[0]):
+                yield square, powerup
+            return
         
-        # Verificar colisão entre quadrados vivos e power-ups
         for square in self.squares:
             if not square.is_alive:
                 continue
                 
             for powerup in list(self.powerups):  # Usar uma cópia da lista para evitar problemas ao modificá-la
                 if powerup.active and powerup.check_collision(square):
-                    if powerup.powerup_type == 'spikes':
-                        # Ativar espinhos no quadrado
-                        square.has_spikes = True
-                        square.spike_timer = self.spike_duration
-                        print(f"{square.name} coletou power-up de espinhos!")
-                    elif powerup.powerup_type == 'speed':
-                        # Ativar boost de velocidade
-                        square.activate_speed_boost(SPEED_BOOST_DURATION)
-                        print(f"{square.name} coletou power-up de velocidade!")
-                    
-                    # Desativar o power-up
-                    powerup.active = False
-                    powerup_collected = True
-                    collected_powerup_type = powerup.powerup_type
+                    yield square, powerup
+    
+    def update_powerups(self):
+        """Aplica as coletas de power-ups e gera novos quando necessário."""
+        profiler = self.profiler
+        
+        # Flag para rastrear se um power-up foi coletado neste frame
+        powerup_collected = False
+        collected_powerup_type = None
+        
+        # Verificar colisão entre quadrados vivos e power-ups
+        for square, powerup in self.powerup_hits():
+            if powerup.powerup_type == 'spikes':
+                # Ativar espinhos no quadrado
+                square.has_spikes = True
+                square.spike_timer = self.spike_duration
+                if self.verbose:
+                    print(f"{square.name} coletou power-up de espinhos!")
+            elif powerup.powerup_type == 'speed':
+                # Ativar boost de velocidade
+                square.activate_speed_boost(SPEED_BOOST_DURATION)
+                if self.verbose:
+                    print(f"{square.name} coletou power-up de velocidade!")
+            
+            # Desativar o power-up
+            powerup.active = False
+            powerup_collected = True
+            self.powerups_collected += 1
+            collected_powerup_type = powerup.powerup_type
         
         # Remover todos os power-ups inativos
         self.powerups = [p for p in self.powerups if p.active]
@@ -478,87 +777,148 @@ class Game:
             if self.powerup_timer >= self.powerup_interval:
                 self.powerup_timer = 0
                 self.generate_powerup()
+        if profiler is not None:
+            profiler.lap('powerup_logic')
     
-    def render_player_info(self):
-        """Renderiza as informações dos jogadores no topo da tela."""
-        # Superfície do cabeçalho
-        header = pygame.Surface((self.width, self.header_height))
+    def get_header_gradient(self):
+        """Retorna o gradiente de fundo do cabeçalho (recriado só quando a largura muda)."""
+        key = (self.width, self.header_height)
+        if self.header_gradient_key != key:
+            gradient = pygame.Surface((self.width, self.header_height))
+            for y in range(self.header_height):
+                # Efeito de gradiente suave: mais escuro na parte inferior
+                color_value = max(25, 40 - int(y / self.header_height * 25))
+                pygame.draw.line(gradient, (color_value, color_value, color_value + 10), 
+                                 (0, y), (self.width, y))
+            self.header_gradient = gradient
+            self.header_gradient_key = key
+        return self.header_gradient
+    
+    def get_player_icon(self, square, icon_size):
+        """Retorna a miniatura da imagem do jogador (redimensionada uma única vez)."""
+        icon = self.player_icons.get(square)
+        if icon is None or icon.get_size() != (icon_size, icon_size):
+            icon = pygame.transform.scale(square.image, (icon_size, icon_size))
+            self.player_icons[square] = icon
+        return icon
+    
+    def render_player_panel(self, square, x_pos, player_width):
+        """
+        Renderiza o painel de um jogador (recriado só quando vidas ou estado mudam).
         
-        # Gradiente de fundo para o cabeçalho
-        for y in range(self.header_height):
-            # Efeito de gradiente suave: mais escuro na parte inferior
-            color_value = max(25, 40 - int(y / self.header_height * 25))
-            pygame.draw.line(header, (color_value, color_value, color_value + 10), 
-                             (0, y), (self.width, y))
+        O painel cobre a faixa do cabeçalho abaixo da linha divisória, com o
+        gradiente de fundo já aplicado, para ser copiado direto no cabeçalho.
         
-        # Título do jogo e nome do mapa
-        title = self.title_font.render(f"BATALHA MORTAL ATÉ A MORTE - {self.current_map.name}", True, (220, 220, 220))
-        header.blit(title, (self.width // 2 - title.get_width() // 2, 10))
+        Returns:
+            pygame.Surface: Painel pronto para ser desenhado em (x_pos, panel_top)
+        """
+        panel_top = 42
+        state = (square.lives, square.max_lives, square.is_alive, x_pos, player_width, self.width)
+        cached = self.player_panels.get(square)
+        if cached is not None and cached[0] == state:
+            return cached[1]
         
-        # Linha divisória decorativa
-        pygame.draw.line(header, (100, 100, 100), (20, 35), (self.width - 20, 35), 1)
+        # Começar pela parte do gradiente que fica atrás do painel
+        area = pygame.Rect(x_pos, panel_top, player_width, self.header_height - panel_top)
+        panel = self.get_header_gradient().subsurface(area).copy()
         
-        # Informações para cada jogador
-        player_width = (self.width - 40) // len(self.squares)
+        # Painel de jogador com borda
+        panel_rect = pygame.Rect(0, 0, player_width - 10, 30)
+        pygame.draw.rect(panel, (45, 45, 45), panel_rect)
+        pygame.draw.rect(panel, square.original_color, panel_rect, 1)
         
-        for i, square in enumerate(self.squares):
-            # Calcular posição para este jogador
-            x_pos = 20 + i * player_width
-            
-            # Painel de jogador com borda
-            panel_rect = pygame.Rect(x_pos, 42, player_width - 10, 30)
-            pygame.draw.rect(header, (45, 45, 45), panel_rect)
-            pygame.draw.rect(header, square.original_color, panel_rect, 1)
+        # Ícone do jogador (miniatura quadrada)
+        icon_size = 20
+        icon_rect = pygame.Rect(5, 5, icon_size, icon_size)
+        
+        if square.use_image and square.image:
+            # Usar a imagem redimensionada
+            panel.blit(self.get_player_icon(square, icon_size), icon_rect)
+        else:
+            # Desenhar um quadrado com a cor do jogador
+            pygame.draw.rect(panel, square.original_color, icon_rect)
+        
+        # Nome do jogador
+        name_text = render_text(self.info_font, str(square.name), True, (220, 220, 220))
+        panel.blit(name_text, (icon_size + 10, 5))
+        
+        # Barra de vida
+        life_width = player_width - 20 - icon_size - 10  # Espaço restante
+        life_height = 6
+        life_y = 5 + name_text.get_height() + 2
+        
+        # Fundo da barra (cinza escuro)
+        life_bg_rect = pygame.Rect(icon_size + 10, life_y, life_width, life_height)
+        pygame.draw.rect(panel, (60, 60, 60), life_bg_rect)
+        
+        # Barra de vida atual colorida
+        if square.is_alive:
+            life_ratio = square.lives / square.max_lives
+            life_color = self.get_health_color(life_ratio)
             
-            # Ícone do jogador (miniatura quadrada)
-            icon_size = 20
-            icon_rect = pygame.Rect(x_pos + 5, 47, icon_size, icon_size)
+            life_fill_rect = pygame.Rect(icon_size + 10, life_y,
+                                         int(life_width * life_ratio), life_height)
+            pygame.draw.rect(panel, life_color, life_fill_rect)
             
-            if square.use_image and square.image:
-                # Usar a imagem redimensionada
-                mini_img = pygame.transform.scale(square.image, (icon_size, icon_size))
-                header.blit(mini_img, icon_rect)
-            else:
-                # Desenhar um quadrado com a cor do jogador
-                pygame.draw.rect(header, square.original_color, icon_rect)
+            # Texto de vida
+            life_text = render_text(self.info_font, f"{square.lives}/{square.max_lives}", 
+                                    True, (220, 220, 220))
+            life_text_x = icon_size + 10 + life_width/2 - life_text.get_width()/2
+            panel.blit(life_text, (life_text_x, 5 + name_text.get_height() + 8))
+        else:
+            # Texto "ELIMINADO" se o jogador estiver morto
+            elim_text = render_text(self.info_font, "ELIMINADO", True, (220, 50, 50))
+            elim_x = icon_size + 10 + life_width/2 - elim_text.get_width()/2
+            panel.blit(elim_text, (elim_x, 5 + name_text.get_height() + 3))
+        
+        self.player_panels[square] = (state, panel)
+        return panel
+    
+    def players_state(self):
+        """
+        Retorna o que os painéis dos jogadores mostram, para comparar entre frames.
+        
+        No backend NumPy as vidas e quem está vivo saem direto dos arrays.
+        """
+        if self.physics is None:
+            return tuple((square, square.lives, square.max_lives, square.is_alive)
+                         for square in self.squares)
+        
+        engine = self.physics
+        slots = engine.slots_of(self.squares)
+        return (tuple(self.squares), tuple(square.max_lives for square in self.squares),
+                engine.lives[slots].tobytes(), engine.is_alive[slots].tobytes())
+    
+    def render_player_info(self):
+        """Renderiza as informações dos jogadores no topo da tela."""
+        # Informações para cada jogador
+        player_width = (self.width - 40) // len(self.squares)
+        
+        # Reaproveitar o cabeçalho inteiro se nada mudou desde o último frame
+        header_state = (self.width, self.header_height, self.current_map.name,
+                        self.players_state())
+        if self.header_state != header_state:
+            # Superfície do cabeçalho, começando pelo gradiente de fundo
+            header = self.get_header_gradient().copy()
             
-            # Nome do jogador
-            name_text = self.info_font.render(str(square.name), True, (220, 220, 220))
-            header.blit(name_text, (x_pos + icon_size + 10, 47))
+            # Título do jogo e nome do mapa
+            title = render_text(self.title_font, f"BATALHA MORTAL ATÉ A MORTE - {self.current_map.name}", True, (220, 220, 220))
+            header.blit(title, (self.width // 2 - title.get_width() // 2, 10))
             
-            # Barra de vida
-            life_width = player_width - 20 - icon_size - 10  # Espaço restante
-            life_height = 6
+            # Linha divisória decorativa
+            pygame.draw.line(header, (100, 100, 100), (20, 35), (self.width - 20, 35), 1)
             
-            # Fundo da barra (cinza escuro)
-            life_bg_rect = pygame.Rect(x_pos + icon_size + 10, 
-                                     47 + name_text.get_height() + 2, 
-                                     life_width, life_height)
-            pygame.draw.rect(header, (60, 60, 60), life_bg_rect)
+            for i, square in enumerate(self.squares):
+                # Calcular posição para este jogador
+                x_pos = 20 + i * player_width
+                header.blit(self.render_player_panel(square, x_pos, player_width), (x_pos, 42))
             
-            # Barra de vida atual colorida
-            if square.is_alive:
-                life_ratio = square.lives / square.max_lives
-                life_color = self.get_health_color(life_ratio)
-                
-                life_fill_rect = pygame.Rect(x_pos + icon_size + 10, 
-                                          47 + name_text.get_height() + 2,
-                                          int(life_width * life_ratio), life_height)
-                pygame.draw.rect(header, life_color, life_fill_rect)
-                
-                # Texto de vida
-                life_text = self.info_font.render(f"{square.lives}/{square.max_lives}", 
-                                               True, (220, 220, 220))
-                life_text_x = x_pos + icon_size + 10 + life_width/2 - life_text.get_width()/2
-                header.blit(life_text, (life_text_x, 47 + name_text.get_height() + 8))
-            else:
-                # Texto "ELIMINADO" se o jogador estiver morto
-                elim_text = self.info_font.render("ELIMINADO", True, (220, 50, 50))
-                elim_x = x_pos + icon_size + 10 + life_width/2 - elim_text.get_width()/2
-                header.blit(elim_text, (elim_x, 47 + name_text.get_height() + 3))
+            self.header_surface = header
+            self.header_state = header_state
+            self.header_changed = True
         
         # Desenhar o cabeçalho na tela
-        self.window.blit(header, (0, 0))
+        self.window.blit(self.header_surface, (0, 0))
     
     def get_health_color(self, ratio):
         """Retorna uma cor baseada na proporção de vida (verde->amarelo->vermelho)."""
@@ -572,87 +932,441 @@ class Game:
             # Vermelho para vida baixa
             return (220, 50, 50)
     
-    def render(self):
-        """Renderiza o jogo na tela."""
-        # Preencher a tela com a cor de fundo do mapa atual
-        self.window.fill(self.current_map.bg_color)
+    def snapshot_positions(self):
+        """Guarda as posições dos quadrados antes de um tick (para interpolar no render)."""
+        self.previous_squares = self.squares
+        if self.physics is not None:
+            # Cópia direta das colunas x/y, sem uma leitura de propriedade por quadrado
+            self.previous_positions = self.physics.positions(self.physics.slots_of(self.squares))
+        else:
+            self.previous_positions = [(square.x, square.y) for square in self.squares]
+    
+    def draw_squares(self, alpha):
+        """
+        Desenha os quadrados interpolando entre o tick anterior e o atual.
         
-        # Desenhar a área restrita com um contorno branco
-        pygame.draw.rect(self.window, self.current_map.area_color, 
-                         (self.area_x, self.area_y, self.area_size, self.area_size))
-        pygame.draw.rect(self.window, WHITE, 
-                         (self.area_x, self.area_y, self.area_size, self.area_size), 2)
+        Args:
+            alpha (float): Fração do tempo já decorrido rumo ao próximo tick (0 a 1)
+        """
+        # Os efeitos animados seguem o relógio da simulação, como os power-ups
+        clock_ms = self.tick_count * self.tick_duration * 1000
         
-        # Desenhar elementos específicos do mapa
-        self.current_map.draw(self.window, self.area_x, self.area_y, self.area_size)
+        # Sem foto dos quadrados atuais (ex.: partida recriada desde o último tick)
+        # não há o que interpolar
+        interpolate = not (alpha >= 1.0 or self.previous_squares is not self.squares
+                           or len(self.previous_positions) != len(self.squares))
         
-        # Desenhar power-ups
-        for powerup in self.powerups:
-            powerup.draw(self.window)
+        if self.physics is not None:
+            self.draw_array_squares(alpha if interpolate else 1.0, clock_ms)
+            return
         
-        # Desenhar todos os quadrados (vivos e explodindo)
-        for square in self.squares:
-            square.draw(self.window)
+        if not interpolate:
+            for square in self.squares:
+                square.draw(self.window, clock_ms)
+            return
+        
+        for square, (prev_x, prev_y) in zip(self.squares, self.previous_positions):
+            if not square.is_alive:
+                continue
+            
+            # Desenhar temporariamente na posição interpolada
+            x, y = square.x, square.y
+            square.x = prev_x + (x - prev_x) * alpha
+            square.y = prev_y + (y - prev_y) * alpha
+            square.draw(self.window, clock_ms)
+            square.x, square.y = x, y
+    
+    def draw_array_squares(self, alpha, clock_ms):
+        """
+        Desenha os quadrados do backend NumPy lendo os arrays de uma vez.
         
-        # Renderizar informações dos jogadores no topo
-        self.render_player_info()
+        A interpolação é uma conta vetorizada e os quadrados sem efeito ativo (a
+        grande maioria) viram um único retângulo ou sprite; só os demais passam
+        por Square.draw. A ordem de desenho é a da lista, como no backend Python.
         
-        # Exibir informações sobre o menu
-        menu_info = INFO_FONT.render("Pressione ESC para o MENU", True, LIGHT_GRAY)
+        Args:
+            alpha (float): Fração rumo ao próximo tick (1.0 = sem interpolação)
+            clock_ms (float): Relógio da simulação em milissegundos
+        """
+        engine = self.physics
+        slots = engine.slots_of(self.squares)
+        x, y = engine.x[slots], engine.y[slots]
+        if alpha < 1.0:
+            prev_x, prev_y = self.previous_positions[:, 0], self.previous_positions[:, 1]
+            x = prev_x + (x - prev_x) * alpha
+            y = prev_y + (y - prev_y) * alpha
+        
+        plain = engine.plain_mask(slots).tolist()
+        sizes = engine.size[slots].tolist()
+        x, y = x.tolist(), y.tolist()
+        
+        window = self.window
+        squares = self.squares
+        draw_rect = pygame.draw.rect
+        for k in engine.alive_indices(slots):
+            square = squares[k]
+            size = sizes[k]
+            if plain[k]:
+                # O mesmo desenho de Square.draw sem efeitos, sem ler as propriedades
+                if square.use_image and square.image:
+                    window.blit(square.get_sprite(size, size), (int(x[k]), int(y[k])))
+                else:
+                    draw_rect(window, square.color, (x[k], y[k], size, size))
+                continue
+            
+            # Desenhar temporariamente na posição interpolada
+            old_x, old_y = square.x, square.y
+            square.x, square.y = x[k], y[k]
+            square.draw(window, clock_ms)
+            square.x, square.y = old_x, old_y
+    
+    def render(self, alpha=1.0):
+        """
+        Renderiza o jogo na tela.
+        
+        Args:
+            alpha (float, optional): Fração entre o último tick e o próximo usada
+                para interpolar a posição dos quadrados (1.0 = sem interpolação)
+        """
+        profiler = self.profiler
+        if profiler is None:
+            for _, render_pass in self.render_passes(alpha):
+                render_pass()
+            return
+        
+        profiler.lap('other')
+        for name, render_pass in self.render_passes(alpha):
+            render_pass()
+            profiler.lap(name)
+        profiler.end_frame()
+    
+    def render_passes(self, alpha=1.0):
+        """
+        Retorna as etapas do render, na ordem em que são desenhadas.
+        
+        Usado por render() e pelo benchmark, que mede cada etapa separadamente.
+        
+        Args:
+            alpha (float, optional): Fração usada para interpolar os quadrados
+            
+        Returns:
+            list: Pares (nome, função sem argumentos)
+        """
+        return [
+            ('map', self.draw_map),
+            ('powerups', self.draw_powerups),
+            ('particles', self.draw_particles),
+            ('squares', lambda: self.draw_squares(alpha)),
+            ('header', self.render_player_info),
+            ('hud', self.draw_hud),
+            ('game_over', self.draw_game_over),
+            ('menu', self.draw_menu),
+            ('profiler', self.draw_profiler),
+            ('present', self.present)
+        ]
+    
+    def draw_map(self):
+        """Desenha o fundo, a área restrita e os obstáculos (camada estática do mapa)."""
+        static_layer = self.current_map.get_static_layer(
+            self.width, self.height, self.area_x, self.area_y, self.area_size)
+        self.window.blit(static_layer, (0, 0))
+    
+    def draw_powerups(self):
+        """Desenha os power-ups ativos."""
+        # A fase da animação segue o relógio da simulação, não o relógio de parede
+        clock_ms = self.tick_count * self.tick_duration * 1000
+        for powerup in self.powerups:
+            powerup.draw(self.window, clock_ms)
+    
+    def draw_particles(self):
+        """Desenha as partículas de explosões e colisões com parede."""
+        self.particle_system.draw(self.window)
+    
+    def draw_hud(self):
+        """Exibe as informações sobre o menu no rodapé."""
+        menu_info = render_text(INFO_FONT, "Pressione ESC para o MENU", True, LIGHT_GRAY)
         self.window.blit(menu_info, (10, self.height - 25))
+    
+    def draw_game_over(self):
+        """Exibe a mensagem de fim de jogo se o jogo acabou."""
+        if not (self.game_over and self.winner):
+            return
+        
+        # Sobreposição e textos compostos uma vez: um único blit por frame
+        self.window.blit(self.get_game_over_surface(), (0, 0),
+                         special_flags=pygame.BLEND_PREMULTIPLIED)
+    
+    def get_game_over_surface(self):
+        """
+        Retorna a sobreposição de fim de jogo com os textos já desenhados.
         
-        # Exibir mensagem de fim de jogo se o jogo acabou
-        if self.game_over and self.winner:
-            # Criar uma sobreposição semitransparente
-            overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 180))  # Preto com 70% de opacidade
-            self.window.blit(overlay, (0, 0))
-            
-            # Criar texto de fim de jogo
-            game_over_font = pygame.font.SysFont("Arial", 48, bold=True)
-            game_over_text = game_over_font.render("FIM DE JOGO", True, WHITE)
-            
-            # Usar o nome personalizado do vencedor
-            winner_font = pygame.font.SysFont("Arial", 36)
-            winner_text = winner_font.render(f"{str(self.winner.name)} Venceu!", True, self.winner.original_color)
-            
-            # Criar instrução de reinício
-            restart_font = pygame.font.SysFont("Arial", 24)
-            restart_text = restart_font.render("Pressione ESC para menu ou R para reiniciar", True, LIGHT_GRAY)
-            
-            # Posicionar e exibir textos
-            self.window.blit(game_over_text, 
-                              (self.width//2 - game_over_text.get_width()//2, 
-                               self.height//2 - 80))
-            self.window.blit(winner_text, 
-                              (self.width//2 - winner_text.get_width()//2, 
-                               self.height//2 - 20))
-            self.window.blit(restart_text, 
-                              (self.width//2 - restart_text.get_width()//2, 
-                               self.height//2 + 40))
-        
-        # Atualizar a tela
+        A superfície está em alfa pré-multiplicado e deve ser desenhada com
+        BLEND_PREMULTIPLIED: o resultado é o mesmo (a menos de arredondamento)
+        que escurecer a tela e desenhar cada texto por cima.
+        """
+        key = (self.winner.name, self.winner.original_color, self.width, self.height)
+        if self.game_over_surface is not None and self.game_over_key == key:
+            return self.game_over_surface
+        
+        # Criar uma sobreposição semitransparente (preto já é pré-multiplicado)
+        overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 180))  # Preto com 70% de opacidade
+        
+        # Criar texto de fim de jogo
+        game_over_text = self.game_over_font.render("FIM DE JOGO", True, WHITE)
+        
+        # Usar o nome personalizado do vencedor
+        winner_text = self.winner_font.render(f"{str(self.winner.name)} Venceu!", True, self.winner.original_color)
+        
+        # Criar instrução de reinício
+        restart_text = self.restart_font.render("Pressione ESC para menu ou R para reiniciar", True, LIGHT_GRAY)
+        
+        # Posicionar os textos sobre a sobreposição. Um blit comum não combina o
+        # alfa do destino; em alfa pré-multiplicado, sim (convert_alpha antes:
+        # premul_alpha erra o alfa da superfície que sai direto da fonte)
+        for text, y in ((game_over_text, self.height//2 - 80),
+                        (winner_text, self.height//2 - 20),
+                        (restart_text, self.height//2 + 40)):
+            overlay.blit(text.convert_alpha().premul_alpha(), (self.width//2 - text.get_width()//2, y),
+                         special_flags=pygame.BLEND_PREMULTIPLIED)
+        
+        self.game_over_surface = overlay
+        self.game_over_key = key
+        return overlay
+    
+    def draw_menu(self):
+        """Desenha o menu por cima do jogo, quando a simulação continua com ele aberto."""
+        if self.menu is None:
+            return
+        if self.menu.needs_redraw:
+            # As opções mudaram: o menu cobre a janela inteira
+            self.invalidate_display()
+        self.menu.draw(self.window)
+    
+    def draw_paused_menu(self):
+        """
+        Desenha o menu sobre o último frame do jogo, com a simulação parada.
+        
+        O frame do jogo é desenhado uma vez e guardado; a tela só é atualizada
+        quando o menu muda.
+        """
+        if self.menu_background is None:
+            # Último frame do jogo, sem o menu e sem o profiler, que ficaria
+            # congelado no fundo (refeito se a janela mudar de tamanho)
+            for name, render_pass in self.render_passes():
+                if name not in ('menu', 'profiler', 'present'):
+                    render_pass()
+            self.menu_background = self.window.copy()
+            self.menu.needs_redraw = True
+        
+        if not self.menu.needs_redraw:
+            return
+        self.menu.draw(self.window, self.menu_background)
         pygame.display.flip()
     
+    def draw_profiler(self):
+        """Desenha o overlay do profiler no canto inferior direito, se ligado."""
+        if self.profiler is None:
+            return
+        overlay = self.profiler.get_overlay(INFO_FONT)
+        self.window.blit(overlay, self.get_profiler_rect(overlay))
+    
+    def get_profiler_rect(self, overlay):
+        """Retorna a posição do overlay do profiler na janela."""
+        rect = overlay.get_rect()
+        rect.bottomright = (self.width - 10, self.height - 10)
+        return rect
+    
+    def present(self):
+        """Atualiza a tela com o frame desenhado."""
+        if self.dirty_tracker is not None:
+            self.present_dirty_rects()
+        else:
+            pygame.display.flip()
+    
+    def invalidate_display(self):
+        """Força o próximo frame a atualizar a tela inteira (modo de retângulos sujos)."""
+        if self.dirty_tracker is not None:
+            self.dirty_tracker.invalidate()
+    
+    def present_dirty_rects(self):
+        """Envia ao display apenas as regiões desenhadas neste frame e no anterior."""
+        # Mudanças que afetam a tela inteira: mapa, área, janela ou tela de fim de jogo
+        state = (self.current_map.static_layer_key, id(self.current_map), self.game_over)
+        if state != self.presented_state:
+            self.presented_state = state
+            self.invalidate_display()
+        
+        rects = []
+        for square in self.squares:
+            rects.extend(square.get_dirty_rects())
+        for powerup in self.powerups:
+            rects.append(powerup.get_dirty_rect())
+        rects.append(self.particle_system.get_bounds())
+        
+        if self.header_changed:
+            rects.append(pygame.Rect(0, 0, self.width, self.header_height))
+            self.header_changed = False
+        
+        if self.profiler is not None and self.profiler.overlay is not None:
+            rects.append(self.get_profiler_rect(self.profiler.overlay))
+        
+        self.dirty_tracker.present(rects, self.window.get_rect())
+    
     def run(self):
         """Inicia o loop principal do jogo."""
+        # Registrar a semente e a configuração inicial no replay
+        if self.replay is not None:
+            self.replay.start(self.rng.seed, self.get_config(), self.physics_backend)
+        
         # Criar quadrados iniciais
-        self.create_squares()
+        with STARTUP.phase("criar quadrados"):
+            self.create_squares()
         
-        # Iniciar o loop do jogo
+        # Iniciar o loop do jogo: a simulação avança em ticks fixos de tick_duration
+        # segundos, e o render acontece uma vez por iteração (até render_fps)
         self.running = True
+        accumulator = 0.0
+        previous_time = time.perf_counter()
+        skipped = 0
+        
         while self.running:
-            # Processar eventos
-            self.handle_events()
+            if self.profiler is not None:
+                self.profiler.begin_frame()
             
-            # Atualizar o estado do jogo
-            self.update()
+            # Processar eventos (com o menu aberto e a simulação parada, nada muda
+            # na tela até chegar um evento: esperar por ele em vez de consultar a
+            # fila a cada frame)
+            if self.menu is not None and not self.simulate_in_menu:
+                self.handle_events(wait_events())
+            else:
+                self.handle_events()
+            if self.profiler is not None:
+                self.profiler.lap('events')
+            
+            now = time.perf_counter()
+            if self.menu is not None and not self.simulate_in_menu:
+                # Menu aberto com a simulação parada: o tempo parado não conta e só
+                # o menu é redesenhado (quando muda), sobre o último frame do jogo
+                previous_time = now
+                accumulator = 0.0
+                self.draw_paused_menu()
+                if self.profiler is not None:
+                    self.profiler.lap('menu')
+                    self.profiler.end_frame()
+                # A espera já aconteceu em wait_events; aqui só limita rajadas de eventos
+                self.clock.tick(self.render_fps)
+                continue
+            
+            # Limitar o tempo de um frame muito lento para não tentar recuperar demais
+            accumulator += min(now - previous_time, 0.25)
+            previous_time = now
+            
+            # Atualizar o estado do jogo em ticks fixos
+            ticks = 0
+            while accumulator >= self.tick_duration and ticks < MAX_TICKS_PER_FRAME:
+                self.snapshot_positions()
+                self.update()
+                accumulator -= self.tick_duration
+                ticks += 1
+                self.tick_count += 1
+            
+            # Sob carga: pular o render para a simulação alcançar o tempo real
+            if accumulator >= self.tick_duration:
+                if skipped < MAX_SKIPPED_RENDERS:
+                    skipped += 1
+                    self.skipped_renders += 1
+                    if self.profiler is not None:
+                        # Fechar o frame sem render: senão os tempos de update dele
+                        # seriam somados ao próximo frame desenhado
+                        self.profiler.lap('other')
+                        self.profiler.end_frame()
+                    continue
+                # Atraso grande demais: descartar o tempo que não dá para recuperar
+                accumulator %= self.tick_duration
+            skipped = 0
             
-            # Renderizar
-            self.render()
+            # Renderizar interpolando entre o último tick e o próximo
+            if self.render_count == 0:
+                # Primeiro frame: inclui fontes, camadas estáticas e caches frios
+                with STARTUP.phase("primeiro frame"):
+                    self.render(accumulator / self.tick_duration)
+                if self.report_startup:
+                    print(STARTUP.report())
+            else:
+                self.render(accumulator / self.tick_duration)
+            self.render_count += 1
             
-            # Limitar a taxa de quadros
-            self.clock.tick(60)
+            # Limitar a taxa de renderização
+            self.clock.tick(self.render_fps)
+        
+        if self.replay is not None:
+            self.replay.finish(self.tick_count)
+        if self.trajectory is not None:
+            self.trajectory.close()
         
         # Encerrar o pygame
-        pygame.quit()
\ No newline at end of file
+        pygame.quit()
+    
+    def simulate(self, max_frames=None):
+        """
+        Joga uma partida completa sem janela, sem render e sem limite de FPS.
+        
+        Cada chamada a update() avança exatamente um frame de simulação, então
+        os temporizadores (contados em frames) mantêm o mesmo significado do jogo normal.
+        
+        Args:
+            max_frames (int, optional): Limite de frames antes de desistir da partida
+            
+        Returns:
+            tuple: (vencedor, frames) onde vencedor é o Square vencedor (ou None
+                   se a partida não terminou) e frames é o número de frames simulados
+        """
+        # Começar uma partida nova
+        self.create_squares()
+        self.powerups = []
+        self.powerup_timer = 0
+        self.game_over = False
+        self.winner = None
+        
+        frames = 0
+        while not self.game_over:
+            if max_frames is not None and frames >= max_frames:
+                break
+            self.update()
+            frames += 1
+        
+        return self.winner, frames
+
+
+def simulate_match(config=None, max_frames=None, physics='python', seed=None, trajectory_dir=None,
+                   trajectory_stride=None):
+    """
+    Joga uma partida sem janela, o mais rápido que a CPU permitir.
+    
+    Args:
+        config (dict, optional): Configurações da partida (formato do menu)
+        max_frames (int, optional): Limite de frames da partida
+        physics (str, optional): Backend de física ('python' ou 'numpy')
+        seed (int, optional): Semente da partida (aleatória se None)
+        trajectory_dir (str, optional): Diretório onde gravar a trajetória da partida
+        trajectory_stride (int, optional): Gravar a trajetória a cada N frames
+            (padrão: DEFAULT_STRIDES do backend de física)
+        
+    Returns:
+        tuple: (nome_do_vencedor, frames); o nome é None se não houve vencedor
+    """
+    trajectory = None
+    if trajectory_dir:
+        from trajectory import DEFAULT_STRIDES, TrajectoryRecorder
+        trajectory = TrajectoryRecorder(trajectory_dir,
+                                        stride=trajectory_stride or DEFAULT_STRIDES[physics])
+    
+    game = Game(headless=True, physics=physics, seed=seed, trajectory=trajectory)
+    if config:
+        game.apply_config(config)
+    
+    winner, frames = game.simulate(max_frames)
+    if trajectory is not None:
+        trajectory.close()
+    return (winner.name if winner else None), frames
\ No newline at end of file
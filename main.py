@@ -5,17 +5,191 @@ Este jogo simula o efeito da tela do DVD, onde objetos se movem e rebatam nas
 bordas da janela. O jogo inclui dois quadrados coloridos que se movem e colidem
 entre si, com power-ups de espinhos que aparecem periodicamente.
 
+Dependências (requirements.txt): pygame e NumPy. O NumPy é obrigatório: as
+partículas, o profiler e a gravação de trajetórias usam arrays, mesmo com o
+backend de física em Python puro.
+    pip install -r requirements.txt
+
 Para executar o jogo:
-    python main.py
+    python main.py [--dirty-rects] [--fps N] [--tempo-inicio]
+
+Para simular partidas sem janela (o mais rápido possível):
+    python main.py --headless [--partidas N] [--mapa I] [--max-frames F] [--fisica numpy]
+                   [--trajetoria DIRETORIO [--trajetoria-passo N]]
+
+Para jogar um torneio (mapas × vidas × velocidades × sementes) em vários processos:
+    python main.py --torneio [--processos N] [--sementes N] [--vidas 1 3 5]
+                   [--velocidades 1.5:4.5 2:6] [--mapas 0 2] [--saida resultados.jsonl]
+
+Para gravar uma partida e reproduzi-la depois (sem janela):
+    python main.py [--semente S] --gravar-replay partida.json
+    python main.py --replay partida.json
 """
-from game import Game
+import argparse
+import json
+import os
+import time
+
+# Importado primeiro: o relógio da inicialização começa aqui
+from startup import STARTUP
+
+from game import Game, simulate_match
+from replay import ReplayRecorder, load_replay, play_replay
+from trajectory import DEFAULT_STRIDES, TrajectoryRecorder
+from tournament import (DEFAULT_LIVES, DEFAULT_MAX_FRAMES, DEFAULT_SPEED_RANGES, build_grid,
+                        run_tournament, summarize)
+
+STARTUP.add("imports", time.perf_counter() - STARTUP.start)
+
+
+def parse_args(argv=None):
+    """Lê os argumentos da linha de comando."""
+    parser = argparse.ArgumentParser(description="DVD Bounce Simulation")
+    parser.add_argument("--headless", action="store_true",
+                        help="simula partidas sem janela e sem limite de FPS")
+    parser.add_argument("--partidas", type=int, default=1,
+                        help="número de partidas no modo headless")
+    parser.add_argument("--mapa", type=int, default=0,
+                        help="índice do mapa usado no modo headless")
+    parser.add_argument("--max-frames", type=int, default=None,
+                        help="limite de frames por partida no modo headless "
+                             f"(no torneio, {DEFAULT_MAX_FRAMES} se omitido)")
+    parser.add_argument("--fisica", choices=["python", "numpy"], default="python",
+                        help="backend de física (numpy vetoriza física e colisões; "
+                             "só compensa com milhares de quadrados)")
+    parser.add_argument("--dirty-rects", action="store_true",
+                        help="atualiza só as regiões alteradas da tela (displays lentos)")
+    parser.add_argument("--fps", type=int, default=60,
+                        help="taxa máxima de renderização (a simulação roda sempre a 60 ticks/s)")
+    parser.add_argument("--semente", type=int, default=None,
+                        help="semente da partida (no modo headless, a partida i usa semente + i)")
+    parser.add_argument("--gravar-replay", metavar="ARQUIVO", default=None,
+                        help="grava a semente e as ações da partida neste arquivo")
+    parser.add_argument("--replay", metavar="ARQUIVO", default=None,
+                        help="reproduz um replay gravado, sem janela")
+    parser.add_argument("--simular-no-menu", action="store_true",
+                        help="a partida continua rodando com o menu de configurações aberto")
+    parser.add_argument("--tempo-inicio", action="store_true",
+                        help="mostra o tempo de inicialização por fase após o primeiro frame")
+    parser.add_argument("--trajetoria", metavar="DIRETORIO", default=None,
+                        help="grava o estado de cada frame em arquivos np.memmap "
+                             "(no modo headless, um subdiretório por partida)")
+    parser.add_argument("--trajetoria-passo", type=int, default=None, metavar="N",
+                        help="grava a trajetória só a cada N frames (padrão: "
+                             + ", ".join(f"{stride} com {physics}"
+                                         for physics, stride in DEFAULT_STRIDES.items())
+                             + "; mantém o custo da gravação em poucos por cento)")
+    
+    tournament = parser.add_argument_group("torneio")
+    tournament.add_argument("--torneio", action="store_true",
+                            help="joga a grade mapas × vidas × velocidades × sementes "
+                                 "em vários processos")
+    tournament.add_argument("--processos", type=int, default=None,
+                            help="número de processos (padrão: um por núcleo)")
+    tournament.add_argument("--sementes", type=int, default=10,
+                            help="partidas por combinação (sementes a partir de --semente)")
+    tournament.add_argument("--vidas", type=int, nargs="+", default=list(DEFAULT_LIVES),
+                            help="números de vidas da grade")
+    tournament.add_argument("--velocidades", type=parse_speed_range, nargs="+",
+                            default=list(DEFAULT_SPEED_RANGES),
+                            help="faixas de velocidade MIN:MAX da grade")
+    tournament.add_argument("--mapas", type=int, nargs="+", default=None,
+                            help="índices dos mapas da grade (padrão: todos)")
+    tournament.add_argument("--saida", metavar="ARQUIVO", default=None,
+                            help="grava cada resultado como uma linha JSON")
+    return parser.parse_args(argv)
+
+
+def parse_speed_range(text):
+    """Converte 'MIN:MAX' em um par de velocidades."""
+    try:
+        min_speed, max_speed = (float(value) for value in text.split(":"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"faixa de velocidade inválida: {text!r} (use MIN:MAX)")
+    return min_speed, max_speed
+
+
+def run_headless(matches, map_index=0, max_frames=None, physics='python', seed=None,
+                 trajectory_dir=None, trajectory_stride=None):
+    """Simula várias partidas sem janela e imprime o resultado de cada uma."""
+    start = time.perf_counter()
+    for i in range(matches):
+        match_seed = seed + i if seed is not None else None
+        match_dir = os.path.join(trajectory_dir, f"partida_{i + 1}") if trajectory_dir else None
+        winner, frames = simulate_match({'map_index': map_index}, max_frames, physics,
+                                        match_seed, match_dir, trajectory_stride)
+        print(f"Partida {i + 1}: vencedor={winner} frames={frames}")
+    elapsed = time.perf_counter() - start
+    print(f"{matches} partida(s) em {elapsed:.2f}s")
+
+
+def run_tournament_cli(args):
+    """Joga o torneio descrito pelos argumentos e imprime os resultados conforme chegam."""
+    first_seed = args.semente if args.semente is not None else 0
+    matches = build_grid(args.mapas, args.vidas, args.velocidades,
+                         range(first_seed, first_seed + args.sementes))
+    print(f"Torneio: {len(matches)} partida(s) em {args.processos or os.cpu_count()} processo(s)")
+    
+    output = open(args.saida, "w", encoding="utf-8") if args.saida else None
+    results = []
+    start = time.perf_counter()
+    try:
+        for result in run_tournament(matches, args.processos, args.fisica, args.max_frames):
+            results.append(result)
+            if output:
+                output.write(json.dumps(result) + "\n")
+            print(f"[{len(results)}/{len(matches)}] {result['map']} vidas={result['lives']} "
+                  f"velocidade={result['min_speed']}-{result['max_speed']} "
+                  f"semente={result['seed']}: vencedor={result['winner']} "
+                  f"frames={result['frames']} colisões={result['collisions']} "
+                  f"power-ups={result['powerups_collected']}")
+    finally:
+        if output:
+            output.close()
+    elapsed = time.perf_counter() - start
+    
+    print(f"{len(results)} partida(s) em {elapsed:.2f}s")
+    # Resumo na ordem da grade (os resultados chegam na ordem em que terminam)
+    results.sort(key=lambda result: (result['map_index'], result['lives'], result['min_speed'],
+                                     result['max_speed'], result['seed']))
+    for (map_name, lives, min_speed, max_speed), entry in summarize(results).items():
+        wins = ", ".join(f"{name}={count}" for name, count in sorted(entry['wins'].items(),
+                                                                   key=lambda item: str(item[0])))
+        print(f"{map_name} vidas={lives} velocidade={min_speed}-{max_speed}: {wins} "
+              f"frames={entry['frames']:.0f} colisões={entry['collisions']:.1f} "
+              f"power-ups={entry['powerups_collected']:.1f}")
 
 
-def main():
+def main(argv=None):
     """Função principal que inicia o jogo."""
-    game = Game()
+    args = parse_args(argv)
+    if args.replay:
+        start = time.perf_counter()
+        game, ticks = play_replay(load_replay(args.replay))
+        winner = game.winner.name if game.winner else None
+        print(f"Replay: vencedor={winner} ticks={ticks} ({time.perf_counter() - start:.2f}s)")
+        return
+    
+    if args.torneio:
+        run_tournament_cli(args)
+        return
+    
+    if args.headless:
+        run_headless(args.partidas, args.mapa, args.max_frames, args.fisica, args.semente,
+                     args.trajetoria, args.trajetoria_passo)
+        return
+    
+    recorder = ReplayRecorder(args.gravar_replay) if args.gravar_replay else None
+    trajectory = None
+    if args.trajetoria:
+        stride = args.trajetoria_passo or DEFAULT_STRIDES[args.fisica]
+        trajectory = TrajectoryRecorder(args.trajetoria, stride=stride)
+    game = Game(physics=args.fisica, dirty_rects=args.dirty_rects, render_fps=args.fps,
+                seed=args.semente, replay=recorder, trajectory=trajectory)
+    game.report_startup = args.tempo_inicio
+    game.simulate_in_menu = args.simular_no_menu
     game.run()
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
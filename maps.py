@@ -1,16 +1,80 @@
 """
 Definição dos mapas para o jogo DVD Bounce Simulation.
 """
-from constants import BLACK, DARK_GRAY, WIDTH, HEIGHT
+import pygame
+from constants import BLACK, WHITE, DARK_GRAY, WIDTH, HEIGHT
 
 # Classe base para mapas
 class GameMap:
     """Classe base para mapas do jogo."""
-    def __init__(self, name, bg_color=BLACK, area_color=DARK_GRAY):
+    def __init__(self, name, bg_color=BLACK, area_color=DARK_GRAY,
+                 obstacle_color=None, obstacle_border_color=None):
         self.name = name
         self.bg_color = bg_color
         self.area_color = area_color
+        self.obstacle_color = obstacle_color
+        self.obstacle_border_color = obstacle_border_color
         self.obstacles = []
+        
+        # Geometria compilada para a área atual e camada estática pré-renderizada
+        self.layout = None
+        self.static_layer = None
+        self.static_layer_key = None
+    
+    def build_obstacles(self, area_x, area_y, area_size):
+        """
+        Calcula os obstáculos do mapa para uma área de jogo.
+        
+        Returns:
+            list: Retângulos (pygame.Rect) dos obstáculos
+        """
+        return []
+    
+    def compile(self, area_x, area_y, area_size):
+        """
+        Calcula a geometria dos obstáculos apenas quando a área de jogo muda.
+        
+        Args:
+            area_x (int): Posição X da área de jogo
+            area_y (int): Posição Y da área de jogo
+            area_size (int): Tamanho da área de jogo
+        """
+        layout = (area_x, area_y, area_size)
+        if layout != self.layout:
+            self.obstacles = self.build_obstacles(area_x, area_y, area_size)
+            self.layout = layout
+    
+    def get_static_layer(self, width, height, area_x, area_y, area_size):
+        """
+        Retorna o fundo, a área restrita e os obstáculos já desenhados em uma superfície.
+        
+        A superfície só é recriada quando a janela é redimensionada ou a área
+        de jogo (margem) muda.
+        
+        Args:
+            width (int): Largura da janela
+            height (int): Altura da janela
+            area_x (int): Posição X da área de jogo
+            area_y (int): Posição Y da área de jogo
+            area_size (int): Tamanho da área de jogo
+        """
+        key = (width, height, area_x, area_y, area_size)
+        if key != self.static_layer_key:
+            layer = pygame.Surface((width, height))
+            
+            # Preencher com a cor de fundo do mapa
+            layer.fill(self.bg_color)
+            
+            # Desenhar a área restrita com um contorno branco
+            pygame.draw.rect(layer, self.area_color, (area_x, area_y, area_size, area_size))
+            pygame.draw.rect(layer, WHITE, (area_x, area_y, area_size, area_size), 2)
+            
+            # Desenhar elementos específicos do mapa
+            self.draw(layer, area_x, area_y, area_size)
+            
+            self.static_layer = layer
+            self.static_layer_key = key
+        return self.static_layer
     
     def is_position_blocked(self, x, y, size):
         """
@@ -24,7 +88,6 @@ class GameMap:
         Returns:
             bool: True se a posição estiver bloqueada, False caso contrário
         """
-        import pygame
         test_rect = pygame.Rect(x, y, size, size)
         
         for obstacle in self.obstacles:
@@ -34,8 +97,12 @@ class GameMap:
         return False
         
     def draw(self, surface, area_x, area_y, area_size):
-        """Desenha elementos específicos do mapa."""
-        pass
+        """Desenha os obstáculos do mapa."""
+        self.compile(area_x, area_y, area_size)
+        
+        for obstacle in self.obstacles:
+            pygame.draw.rect(surface, self.obstacle_color, obstacle)
+            pygame.draw.rect(surface, self.obstacle_border_color, obstacle, 2)
         
     def check_collision(self, square):
         """Verifica colisão com elementos do mapa."""
@@ -46,34 +113,24 @@ class BasicMap(GameMap):
     """Mapa básico sem obstáculos."""
     def __init__(self):
         super().__init__(name="Mapa Básico", bg_color=BLACK, area_color=DARK_GRAY)
-        
-    def draw(self, surface, area_x, area_y, area_size):
-        """Não faz nada além do que já é renderizado no jogo base."""
-        pass
 
 # Mapa com obstáculo central
 class CenterObstacleMap(GameMap):
     """Mapa com um obstáculo no centro."""
     def __init__(self):
-        super().__init__(name="Obstáculo Central", bg_color=(20, 20, 40), area_color=(30, 30, 50))
+        super().__init__(name="Obstáculo Central", bg_color=(20, 20, 40), area_color=(30, 30, 50),
+                         obstacle_color=(80, 80, 100), obstacle_border_color=(150, 150, 180))
         
-    def draw(self, surface, area_x, area_y, area_size):
-        """Desenha um obstáculo no centro do mapa."""
-        import pygame
+    def build_obstacles(self, area_x, area_y, area_size):
+        """Calcula um obstáculo no centro do mapa."""
         obstacle_size = area_size // 4
         obstacle_x = area_x + (area_size - obstacle_size) // 2
         obstacle_y = area_y + (area_size - obstacle_size) // 2
         
-        # Armazenar o obstáculo para verificação de colisão
-        self.obstacles = [pygame.Rect(obstacle_x, obstacle_y, obstacle_size, obstacle_size)]
-        
-        # Desenhar o obstáculo
-        pygame.draw.rect(surface, (80, 80, 100), self.obstacles[0])
-        pygame.draw.rect(surface, (150, 150, 180), self.obstacles[0], 2)
+        return [pygame.Rect(obstacle_x, obstacle_y, obstacle_size, obstacle_size)]
         
     def check_collision(self, square):
         """Verifica colisão com o obstáculo central."""
-        import pygame
         square_rect = pygame.Rect(square.x, square.y, square.size, square.size)
         
         for obstacle in self.obstacles:
@@ -103,12 +160,11 @@ class CenterObstacleMap(GameMap):
 class FourCornersMap(GameMap):
     """Mapa com obstáculos nos quatro cantos."""
     def __init__(self):
-        super().__init__(name="Quatro Cantos", bg_color=(20, 40, 20), area_color=(30, 50, 30))
+        super().__init__(name="Quatro Cantos", bg_color=(20, 40, 20), area_color=(30, 50, 30),
+                         obstacle_color=(80, 120, 80), obstacle_border_color=(150, 200, 150))
         
-    def draw(self, surface, area_x, area_y, area_size):
-        """Desenha quatro obstáculos nos cantos do mapa."""
-        import pygame
-        self.obstacles = []
+    def build_obstacles(self, area_x, area_y, area_size):
+        """Calcula quatro obstáculos nos cantos do mapa."""
         
         # Tamanho de cada obstáculo
         obstacle_size = area_size // 6
@@ -121,17 +177,10 @@ class FourCornersMap(GameMap):
             (area_x + area_size - obstacle_size, area_y + area_size - obstacle_size)  # Inferior direito
         ]
         
-        for corner in corners:
-            obstacle = pygame.Rect(corner[0], corner[1], obstacle_size, obstacle_size)
-            self.obstacles.append(obstacle)
-            
-            # Desenhar o obstáculo
-            pygame.draw.rect(surface, (80, 120, 80), obstacle)
-            pygame.draw.rect(surface, (150, 200, 150), obstacle, 2)
+        return [pygame.Rect(corner[0], corner[1], obstacle_size, obstacle_size) for corner in corners]
     
     def check_collision(self, square):
         """Verifica colisão com os obstáculos nos cantos."""
-        import pygame
         square_rect = pygame.Rect(square.x, square.y, square.size, square.size)
         
         for obstacle in self.obstacles:
@@ -161,12 +210,11 @@ class FourCornersMap(GameMap):
 class CrossMap(GameMap):
     """Mapa com túnel em formato de cruz."""
     def __init__(self):
-        super().__init__(name="Cruz", bg_color=(40, 20, 20), area_color=(50, 30, 30))
+        super().__init__(name="Cruz", bg_color=(40, 20, 20), area_color=(50, 30, 30),
+                         obstacle_color=(120, 80, 80), obstacle_border_color=(200, 150, 150))
         
-    def draw(self, surface, area_x, area_y, area_size):
-        """Desenha quatro blocos formando um túnel em cruz."""
-        import pygame
-        self.obstacles = []
+    def build_obstacles(self, area_x, area_y, area_size):
+        """Calcula quatro blocos formando um túnel em cruz."""
         
         # Largura do túnel
         tunnel_width = area_size // 3
@@ -190,17 +238,10 @@ class CrossMap(GameMap):
              area_x + area_size - (tunnel_x + tunnel_width), area_y + area_size - (tunnel_y + tunnel_width))
         ]
         
-        for block in blocks:
-            obstacle = pygame.Rect(block[0], block[1], block[2], block[3])
-            self.obstacles.append(obstacle)
-            
-            # Desenhar o obstáculo
-            pygame.draw.rect(surface, (120, 80, 80), obstacle)
-            pygame.draw.rect(surface, (200, 150, 150), obstacle, 2)
+        return [pygame.Rect(block[0], block[1], block[2], block[3]) for block in blocks]
     
     def check_collision(self, square):
         """Verifica colisão com os blocos da cruz."""
-        import pygame
         square_rect = pygame.Rect(square.x, square.y, square.size, square.size)
         
         for obstacle in self.obstacles:
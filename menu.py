@@ -1,123 +1,202 @@
 """
 Implementação do menu do jogo DVD Bounce Simulation.
+
+Cada menu é um objeto com estado (MapSelectionMenu, SettingsMenu) que recebe
+um evento por vez em handle_event() e se desenha por cima do jogo em draw().
+O loop principal do jogo usa os objetos diretamente, sem parar a cada menu, e
+com a simulação parada espera os eventos em wait_events(), sem ocupar a CPU.
+Nesse caso o fundo escurecido e os títulos formam uma camada estática, criada
+uma vez a partir do último frame do jogo (e refeita se a janela mudar de tamanho).
 """
 import pygame
 from constants import (
-    WIDTH, HEIGHT, MARGIN, MIN_SPEED, MAX_SPEED, SQUARE_SIZE,
-    MENU_FONT, TITLE_FONT, BLACK, WHITE, YELLOW
+    MARGIN, MIN_SPEED, MAX_SPEED, SQUARE_SIZE,
+    MENU_FONT, TITLE_FONT, WHITE, YELLOW
 )
 from maps import AVAILABLE_MAPS
+from text_cache import render_text
+
+# Tempo máximo (ms) bloqueado esperando um evento antes de checar a janela de novo
+MENU_WAIT_MS = 250
+
+# Eventos que não mudam o menu (não causam redesenho)
+IGNORED_EVENTS = (pygame.NOEVENT, pygame.MOUSEMOTION, pygame.KEYUP, pygame.ACTIVEEVENT)
 
-def show_map_selection(window, current_map_index=0):
+
+def wait_events(timeout=MENU_WAIT_MS):
     """
-    Exibe um menu para selecionar mapas
+    Bloqueia até chegar um evento (ou até o timeout) e retorna os pendentes.
     
-    Args:
-        window: Superfície principal do pygame
-        current_map_index: Índice do mapa atual
-        
     Returns:
-        int: Índice do mapa selecionado ou -1 para cancelar
+        list: Eventos recebidos (vazia se o timeout acabou sem eventos)
     """
-    # Opções do menu
-    selected_option = 0
-    menu_active = True
+    event = pygame.event.wait(timeout)
+    if event.type == pygame.NOEVENT:
+        return []
+    return [event] + pygame.event.get()
+
+
+def is_redraw_event(event):
+    """Verifica se o evento pode mudar o que o menu mostra."""
+    return event.type not in IGNORED_EVENTS
+
+
+# Fundos escurecidos por tamanho de janela (compartilhados entre os menus)
+_shades = {}
+
+
+def get_shade(size):
+    """Retorna o fundo escuro semitransparente do tamanho informado (criado uma vez)."""
+    shade = _shades.get(size)
+    if shade is None:
+        shade = pygame.Surface(size, pygame.SRCALPHA)
+        shade.fill((0, 0, 0, 200))  # RGBA: preto com 80% de opacidade
+        _shades[size] = shade
+    return shade
+
+
+def draw_menu_header(window, title, instructions=None):
+    """Escurece a janela e desenha o título (e as instruções) no topo."""
+    width = window.get_width()
+    window.blit(get_shade(window.get_size()), (0, 0))
     
-    # Título e instruções
-    title = "SELEÇÃO DE MAPA"
-    instructions = "Use as setas para navegar, ENTER para selecionar, ESC para voltar"
+    # Título do menu
+    title_rendered = render_text(TITLE_FONT, title, True, WHITE)
+    window.blit(title_rendered, title_rendered.get_rect(center=(width // 2, 100)))
+    
+    # Instruções
+    if instructions:
+        inst_rendered = render_text(MENU_FONT, instructions, True, (180, 180, 180))
+        window.blit(inst_rendered, inst_rendered.get_rect(center=(width // 2, 150)))
+
+
+def build_static_layer(background, title, instructions=None):
+    """
+    Cria a camada fixa de um menu: fundo escurecido, título e instruções.
     
-    while menu_active:
-        # Preencher a tela com um fundo escuro semitransparente
-        menu_surface = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-        menu_surface.fill((0, 0, 0, 200))  # RGBA: preto com 80% de opacidade
+    Args:
+        background (pygame.Surface): Último frame do jogo, do tamanho da janela
+        title (str): Título do menu
+        instructions (str, optional): Linha de instruções abaixo do título
+    """
+    layer = background.copy()
+    draw_menu_header(layer, title, instructions)
+    return layer
+
+
+class Menu:
+    """Estado comum aos menus: resultado, redesenho e camada estática."""
+    def __init__(self, title, instructions=None):
+        """
+        Args:
+            title (str): Título do menu
+            instructions (str, optional): Linha de instruções abaixo do título
+        """
+        self.title = title
+        self.instructions = instructions
+        self.done = False
+        self.result = None
+        self.needs_redraw = True
+        self.static_layer = None
+        self.static_background = None  # Fundo usado para criar a camada estática
+    
+    def finish(self, result):
+        """Fecha o menu com o resultado informado."""
+        self.done = True
+        self.result = result
+    
+    def draw_header(self, window, background=None):
+        """
+        Desenha o fundo escurecido e os títulos.
+        
+        Com um fundo fixo (simulação parada), a camada estática é criada uma vez
+        e só copiada para a janela; sem ele, o cabeçalho é desenhado por cima do
+        conteúdo atual da janela.
+        """
+        if background is None:
+            draw_menu_header(window, self.title, self.instructions)
+            return
+        if self.static_background is not background:
+            self.static_layer = build_static_layer(background, self.title, self.instructions)
+            self.static_background = background
+        window.blit(self.static_layer, (0, 0))
+
+
+class MapSelectionMenu(Menu):
+    """Menu de seleção de mapa."""
+    def __init__(self, current_map_index=0):
+        """
+        Inicializa o menu com a primeira opção selecionada.
         
-        # Título do menu
-        title_rendered = TITLE_FONT.render(title, True, WHITE)
-        title_rect = title_rendered.get_rect(center=(WIDTH // 2, 100))
-        menu_surface.blit(title_rendered, title_rect)
+        Args:
+            current_map_index: Índice do mapa atual
+        """
+        super().__init__("SELEÇÃO DE MAPA",
+                         "Use as setas para navegar, ENTER para selecionar, ESC para voltar")
+        self.current_map_index = current_map_index
+        self.selected_option = 0
+        # self.result: índice do mapa selecionado ou -1 para cancelar
+    
+    def handle_event(self, event):
+        """Processa um evento do pygame."""
+        if is_redraw_event(event):
+            self.needs_redraw = True
         
-        # Instruções
-        inst_rendered = MENU_FONT.render(instructions, True, (180, 180, 180))
-        inst_rect = inst_rendered.get_rect(center=(WIDTH // 2, 150))
-        menu_surface.blit(inst_rendered, inst_rect)
+        if event.type == pygame.QUIT:
+            self.finish(-1)
+        
+        elif event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_ESCAPE:
+                self.finish(self.current_map_index)  # Manter o mapa atual
+            
+            elif event.key == pygame.K_UP:
+                self.selected_option = (self.selected_option - 1) % (len(AVAILABLE_MAPS) + 1)
+            
+            elif event.key == pygame.K_DOWN:
+                self.selected_option = (self.selected_option + 1) % (len(AVAILABLE_MAPS) + 1)
+            
+            elif event.key == pygame.K_RETURN or event.key == pygame.K_SPACE:
+                if self.selected_option == len(AVAILABLE_MAPS):  # Opção "Voltar"
+                    self.finish(self.current_map_index)
+                else:
+                    self.finish(self.selected_option)  # Índice do mapa selecionado
+    
+    def draw(self, window, background=None):
+        """
+        Desenha o menu por cima do conteúdo atual da janela.
+        
+        Args:
+            window: Superfície principal do pygame
+            background (pygame.Surface, optional): Fundo fixo (último frame do jogo)
+        """
+        self.needs_redraw = False
+        width = window.get_width()
+        self.draw_header(window, background)
         
         # Renderizar a lista de mapas
         for i, game_map in enumerate(AVAILABLE_MAPS):
-            color = YELLOW if i == selected_option else WHITE
+            color = YELLOW if i == self.selected_option else WHITE
             text = game_map.name
             
             # Adicionar indicador de seleção para o mapa atual
-            if i == current_map_index:
+            if i == self.current_map_index:
                 text += " (Atual)"
                 
-            rendered_text = MENU_FONT.render(text, True, color)
-            text_rect = rendered_text.get_rect(center=(WIDTH // 2, 200 + i * 50))
-            menu_surface.blit(rendered_text, text_rect)
+            rendered_text = render_text(MENU_FONT, text, True, color)
+            text_rect = rendered_text.get_rect(center=(width // 2, 200 + i * 50))
+            window.blit(rendered_text, text_rect)
         
         # Opção "Voltar"
-        back_color = YELLOW if selected_option == len(AVAILABLE_MAPS) else WHITE
-        back_text = MENU_FONT.render("Voltar", True, back_color)
-        back_rect = back_text.get_rect(center=(WIDTH // 2, 200 + len(AVAILABLE_MAPS) * 50))
-        menu_surface.blit(back_text, back_rect)
-        
-        # Sobrepor a superfície do menu à tela principal
-        window.blit(menu_surface, (0, 0))
-        pygame.display.flip()
-        
-        # Processar eventos
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                return -1
-            
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    return current_map_index  # Manter o mapa atual
-                
-                elif event.key == pygame.K_UP:
-                    selected_option = (selected_option - 1) % (len(AVAILABLE_MAPS) + 1)
-                
-                elif event.key == pygame.K_DOWN:
-                    selected_option = (selected_option + 1) % (len(AVAILABLE_MAPS) + 1)
-                
-                elif event.key == pygame.K_RETURN or event.key == pygame.K_SPACE:
-                    if selected_option == len(AVAILABLE_MAPS):  # Opção "Voltar"
-                        return current_map_index
-                    else:
-                        return selected_option  # Retornar o índice do mapa selecionado
+        back_color = YELLOW if self.selected_option == len(AVAILABLE_MAPS) else WHITE
+        back_text = render_text(MENU_FONT, "Voltar", True, back_color)
+        back_rect = back_text.get_rect(center=(width // 2, 200 + len(AVAILABLE_MAPS) * 50))
+        window.blit(back_text, back_rect)
 
-def show_menu(window, current_config=None):
-    """
-    Exibe um menu para ajustar as configurações do jogo
-    
-    Args:
-        window: Superfície principal do pygame
-        current_config: Dicionário com as configurações atuais
-        
-    Returns:
-        tuple: (continuar_jogo, configurações_atualizadas, resetar)
-               continuar_jogo é um booleano que indica se o jogo deve continuar
-               configurações_atualizadas é um dicionário com as novas configurações
-               resetar é um booleano que indica se as configurações devem ser resetadas
-    """
-    # Configurações iniciais para o menu (usar valores atuais ou padrão)
-    if current_config:
-        margin = current_config.get('margin', MARGIN)
-        square_size = current_config.get('square_size', SQUARE_SIZE)
-        min_speed = current_config.get('min_speed', MIN_SPEED)
-        max_speed = current_config.get('max_speed', MAX_SPEED)
-        lives = current_config.get('lives', 5)  # Novo: vidas dos quadrados
-        map_index = current_config.get('map_index', 0)  # Novo: índice do mapa
-    else:
-        margin = MARGIN
-        square_size = SQUARE_SIZE
-        min_speed = MIN_SPEED
-        max_speed = MAX_SPEED
-        lives = 5  # Valor padrão para vidas
-        map_index = 0  # Mapa padrão
-    
+
+class SettingsMenu(Menu):
+    """Menu de configurações do jogo (abre a seleção de mapa como submenu)."""
     # Opções do menu
-    options = [
+    OPTIONS = [
         "Tamanho dos Quadrados: {}",
         "Margem da Área: {}",
         "Velocidade Mínima: {:.1f}",
@@ -129,122 +208,167 @@ def show_menu(window, current_config=None):
         "Sair"
     ]
     
-    selected_option = 0
-    menu_active = True
-    reset_config = False
+    def __init__(self, current_config=None, max_margin=None):
+        """
+        Inicializa o menu com as configurações atuais.
+        
+        Args:
+            current_config: Dicionário com as configurações atuais
+            max_margin (int, optional): Maior margem permitida (metade do menor
+                lado da janela menos 50); sem limite se None
+        """
+        super().__init__("MENU DE CONFIGURAÇÕES")
+        
+        # Configurações iniciais para o menu (usar valores atuais ou padrão)
+        if current_config:
+            self.margin = current_config.get('margin', MARGIN)
+            self.square_size = current_config.get('square_size', SQUARE_SIZE)
+            self.min_speed = current_config.get('min_speed', MIN_SPEED)
+            self.max_speed = current_config.get('max_speed', MAX_SPEED)
+            self.lives = current_config.get('lives', 5)  # Novo: vidas dos quadrados
+            self.map_index = current_config.get('map_index', 0)  # Novo: índice do mapa
+        else:
+            self.reset_values()
+        
+        self.max_margin = max_margin
+        self.selected_option = 0
+        self.reset_config = False
+        self.submenu = None  # Seleção de mapa aberta
+        # self.result: (continuar_jogo, configurações_atualizadas, resetar)
+    
+    def reset_values(self):
+        """Volta todas as opções para os valores padrão."""
+        self.margin = MARGIN
+        self.square_size = SQUARE_SIZE
+        self.min_speed = MIN_SPEED
+        self.max_speed = MAX_SPEED
+        self.lives = 5  # Valor padrão para vidas
+        self.map_index = 0  # Mapa padrão
+    
+    def get_config(self):
+        """Retorna as configurações escolhidas no menu."""
+        return {
+            'margin': self.margin,
+            'square_size': self.square_size,
+            'min_speed': self.min_speed,
+            'max_speed': self.max_speed,
+            'lives': self.lives,
+            'map_index': self.map_index  # Incluir índice do mapa nas configurações
+        }
+    
+    def finish(self, continue_game):
+        """Fecha o menu (continue_game=False significa sair do jogo)."""
+        if continue_game:
+            super().finish((True, self.get_config(), self.reset_config))
+        else:
+            super().finish((False, {}, False))
+    
+    def handle_event(self, event):
+        """Processa um evento do pygame (repassado ao submenu, se aberto)."""
+        if self.submenu is not None:
+            self.submenu.handle_event(event)
+            self.needs_redraw = self.needs_redraw or self.submenu.needs_redraw
+            if self.submenu.done:
+                if self.submenu.result >= 0:  # Se não cancelou
+                    self.map_index = self.submenu.result
+                self.submenu = None
+                self.needs_redraw = True
+            return
+        
+        if is_redraw_event(event):
+            self.needs_redraw = True
+        
+        if event.type == pygame.QUIT:
+            self.finish(False)
+        
+        elif event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_ESCAPE:
+                self.finish(True)  # Fechar o menu
+            
+            elif event.key == pygame.K_UP:
+                self.selected_option = (self.selected_option - 1) % len(self.OPTIONS)
+            
+            elif event.key == pygame.K_DOWN:
+                self.selected_option = (self.selected_option + 1) % len(self.OPTIONS)
+            
+            elif event.key == pygame.K_RETURN or event.key == pygame.K_SPACE:
+                if self.selected_option == 5:  # Selecionar Mapa
+                    self.submenu = MapSelectionMenu(self.map_index)
+                elif self.selected_option == 6:  # Restaurar padrões
+                    self.reset_values()
+                    self.reset_config = True
+                elif self.selected_option == 7:  # Voltar ao jogo
+                    self.finish(True)
+                elif self.selected_option == 8:  # Sair
+                    self.finish(False)
+            
+            # Ajustar valores com as setas esquerda/direita
+            elif event.key == pygame.K_LEFT:
+                if self.selected_option == 0:  # Tamanho dos quadrados
+                    self.square_size = max(10, self.square_size - 5)
+                elif self.selected_option == 1:  # Margem da área
+                    self.margin = max(10, self.margin - 10)
+                elif self.selected_option == 2:  # Velocidade mínima
+                    self.min_speed = max(0.5, self.min_speed - 0.5)
+                elif self.selected_option == 3:  # Velocidade máxima
+                    self.max_speed = max(self.min_speed + 0.5, self.max_speed - 0.5)
+                elif self.selected_option == 4:  # Vidas dos quadrados
+                    self.lives = max(1, self.lives - 1)  # Mínimo de 1 vida
+                elif self.selected_option == 5:  # Navegar entre mapas
+                    self.map_index = (self.map_index - 1) % len(AVAILABLE_MAPS)
+            
+            elif event.key == pygame.K_RIGHT:
+                if self.selected_option == 0:  # Tamanho dos quadrados
+                    self.square_size = min(100, self.square_size + 5)
+                elif self.selected_option == 1:  # Margem da área
+                    self.margin += 10
+                    if self.max_margin is not None:
+                        self.margin = min(self.max_margin, self.margin)
+                elif self.selected_option == 2:  # Velocidade mínima
+                    self.min_speed = min(self.max_speed - 0.5, self.min_speed + 0.5)
+                elif self.selected_option == 3:  # Velocidade máxima
+                    self.max_speed = min(10.0, self.max_speed + 0.5)
+                elif self.selected_option == 4:  # Vidas dos quadrados
+                    self.lives = min(10, self.lives + 1)  # Máximo de 10 vidas
+                elif self.selected_option == 5:  # Navegar entre mapas
+                    self.map_index = (self.map_index + 1) % len(AVAILABLE_MAPS)
     
-    while menu_active:
-        # Preencher a tela com um fundo escuro semitransparente
-        menu_surface = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-        menu_surface.fill((0, 0, 0, 200))  # RGBA: preto com 80% de opacidade
+    def draw(self, window, background=None):
+        """
+        Desenha o menu (ou o submenu aberto) por cima do conteúdo atual da janela.
         
-        # Título do menu
-        title = TITLE_FONT.render("MENU DE CONFIGURAÇÕES", True, WHITE)
-        title_rect = title.get_rect(center=(WIDTH // 2, 100))
-        menu_surface.blit(title, title_rect)
+        Args:
+            window: Superfície principal do pygame
+            background (pygame.Surface, optional): Fundo fixo (último frame do jogo)
+        """
+        self.needs_redraw = False
+        if self.submenu is not None:
+            self.submenu.draw(window, background)
+            return
+        
+        width = window.get_width()
+        self.draw_header(window, background)
         
         # Renderizar as opções do menu
-        for i, option in enumerate(options):
-            if i == 0:
-                text = option.format(square_size)
-            elif i == 1:
-                text = option.format(margin)
-            elif i == 2:
-                text = option.format(min_speed)
-            elif i == 3:
-                text = option.format(max_speed)
-            elif i == 4:
-                text = option.format(lives)
-            elif i == 5:
-                # Mostrar o nome do mapa selecionado
-                text = option.format(AVAILABLE_MAPS[map_index].name)
-            else:
-                text = option
+        values = (self.square_size, self.margin, self.min_speed, self.max_speed, self.lives,
+                  AVAILABLE_MAPS[self.map_index].name)  # Nome do mapa selecionado
+        for i, option in enumerate(self.OPTIONS):
+            text = option.format(values[i]) if i < len(values) else option
             
-            color = YELLOW if i == selected_option else WHITE
-            rendered_text = MENU_FONT.render(text, True, color)
-            text_rect = rendered_text.get_rect(center=(WIDTH // 2, 180 + i * 50))
-            menu_surface.blit(rendered_text, text_rect)
+            color = YELLOW if i == self.selected_option else WHITE
+            rendered_text = render_text(MENU_FONT, text, True, color)
+            text_rect = rendered_text.get_rect(center=(width // 2, 180 + i * 50))
+            window.blit(rendered_text, text_rect)
             
             # Adicionar setas para as opções ajustáveis
             if i < 5:  # Primeiras 5 opções são ajustáveis com setas
-                left_arrow = MENU_FONT.render("<", True, color)
-                right_arrow = MENU_FONT.render(">", True, color)
-                menu_surface.blit(left_arrow, (WIDTH // 2 - 150, 180 + i * 50 - 12))
-                menu_surface.blit(right_arrow, (WIDTH // 2 + 150, 180 + i * 50 - 12))
-        
-        # Sobrepor a superfície do menu à tela principal
-        window.blit(menu_surface, (0, 0))
-        pygame.display.flip()
-        
-        # Processar eventos
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                return False, {}, False
-            
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    menu_active = False  # Fechar o menu
-                
-                elif event.key == pygame.K_UP:
-                    selected_option = (selected_option - 1) % len(options)
-                
-                elif event.key == pygame.K_DOWN:
-                    selected_option = (selected_option + 1) % len(options)
-                
-                elif event.key == pygame.K_RETURN or event.key == pygame.K_SPACE:
-                    if selected_option == 5:  # Selecionar Mapa
-                        new_map_index = show_map_selection(window, map_index)
-                        if new_map_index >= 0:  # Se não cancelou
-                            map_index = new_map_index
-                    elif selected_option == 6:  # Restaurar padrões
-                        margin = MARGIN
-                        square_size = SQUARE_SIZE
-                        min_speed = MIN_SPEED
-                        max_speed = MAX_SPEED
-                        lives = 5  # Restaurar vidas para o padrão
-                        map_index = 0  # Restaurar mapa para o padrão
-                        reset_config = True
-                    elif selected_option == 7:  # Voltar ao jogo
-                        menu_active = False
-                    elif selected_option == 8:  # Sair
-                        return False, {}, False
-                
-                # Ajustar valores com as setas esquerda/direita
-                elif event.key == pygame.K_LEFT:
-                    if selected_option == 0:  # Tamanho dos quadrados
-                        square_size = max(10, square_size - 5)
-                    elif selected_option == 1:  # Margem da área
-                        margin = max(10, margin - 10)
-                    elif selected_option == 2:  # Velocidade mínima
-                        min_speed = max(0.5, min_speed - 0.5)
-                    elif selected_option == 3:  # Velocidade máxima
-                        max_speed = max(min_speed + 0.5, max_speed - 0.5)
-                    elif selected_option == 4:  # Vidas dos quadrados
-                        lives = max(1, lives - 1)  # Mínimo de 1 vida
-                    elif selected_option == 5:  # Navegar entre mapas
-                        map_index = (map_index - 1) % len(AVAILABLE_MAPS)
-                
-                elif event.key == pygame.K_RIGHT:
-                    if selected_option == 0:  # Tamanho dos quadrados
-                        square_size = min(100, square_size + 5)
-                    elif selected_option == 1:  # Margem da área
-                        margin = min(min(WIDTH, HEIGHT) // 2 - 50, margin + 10)
-                    elif selected_option == 2:  # Velocidade mínima
-                        min_speed = min(max_speed - 0.5, min_speed + 0.5)
-                    elif selected_option == 3:  # Velocidade máxima
-                        max_speed = min(10.0, max_speed + 0.5)
-                    elif selected_option == 4:  # Vidas dos quadrados
-                        lives = min(10, lives + 1)  # Máximo de 10 vidas
-                    elif selected_option == 5:  # Navegar entre mapas
-                        map_index = (map_index + 1) % len(AVAILABLE_MAPS)
-    
-    # Retornar as configurações atualizadas
-    return True, {
-        'margin': margin,
-        'square_size': square_size,
-        'min_speed': min_speed,
-        'max_speed': max_speed,
-        'lives': lives,
-        'map_index': map_index  # Incluir índice do mapa nas configurações
-    }, reset_config
\ No newline at end of file
+                left_arrow = render_text(MENU_FONT, "<", True, color)
+                right_arrow = render_text(MENU_FONT, ">", True, color)
+                window.blit(left_arrow, (width // 2 - 150, 180 + i * 50 - 12))
+                window.blit(right_arrow, (width // 2 + 150, 180 + i * 50 - 12))
+
+
+def max_menu_margin(size):
+    """Maior margem que o menu permite para uma janela do tamanho informado."""
+    return min(size) // 2 - 50
+
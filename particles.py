@@ -0,0 +1,240 @@
+"""
+Sistema de partículas com pool de tamanho fixo para o jogo DVD Bounce Simulation.
+
+Todas as partículas (explosões e colisões com parede) vivem em arrays NumPy
+pré-alocados. Novas partículas ocupam posições retiradas de uma lista livre e
+as que morrem devolvem suas posições a ela, de modo que nenhum objeto é criado
+ou descartado durante o jogo.
+"""
+import math
+import numpy as np
+import pygame
+from cache import LRUCache, surface_bytes
+
+# Níveis de transparência pré-renderizados por cor e raio
+ALPHA_LEVELS = 16
+ALPHA_STEP = 256 // ALPHA_LEVELS
+
+
+class ParticleSpriteCache:
+    """Círculos pré-renderizados por (cor, raio, transparência quantizada)."""
+    def __init__(self, max_bytes=2 * 1024 * 1024):
+        """
+        Inicializa o cache vazio.
+
+        Args:
+            max_bytes (int, optional): Memória máxima ocupada pelos sprites
+        """
+        self.sprites = LRUCache(max_bytes=max_bytes, sizeof=surface_bytes)
+
+    def get(self, color, radius, alpha):
+        """
+        Retorna o sprite de uma partícula.
+
+        Args:
+            color (tuple): Cor RGB da partícula
+            radius (int): Raio em pixels (>= 1)
+            alpha (int): Transparência de 0 a 255 (arredondada para um dos níveis)
+        """
+        level = min(ALPHA_LEVELS - 1, alpha // ALPHA_STEP)
+        key = (color, radius, level)
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            # Usar o topo do nível para que alpha 255 continue totalmente opaco
+            quantized_alpha = min(255, (level + 1) * ALPHA_STEP)
+            sprite = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, (*color, quantized_alpha), (radius, radius), radius)
+            self.sprites.put(key, sprite)
+        return sprite
+
+
+class ParticleSystem:
+    """Pool de partículas com atualização vetorizada."""
+    def __init__(self, capacity=4096, seed=None):
+        """
+        Pré-aloca os arrays das partículas.
+
+        Args:
+            capacity (int, optional): Número máximo de partículas vivas ao mesmo tempo
+            seed (int, optional): Semente do gerador usado para espalhar as partículas
+        """
+        self.capacity = capacity
+        self.rng = np.random.default_rng(seed)
+
+        self.x = np.zeros(capacity, dtype=np.float64)
+        self.y = np.zeros(capacity, dtype=np.float64)
+        self.vx = np.zeros(capacity, dtype=np.float64)
+        self.vy = np.zeros(capacity, dtype=np.float64)
+        self.size = np.zeros(capacity, dtype=np.float64)
+        self.alpha = np.zeros(capacity, dtype=np.float64)
+        self.fade_speed = np.zeros(capacity, dtype=np.float64)
+        self.lifetime = np.zeros(capacity, dtype=np.int64)
+        self.color = np.zeros((capacity, 3), dtype=np.uint8)
+        self.alive = np.zeros(capacity, dtype=bool)
+
+        # Lista livre em forma de pilha: free[:free_count] são as posições disponíveis
+        self.free = np.arange(capacity - 1, -1, -1, dtype=np.int64)
+        self.free_count = capacity
+
+        # Sprites pré-renderizados (cada partícula vira um único blit)
+        self.sprite_cache = ParticleSpriteCache()
+
+    def __len__(self):
+        """Retorna o número de partículas vivas."""
+        return self.capacity - self.free_count
+
+    def _take(self, count):
+        """Retira até count posições da lista livre (partículas extras são descartadas)."""
+        count = min(count, self.free_count)
+        slots = self.free[self.free_count - count:self.free_count].copy()
+        self.free_count -= count
+        return slots
+
+    def _spawn(self, slots, x, y, speed, angle, size, lifetime, fade_speed, color):
+        """Preenche as posições reservadas com os valores das novas partículas."""
+        self.x[slots] = x
+        self.y[slots] = y
+        self.vx[slots] = speed * np.cos(angle)
+        self.vy[slots] = speed * np.sin(angle)
+        self.size[slots] = size
+        self.lifetime[slots] = lifetime
+        self.fade_speed[slots] = fade_speed
+        self.alpha[slots] = 1.0  # Transparência inicial
+        self.color[slots] = color
+        self.alive[slots] = True
+
+    def spawn_explosion(self, x, y, size, color, count=50):
+        """
+        Cria as partículas da explosão de um quadrado.
+
+        Args:
+            x (float): Posição x do quadrado
+            y (float): Posição y do quadrado
+            size (int): Tamanho do quadrado (as partículas nascem dentro dele)
+            color (tuple): Cor RGB das partículas
+            count (int, optional): Número de partículas
+        """
+        slots = self._take(count)
+        n = len(slots)
+        if n == 0:
+            return
+
+        rng = self.rng
+        self._spawn(
+            slots,
+            x=rng.uniform(x, x + size, n),
+            y=rng.uniform(y, y + size, n),
+            speed=rng.uniform(1, 5, n),
+            angle=rng.uniform(0, 2 * math.pi, n),
+            size=rng.integers(2, 6, n),
+            lifetime=rng.integers(30, 61, n),  # Duração em frames
+            fade_speed=rng.uniform(0.01, 0.05, n),
+            color=color
+        )
+
+    def spawn_wall(self, x, y, color, angle_range, count=None):
+        """
+        Cria as partículas de uma colisão com a parede.
+
+        Args:
+            x (float): Posição x da colisão
+            y (float): Posição y da colisão
+            color (tuple): Cor RGB das partículas
+            angle_range (tuple): Faixa de ângulos (em graus) da dispersão
+            count (int, optional): Número de partículas (6 a 10 se None)
+        """
+        if count is None:
+            count = int(self.rng.integers(6, 11))
+        slots = self._take(count)
+        n = len(slots)
+        if n == 0:
+            return
+
+        rng = self.rng
+        self._spawn(
+            slots,
+            x=x + rng.uniform(-5, 5, n),
+            y=y + rng.uniform(-5, 5, n),
+            speed=rng.uniform(2, 5, n),
+            angle=np.radians(rng.uniform(angle_range[0], angle_range[1], n)),
+            size=rng.uniform(1.5, 3.5, n),
+            lifetime=rng.integers(15, 26, n),  # Vida mais curta
+            fade_speed=rng.uniform(0.05, 0.1, n),  # Fade mais rápido
+            color=color
+        )
+
+    def update(self):
+        """Atualiza todas as partículas vivas e recicla as que morreram."""
+        if self.free_count == self.capacity:
+            return
+
+        idx = np.flatnonzero(self.alive)
+        if idx.size == 0:
+            return
+
+        self.x[idx] += self.vx[idx]
+        self.y[idx] += self.vy[idx]
+
+        # Adicionar gravidade leve
+        self.vy[idx] += 0.05
+
+        # Reduzir vida e transparência
+        self.lifetime[idx] -= 1
+        self.alpha[idx] = np.maximum(0.0, self.alpha[idx] - self.fade_speed[idx])
+
+        # Reduzir tamanho gradualmente
+        size = self.size[idx]
+        size[size > 0.5] -= 0.1
+        self.size[idx] = size
+
+        # Devolver as posições das partículas mortas à lista livre
+        dead = idx[(self.lifetime[idx] <= 0) | (self.alpha[idx] <= 0)]
+        if dead.size:
+            self.alive[dead] = False
+            self.free[self.free_count:self.free_count + dead.size] = dead
+            self.free_count += dead.size
+
+    def clear(self):
+        """Remove todas as partículas."""
+        self.alive[:] = False
+        self.free[:] = np.arange(self.capacity - 1, -1, -1)
+        self.free_count = self.capacity
+
+    def get_bounds(self):
+        """Retorna o retângulo que envolve todas as partículas vivas (ou None)."""
+        if self.free_count == self.capacity:
+            return None
+
+        idx = np.flatnonzero(self.alive)
+        if idx.size == 0:
+            return None
+
+        x, y, size = self.x[idx], self.y[idx], self.size[idx]
+        left = int(np.floor((x - size).min())) - 1
+        top = int(np.floor((y - size).min())) - 1
+        right = int(np.ceil((x + size).max())) + 1
+        bottom = int(np.ceil((y + size).max())) + 1
+        return pygame.Rect(left, top, right - left, bottom - top)
+
+    def draw(self, surface):
+        """Desenha todas as partículas vivas."""
+        if self.free_count == self.capacity:
+            return
+
+        idx = np.flatnonzero(self.alive)
+        if idx.size == 0:
+            return
+
+        get_sprite = self.sprite_cache.get
+        blit = surface.blit
+        xs = self.x[idx].tolist()
+        ys = self.y[idx].tolist()
+        sizes = self.size[idx].tolist()
+        alphas = (self.alpha[idx] * 255).astype(np.int64).tolist()
+        colors = [tuple(color) for color in self.color[idx].tolist()]
+
+        for x, y, size, alpha, color in zip(xs, ys, sizes, alphas, colors):
+            radius = int(size)
+            if radius <= 0 or alpha <= 0:
+                continue
+            blit(get_sprite(color, radius, alpha), (int(x - size), int(y - size)))
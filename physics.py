@@ -0,0 +1,664 @@
+"""
+Backend de física vetorizado (NumPy) para o jogo DVD Bounce Simulation.
+
+Os estados de todos os quadrados ficam em arrays contíguos (estrutura de arrays)
+e são integrados com poucas operações vetorizadas por frame; a broad phase, o
+teste de sobreposição e a resposta às colisões entre quadrados também rodam
+sobre os arrays. Cada quadrado do jogo passa a ser um ArraySquare, uma "visão"
+fina que lê e escreve nesses arrays, de modo que o restante do código (mapa,
+desenho, menu) continua funcionando; essas leituras por propriedade ficam fora
+do caminho quente.
+"""
+import numpy as np
+from constants import WHITE, COLLISION_FLASH_DURATION
+from square import Square
+
+# Campos guardados nos arrays e o tipo usado para expô-los na visão. Os campos
+# de cada tipo são linhas de uma única matriz (floats, ints, bools): o gravador de
+# trajetórias copia várias colunas seguidas com uma operação só
+FLOAT_FIELDS = (
+    'x', 'y', 'vx', 'vy', 'min_speed', 'max_speed',
+    'original_min_speed', 'original_max_speed', 'compression'
+)
+INT_FIELDS = (
+    'lives', 'size', 'area_x', 'area_y', 'area_size', 'invincible_timer',
+    'spike_timer', 'speed_boost_timer', 'wall_collision_timer'
+)
+BOOL_FIELDS = ('is_alive', 'has_spikes', 'speed_boost', 'wall_collision')
+
+# Matriz de cada grupo de campos, com o tipo dos seus elementos
+FIELD_GROUPS = (
+    ('floats', FLOAT_FIELDS, np.float64),
+    ('ints', INT_FIELDS, np.int64),
+    ('bools', BOOL_FIELDS, bool)
+)
+
+# Até este número de quadrados vivos a broad phase testa todos os pares
+BRUTE_FORCE_PAIRS = 32
+
+
+class SquareArrays:
+    """Armazena o estado físico de todos os quadrados em arrays NumPy."""
+    def __init__(self, capacity=64, seed=None):
+        """
+        Inicializa os arrays vazios.
+
+        Args:
+            capacity (int, optional): Capacidade inicial (cresce sob demanda)
+            seed (int, optional): Semente do gerador usado na variação de velocidade
+        """
+        self.capacity = 0
+        self.count = 0  # Número de posições já usadas (vivas ou livres)
+        self.free_slots = []
+        self.squares = []  # Quadrado dono de cada posição (None se livre)
+        self.slot_cache = (None, 0, None)  # Última lista passada a slots_of e seus índices
+        self.rng = np.random.default_rng(seed)
+
+        self.active = np.zeros(0, dtype=bool)
+        for group, fields, dtype in FIELD_GROUPS:
+            setattr(self, group, np.zeros((len(fields), 0), dtype=dtype))
+
+        self._grow(capacity)
+
+    def _grow(self, capacity):
+        """Aumenta a capacidade dos arrays preservando os valores atuais."""
+        old = self.active
+        self.active = np.zeros(capacity, dtype=bool)
+        self.active[:len(old)] = old
+        for group, fields, dtype in FIELD_GROUPS:
+            old = getattr(self, group)
+            new = np.zeros((len(fields), capacity), dtype=dtype)
+            new[:, :old.shape[1]] = old
+            setattr(self, group, new)
+            # Cada campo é uma linha (visão) da matriz do grupo
+            for row, name in enumerate(fields):
+                setattr(self, name, new[row])
+        self.capacity = capacity
+
+    def allocate(self, square):
+        """Reserva uma posição nos arrays para o quadrado e retorna seu índice."""
+        if self.free_slots:
+            slot = self.free_slots.pop()
+            self.squares[slot] = square
+        else:
+            if self.count == self.capacity:
+                self._grow(max(1, self.capacity * 2))
+            slot = self.count
+            self.count += 1
+            self.squares.append(square)
+
+        for group, _, _ in FIELD_GROUPS:
+            getattr(self, group)[:, slot] = 0
+        self.active[slot] = True
+        return slot
+
+    def release(self, square):
+        """Libera a posição de um quadrado descartado (ele não deve mais ser usado)."""
+        slot = square._slot
+        self.active[slot] = False
+        self.is_alive[slot] = False
+        self.squares[slot] = None
+        self.free_slots.append(slot)
+
+    def clear(self):
+        """Remove todos os quadrados."""
+        self.active[:] = False
+        self.is_alive[:] = False
+        self.count = 0
+        self.free_slots = []
+        self.squares = []
+        self.slot_cache = (None, 0, None)
+
+    def squares_touching(self, rects):
+        """
+        Retorna os quadrados vivos que se sobrepõem a algum dos retângulos.
+
+        Args:
+            rects (list): Retângulos (pygame.Rect) a testar, por exemplo obstáculos do mapa
+        """
+        if not rects:
+            return []
+
+        n = self.count
+        alive = self.active[:n] & self.is_alive[:n]
+        x, y, size = self.x[:n], self.y[:n], self.size[:n]
+
+        # Mesmo critério do Rect.colliderect (coordenadas truncadas para inteiro)
+        ix = x.astype(np.int64)
+        iy = y.astype(np.int64)
+        touching = np.zeros(n, dtype=bool)
+        for rect in rects:
+            touching |= ((ix < rect.right) & (ix + size > rect.left) &
+                         (iy < rect.bottom) & (iy + size > rect.top))
+
+        return [self.squares[i] for i in np.flatnonzero(alive & touching)]
+
+    def alive_slots(self):
+        """Retorna os índices (em ordem crescente) dos quadrados vivos."""
+        n = self.count
+        return np.flatnonzero(self.active[:n] & self.is_alive[:n])
+
+    def alive_count(self):
+        """Retorna quantos quadrados estão vivos."""
+        n = self.count
+        return int(np.count_nonzero(self.active[:n] & self.is_alive[:n]))
+
+    def slots_of(self, squares):
+        """
+        Retorna os índices nos arrays dos quadrados, na ordem da lista.
+
+        O resultado fica guardado enquanto a lista for a mesma e do mesmo tamanho
+        (o jogo só acrescenta quadrados a ela ou troca de lista).
+        """
+        cached_squares, cached_length, slots = self.slot_cache
+        if cached_squares is not squares or cached_length != len(squares):
+            slots = np.fromiter((square._slot for square in squares), dtype=np.int64,
+                                count=len(squares))
+            self.slot_cache = (squares, len(squares), slots)
+        return slots
+
+    def alive_indices(self, slots):
+        """Retorna as posições (em slots) dos quadrados vivos, como lista."""
+        return np.flatnonzero(self.is_alive[slots]).tolist()
+
+    def positions(self, slots):
+        """Retorna uma cópia das posições (x, y) dos quadrados, uma linha por quadrado."""
+        return np.column_stack((self.x[slots], self.y[slots]))
+
+    def plain_mask(self, slots):
+        """
+        Marca os quadrados vivos que draw() desenha só com o corpo.
+
+        Sem compressão, speed boost, espinhos, flash na parede ou invencibilidade
+        piscando: o desenho é um único retângulo ou sprite na posição do quadrado.
+        """
+        return (self.is_alive[slots] & (self.compression[slots] >= 1.0) &
+                ~self.speed_boost[slots] & ~self.has_spikes[slots] &
+                ~(self.wall_collision[slots] & (self.wall_collision_timer[slots] > 0)) &
+                (self.invincible_timer[slots] == 0))
+
+    def first_overlapping(self, x, y, size):
+        """
+        Retorna o primeiro quadrado vivo (na ordem de criação) que se sobrepõe à caixa.
+
+        Usa o mesmo critério em ponto flutuante de PowerUp.check_collision.
+
+        Args:
+            x (float): Posição x da caixa
+            y (float): Posição y da caixa
+            size (float): Lado da caixa
+        """
+        idx = self.alive_slots()
+        sx, sy, ssize = self.x[idx], self.y[idx], self.size[idx]
+        hits = np.flatnonzero((x < sx + ssize) & (x + size > sx) &
+                              (y < sy + ssize) & (y + size > sy))
+        if hits.size == 0:
+            return None
+        return self.squares[idx[hits[0]]]
+
+    def colliding_pairs(self):
+        """
+        Retorna os pares de quadrados vivos que se sobrepõem neste frame.
+
+        Broad phase por grade uniforme (ou todos os pares, com poucos quadrados)
+        seguida do teste AABB de Square.check_collision, tudo sobre os arrays.
+
+        Returns:
+            tuple: Arrays (a, b) de índices com a < b, em ordem lexicográfica
+                   (a mesma ordem do laço aninhado do backend Python)
+        """
+        idx = self.alive_slots()
+        empty = np.zeros(0, dtype=np.int64)
+        if idx.size < 2:
+            return empty, empty
+
+        x, y, size = self.x[idx], self.y[idx], self.size[idx]
+
+        if idx.size <= BRUTE_FORCE_PAIRS:
+            # Poucos quadrados: testar todos os pares sai mais barato que montar a grade
+            i, j = np.triu_indices(idx.size, 1)
+        else:
+            i, j = self._grid_pairs(x, y, size)
+
+        # Narrow phase: o mesmo teste de Square.check_collision
+        overlapping = ((x[i] < x[j] + size[j]) & (x[i] + size[i] > x[j]) &
+                       (y[i] < y[j] + size[j]) & (y[i] + size[i] > y[j]))
+        i, j = i[overlapping], j[overlapping]
+
+        a = idx[np.minimum(i, j)]
+        b = idx[np.maximum(i, j)]
+        pair_order = np.lexsort((b, a))
+        return a[pair_order], b[pair_order]
+
+    @staticmethod
+    def _grid_pairs(x, y, size):
+        """
+        Pares candidatos (posições em x/y/size) de células iguais ou vizinhas.
+
+        Grade uniforme como a do SpatialHash, montada com ordenação e searchsorted.
+        """
+        empty = np.zeros(0, dtype=np.int64)
+
+        # Célula pelo menos do tamanho do maior quadrado: só células vizinhas se tocam
+        cell = max(1, int(size.max()))
+        cx = np.floor_divide(x, cell).astype(np.int64)
+        cy = np.floor_divide(y, cell).astype(np.int64)
+        cx -= cx.min()
+        cy -= cy.min()
+        height = int(cy.max()) + 2  # Folga para cy + 1 não invadir a coluna seguinte
+        keys = cx * height + cy
+
+        order = np.argsort(keys, kind='stable')
+        sorted_keys = keys[order]
+        positions = np.arange(x.size)
+
+        firsts, seconds = [], []
+        # Mesma célula e metade da vizinhança 3x3 (cada par de células uma só vez)
+        for offset in (0, height, 1 - height, 1, height + 1):
+            target = sorted_keys + offset
+            if offset == 0:
+                lo = positions + 1
+            else:
+                lo = np.searchsorted(sorted_keys, target, side='left')
+            hi = np.searchsorted(sorted_keys, target, side='right')
+            counts = np.maximum(hi - lo, 0)
+            total = int(counts.sum())
+            if total == 0:
+                continue
+            first = np.repeat(positions, counts)
+            starts = np.repeat(lo - np.cumsum(counts) + counts, counts)
+            firsts.append(first)
+            seconds.append(starts + np.arange(total))
+
+        if not firsts:
+            return empty, empty
+
+        # Posições na ordem da grade -> posições originais
+        return order[np.concatenate(firsts)], order[np.concatenate(seconds)]
+
+    def resolve_collisions(self):
+        """
+        Resolve as colisões entre quadrados (equivalente a Square.handle_collision).
+
+        Os pares são divididos em rodadas em que nenhum quadrado aparece duas
+        vezes; cada par cai na primeira rodada depois de todos os pares anteriores
+        que compartilham um quadrado com ele, então cada quadrado vê suas colisões
+        na mesma ordem do backend Python. Cada rodada é resolvida de uma vez com
+        operações vetorizadas; só o dano dos espinhos (raro) passa pelos objetos.
+
+        Returns:
+            tuple: (número de colisões tratadas, vencedor ou None), onde o vencedor
+                   é o quadrado que eliminou outro por último
+        """
+        a, b = self.colliding_pairs()
+        if a.size == 0:
+            return 0, None
+
+        rounds = self._pair_rounds(a, b)
+
+        collisions = 0
+        winner = None
+        for r in range(int(rounds.max()) + 1):
+            selected = rounds == r
+            count, round_winner = self._resolve_round(a[selected], b[selected])
+            collisions += count
+            if round_winner is not None:
+                winner = round_winner
+        return collisions, winner
+
+    @staticmethod
+    def _pair_rounds(a, b):
+        """
+        Rodada de cada par: uma depois da última rodada de cada um dos seus quadrados.
+
+        Cada par aponta para o par anterior (na ordem dos pares) de cada um dos
+        seus dois quadrados, achado ordenando as pontas por quadrado; as rodadas
+        são então propagadas por esses ponteiros, uma passada vetorizada por
+        nível, até não mudarem mais.
+        """
+        pairs = a.size
+        squares = np.concatenate((a, b))
+        pair_ids = np.tile(np.arange(pairs), 2)
+
+        order = np.lexsort((pair_ids, squares))
+        sorted_pairs = pair_ids[order]
+        previous_sorted = np.full(order.size, -1, dtype=np.int64)
+        same_square = squares[order][1:] == squares[order][:-1]
+        previous_sorted[1:][same_square] = sorted_pairs[:-1][same_square]
+
+        previous = np.empty_like(previous_sorted)
+        previous[order] = previous_sorted
+        previous_a, previous_b = previous[:pairs], previous[pairs:]
+        has_a, has_b = previous_a >= 0, previous_b >= 0
+
+        rounds = np.zeros(pairs, dtype=np.int64)
+        while True:
+            updated = np.maximum(np.where(has_a, rounds[previous_a] + 1, 0),
+                                 np.where(has_b, rounds[previous_b] + 1, 0))
+            if np.array_equal(updated, rounds):
+                return rounds
+            rounds = updated
+
+    def _resolve_round(self, a, b):
+        """Resolve pares sem quadrados em comum (ver resolve_collisions)."""
+        # Rodadas anteriores podem ter movido ou eliminado os quadrados
+        xa, ya, sa = self.x[a], self.y[a], self.size[a]
+        xb, yb, sb = self.x[b], self.y[b], self.size[b]
+        valid = (self.is_alive[a] & self.is_alive[b] &
+                 (xa < xb + sb) & (xa + sa > xb) & (ya < yb + sb) & (ya + sa > yb))
+        a, b = a[valid], b[valid]
+        if a.size == 0:
+            return 0, None
+
+        # Dano dos espinhos pelos próprios objetos (vidas, explosão e quem eliminou quem)
+        winner = None
+        for k in np.flatnonzero(self.has_spikes[a] | self.has_spikes[b]):
+            first, second = self.squares[a[k]], self.squares[b[k]]
+            if first.has_spikes and second.is_alive:
+                second.take_damage(first)
+            if second.has_spikes and first.is_alive:
+                first.take_damage(second)
+            if not second.is_alive and second.killed_by is first:
+                winner = first
+            if not first.is_alive and first.killed_by is second:
+                winner = second
+
+        n = a.size
+        rng = self.rng
+        xa, ya, sa = self.x[a], self.y[a], self.size[a].astype(np.float64)
+        xb, yb, sb = self.x[b], self.y[b], self.size[b].astype(np.float64)
+        vxa, vya = self.vx[a], self.vy[a]
+        vxb, vyb = self.vx[b], self.vy[b]
+        m1, m2 = sa * sa, sb * sb
+
+        # Colisão de canto: par de cantos mais próximos (mesma ordem de busca de
+        # handle_collision_corner, o primeiro mínimo vence)
+        offsets_x = np.array([0.0, 1.0, 0.0, 1.0])
+        offsets_y = np.array([0.0, 0.0, 1.0, 1.0])
+        corner_dx = ((xb[:, None] + sb[:, None] * offsets_x)[:, None, :] -
+                     (xa[:, None] + sa[:, None] * offsets_x)[:, :, None]).reshape(n, 16)
+        corner_dy = ((yb[:, None] + sb[:, None] * offsets_y)[:, None, :] -
+                     (ya[:, None] + sa[:, None] * offsets_y)[:, :, None]).reshape(n, 16)
+        corner_dist = np.sqrt(corner_dx ** 2 + corner_dy ** 2)
+        nearest = np.argmin(corner_dist, axis=1)
+        rows = np.arange(n)
+        min_dist = corner_dist[rows, nearest]
+        threshold = sa * 0.3
+
+        dist = np.maximum(0.1, min_dist)
+        cnx = corner_dx[rows, nearest] / dist
+        cny = corner_dy[rows, nearest] / dist
+        vr_dot_n = (vxb - vxa) * cnx + (vyb - vya) * cny
+        corner = (min_dist < threshold) & (vr_dot_n < 0)
+
+        new_xa, new_ya, new_xb, new_yb = xa.copy(), ya.copy(), xb.copy(), yb.copy()
+        new_vxa, new_vya, new_vxb, new_vyb = vxa.copy(), vya.copy(), vxb.copy(), vyb.copy()
+
+        c = np.flatnonzero(corner)
+        if c.size:
+            j = -2.0 * vr_dot_n[c] / ((1 / m1[c]) + (1 / m2[c]))
+            angle = rng.uniform(0, np.pi / 4, c.size)
+            new_vxa[c] += -j * cnx[c] / m1[c] + 0.2 * np.cos(angle)
+            new_vya[c] += -j * cny[c] / m1[c] + 0.2 * np.sin(angle)
+            new_vxb[c] += j * cnx[c] / m2[c] + 0.2 * np.cos(angle + np.pi)
+            new_vyb[c] += j * cny[c] / m2[c] + 0.2 * np.sin(angle + np.pi)
+
+            overlap = np.maximum(threshold[c] - dist[c], 0.0)
+            new_xa[c] -= cnx[c] * overlap / 2
+            new_ya[c] -= cny[c] * overlap / 2
+            new_xb[c] += cnx[c] * overlap / 2
+            new_yb[c] += cny[c] * overlap / 2
+
+        g = np.flatnonzero(~corner)
+        if g.size:
+            xa_g, ya_g, sa_g = xa[g], ya[g], sa[g]
+            xb_g, yb_g, sb_g = xb[g], yb[g], sb[g]
+            va_x, va_y, vb_x, vb_y = vxa[g], vya[g], vxb[g], vyb[g]
+            m1_g, m2_g = m1[g], m2[g]
+
+            # Normal entre os centros, reduzida ao eixo dominante
+            dx = (xb_g + sb_g / 2) - (xa_g + sa_g / 2)
+            dy = (yb_g + sb_g / 2) - (ya_g + sa_g / 2)
+            distance = np.maximum(1, np.sqrt(dx ** 2 + dy ** 2))
+            dx /= distance
+            dy /= distance
+            horizontal = np.abs(dx) > np.abs(dy)
+            nx = np.where(horizontal, np.where(dx > 0, 1.0, -1.0), 0.0)
+            ny = np.where(horizontal, 0.0, np.where(dy > 0, 1.0, -1.0))
+
+            v1_mag = np.sqrt(va_x ** 2 + va_y ** 2)
+            v2_mag = np.sqrt(vb_x ** 2 + vb_y ** 2)
+            moving = (v1_mag > 0) & (v2_mag > 0)
+            dot = np.where(moving, (va_x * vb_x + va_y * vb_y) /
+                           np.where(moving, v1_mag * v2_mag, 1.0), 0.0)
+            same_direction = moving & (dot > 0.7)
+            elastic = moving & ~same_direction
+            stopped = ~moving
+
+            out_ax, out_ay, out_bx, out_by = va_x.copy(), va_y.copy(), vb_x.copy(), vb_y.copy()
+
+            # Mesma direção: girar um dos dois, escolhido ao acaso
+            s = np.flatnonzero(same_direction)
+            if s.size:
+                turn_first = rng.random(s.size) < 0.5
+                angle = rng.uniform(np.pi / 2, np.pi, s.size)
+                sf, ss = s[turn_first], s[~turn_first]
+                out_ax[sf] = v1_mag[sf] * np.cos(angle[turn_first])
+                out_ay[sf] = v1_mag[sf] * np.sin(angle[turn_first])
+                out_bx[ss] = v2_mag[ss] * np.cos(angle[~turn_first])
+                out_by[ss] = v2_mag[ss] * np.sin(angle[~turn_first])
+
+            # Colisão elástica nas componentes normais, tangenciais preservadas
+            e = np.flatnonzero(elastic)
+            if e.size:
+                ex, ey = nx[e], ny[e]
+                v1n = va_x[e] * ex + va_y[e] * ey
+                v2n = vb_x[e] * ex + vb_y[e] * ey
+                m1_e, m2_e = m1_g[e], m2_g[e]
+                new_v1n = (v1n * (m1_e - m2_e) + 2 * m2_e * v2n) / (m1_e + m2_e)
+                new_v2n = (v2n * (m2_e - m1_e) + 2 * m1_e * v1n) / (m1_e + m2_e)
+                noise = rng.uniform(-0.1, 0.1, (4, e.size))
+                out_ax[e] = new_v1n * ex + (va_x[e] - v1n * ex) + noise[0]
+                out_ay[e] = new_v1n * ey + (va_y[e] - v1n * ey) + noise[1]
+                out_bx[e] = new_v2n * ex + (vb_x[e] - v2n * ex) + noise[2]
+                out_by[e] = new_v2n * ey + (vb_y[e] - v2n * ey) + noise[3]
+
+            # Algum quadrado parado: impulso simples
+            z = np.flatnonzero(stopped)
+            if z.size:
+                noise = rng.uniform(-0.2, 0.2, (4, z.size))
+                out_ax[z] = -va_x[z] * 0.9 + noise[0]
+                out_ay[z] = -va_y[z] * 0.9 + noise[1]
+                out_bx[z] = -vb_x[z] * 0.9 + noise[2]
+                out_by[z] = -vb_y[z] * 0.9 + noise[3]
+
+            new_vxa[g], new_vya[g], new_vxb[g], new_vyb[g] = out_ax, out_ay, out_bx, out_by
+
+            # Separar os quadrados ao longo do eixo da colisão
+            overlap = np.where(horizontal,
+                               np.where(dx > 0, (xa_g + sa_g) - xb_g, (xb_g + sb_g) - xa_g),
+                               np.where(dy > 0, (ya_g + sa_g) - yb_g, (yb_g + sb_g) - ya_g))
+            overlap = np.maximum(overlap, 0.0)
+            new_xa[g] = xa_g - nx * overlap / 2
+            new_ya[g] = ya_g - ny * overlap / 2
+            new_xb[g] = xb_g + nx * overlap / 2
+            new_yb[g] = yb_g + ny * overlap / 2
+
+        # Gravar de volta (os pares da rodada não compartilham quadrados)
+        self.x[a], self.y[a], self.x[b], self.y[b] = new_xa, new_ya, new_xb, new_yb
+        self.vx[a], self.vy[a], self.vx[b], self.vy[b] = new_vxa, new_vya, new_vxb, new_vyb
+
+        # Espinhos são consumidos na colisão
+        self.has_spikes[a] = self.has_spikes[b] = False
+        self.spike_timer[a] = self.spike_timer[b] = 0
+        return n, winner
+
+    def step(self):
+        """Avança um frame para todos os quadrados vivos (equivalente a Square.update)."""
+        n = self.count
+        idx = np.flatnonzero(self.active[:n] & self.is_alive[:n])
+        if idx.size == 0:
+            return
+
+        x, y = self.x[idx], self.y[idx]
+        vx, vy = self.vx[idx], self.vy[idx]
+        size = self.size[idx]
+        area_x, area_y, area_size = self.area_x[idx], self.area_y[idx], self.area_size[idx]
+        min_speed, max_speed = self.min_speed[idx], self.max_speed[idx]
+
+        # Temporizador de invencibilidade (a cor é atualizada depois, só para quem pisca)
+        invincible = self.invincible_timer[idx]
+        blinking = invincible > 0
+        invincible[blinking] -= 1
+
+        # Atualizar a posição
+        x += vx
+        y += vy
+
+        # Colisão com as paredes (mesma ordem de prioridade de handle_wall_collision)
+        left = x <= area_x
+        right = ~left & (x + size >= area_x + area_size)
+        top = y <= area_y
+        bottom = ~top & (y + size >= area_y + area_size)
+
+        vx = np.where(left, np.abs(vx) * 1.05, np.where(right, -np.abs(vx) * 1.05, vx))
+        x = np.where(left, area_x, np.where(right, area_x + area_size - size, x))
+        vy = np.where(top, np.abs(vy) * 1.05, np.where(bottom, -np.abs(vy) * 1.05, vy))
+        y = np.where(top, area_y, np.where(bottom, area_y + area_size - size, y))
+
+        hit_x = left | right
+        hit_y = top | bottom
+        hit = hit_x | hit_y
+
+        compression = np.where(hit, 0.7, self.compression[idx])
+        wall_collision = self.wall_collision[idx] | hit
+        wall_timer = np.where(hit, COLLISION_FLASH_DURATION, self.wall_collision_timer[idx])
+
+        # Limitar a velocidade após a colisão
+        speed = np.hypot(vx, vy)
+        too_fast = hit & (speed > max_speed)
+        ratio = np.where(too_fast, max_speed / np.where(speed > 0, speed, 1.0), 1.0)
+        vx *= ratio
+        vy *= ratio
+
+        # Temporizador do flash de colisão e restauração da compressão
+        flashing = wall_timer > 0
+        wall_timer[flashing] -= 1
+        wall_collision &= ~(flashing & (wall_timer == 0))
+        restoring = flashing & (compression < 1.0)
+        compression[restoring] += (1.0 - compression[restoring]) * 0.2
+        compression[restoring & (compression > 0.98)] = 1.0
+
+        # Temporizador dos espinhos
+        has_spikes = self.has_spikes[idx]
+        spike_timer = self.spike_timer[idx]
+        spiking = has_spikes & (spike_timer > 0)
+        spike_timer[spiking] -= 1
+        has_spikes &= ~(spiking & (spike_timer == 0))
+
+        # Temporizador do speed boost
+        speed_boost = self.speed_boost[idx]
+        boost_timer = self.speed_boost_timer[idx]
+        boosting = speed_boost & (boost_timer > 0)
+        boost_timer[boosting] -= 1
+
+        speed = np.hypot(vx, vy)
+        accelerate = boosting & (speed < max_speed) & (speed > 0)
+        ratio = np.where(accelerate,
+                         np.minimum(speed * 1.01, max_speed) / np.where(speed > 0, speed, 1.0),
+                         1.0)
+        vx *= ratio
+        vy *= ratio
+
+        # Fim do boost: restaurar os limites originais
+        boost_ended = boosting & (boost_timer == 0)
+        speed_boost &= ~boost_ended
+        min_speed = np.where(boost_ended, self.original_min_speed[idx], min_speed)
+        max_speed = np.where(boost_ended, self.original_max_speed[idx], max_speed)
+        speed = np.hypot(vx, vy)
+        too_fast = boost_ended & (speed > max_speed)
+        ratio = np.where(too_fast, max_speed / np.where(speed > 0, speed, 1.0), 1.0)
+        vx *= ratio
+        vy *= ratio
+
+        # Variar levemente a velocidade ao longo do tempo
+        vx += self.rng.uniform(-0.03, 0.03, idx.size)
+        vy += self.rng.uniform(-0.03, 0.03, idx.size)
+
+        # Limitar a velocidade mínima e máxima
+        speed = np.hypot(vx, vy)
+        safe_speed = np.where(speed > 0, speed, 1.0)
+        ratio = np.where(speed < min_speed, min_speed / safe_speed,
+                         np.where(speed > max_speed, max_speed / safe_speed, 1.0))
+        ratio[speed == 0] = 1.0
+        vx *= ratio
+        vy *= ratio
+
+        # Gravar de volta nos arrays
+        self.x[idx], self.y[idx] = x, y
+        self.vx[idx], self.vy[idx] = vx, vy
+        self.min_speed[idx], self.max_speed[idx] = min_speed, max_speed
+        self.invincible_timer[idx] = invincible
+        self.compression[idx] = compression
+        self.wall_collision[idx] = wall_collision
+        self.wall_collision_timer[idx] = wall_timer
+        self.has_spikes[idx] = has_spikes
+        self.spike_timer[idx] = spike_timer
+        self.speed_boost[idx] = speed_boost
+        self.speed_boost_timer[idx] = boost_timer
+
+        # Parte que continua em Python: apenas quadrados com eventos neste frame
+        for i in idx[blinking]:
+            square = self.squares[i]
+            timer = self.invincible_timer[i]
+            square.color = WHITE if timer > 0 and timer % 8 < 4 else square.original_color
+
+        for k in np.flatnonzero(hit):
+            i = idx[k]
+            square = self.squares[i]
+            half = size[k] / 2
+            if hit_y[k]:
+                square.wall_collision_side = 'top' if top[k] else 'bottom'
+                wall_y = area_y[k] if top[k] else area_y[k] + area_size[k]
+                square.wall_collision_position = (x[k] + half, wall_y)
+                square.compression_side = 'y'
+            else:
+                square.wall_collision_side = 'left' if left[k] else 'right'
+                wall_x = area_x[k] if left[k] else area_x[k] + area_size[k]
+                square.wall_collision_position = (wall_x, y[k] + half)
+                square.compression_side = 'x'
+            square.create_wall_particles(square.wall_collision_side, square.wall_collision_position)
+
+
+def _array_property(name, cast):
+    """Cria uma propriedade que lê e escreve o campo no array do motor."""
+    def getter(self):
+        return cast(getattr(self._engine, name)[self._slot])
+
+    def setter(self, value):
+        getattr(self._engine, name)[self._slot] = value
+
+    return property(getter, setter)
+
+
+class ArraySquare(Square):
+    """Quadrado cujo estado físico vive nos arrays de um SquareArrays."""
+    def __init__(self, engine, *args, **kwargs):
+        """
+        Inicializa o quadrado reservando uma posição no motor.
+
+        Args:
+            engine (SquareArrays): Motor que armazena o estado físico
+            *args, **kwargs: Mesmos argumentos de Square
+        """
+        self._engine = engine
+        self._slot = engine.allocate(self)
+        super().__init__(*args, **kwargs)
+
+
+for _name in FLOAT_FIELDS:
+    setattr(ArraySquare, _name, _array_property(_name, float))
+for _name in INT_FIELDS:
+    setattr(ArraySquare, _name, _array_property(_name, int))
+for _name in BOOL_FIELDS:
+    setattr(ArraySquare, _name, _array_property(_name, bool))
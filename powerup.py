@@ -7,9 +7,143 @@ import pygame
 from constants import YELLOW, RED
 
 
+# Animação pré-renderizada: fases por ciclo da pulsação (sin(t / 200), t em ms);
+# as setas do power-up de velocidade oscilam no dobro da frequência, então
+# o mesmo ciclo cobre as duas animações
+POWERUP_PHASES = 32
+PULSE_PERIOD_MS = 2 * math.pi * 200
+
+_atlases = {}  # (tipo, tamanho) -> (superfície, retângulos das fases, margem)
+
+
+def draw_powerup_frame(surface, powerup_type, x, y, size, ticks):
+    """
+    Desenha um quadro da animação de um power-up.
+    
+    Args:
+        surface: Superfície do pygame para desenhar
+        powerup_type (str): Tipo de power-up ('spikes' ou 'speed')
+        x (int): Posição x do power-up
+        y (int): Posição y do power-up
+        size (int): Tamanho do power-up
+        ticks (float): Instante da animação, em milissegundos
+    """
+    # Efeito de pulsação para todos os power-ups
+    pulse = (math.sin(ticks / 200) + 1) * 0.5 * 255
+    
+    # Desenhar power-up de acordo com o tipo
+    if powerup_type == 'spikes':
+        # Espinhos (amarelo pulsante para laranja)
+        color = (255, int(pulse), 0)
+        
+        # Círculo central
+        pygame.draw.circle(surface, color, (int(x + size/2), int(y + size/2)), int(size/2))
+        
+        # Desenhar pequenos triângulos ao redor para representar espinhos
+        spike_color = YELLOW
+        spike_length = size // 3
+        center_x = x + size // 2
+        center_y = y + size // 2
+        radius = size // 2
+        
+        # Desenhar 8 espinhos ao redor do círculo
+        for angle in range(0, 360, 45):
+            # Arredondar tira o ruído de ponto flutuante (cos 270° ≈ -1.8e-16), que
+            # faria o espinho mudar 1 pixel conforme a posição (atlas x tela)
+            cos_a = round(math.cos(math.radians(angle)), 9)
+            sin_a = round(math.sin(math.radians(angle)), 9)
+            # Ponto na borda do círculo
+            edge_x = center_x + radius * cos_a
+            edge_y = center_y + radius * sin_a
+            # Ponto da ponta do espinho
+            spike_x = center_x + (radius + spike_length) * cos_a
+            spike_y = center_y + (radius + spike_length) * sin_a
+            # Pontos laterais do triângulo
+            side_angle1 = math.radians(angle + 20)
+            side_angle2 = math.radians(angle - 20)
+            side_dist = radius * 0.5
+            side_x1 = center_x + side_dist * round(math.cos(side_angle1), 9)
+            side_y1 = center_y + side_dist * round(math.sin(side_angle1), 9)
+            side_x2 = center_x + side_dist * round(math.cos(side_angle2), 9)
+            side_y2 = center_y + side_dist * round(math.sin(side_angle2), 9)
+            
+            # Desenhar o triângulo do espinho
+            pygame.draw.polygon(surface, spike_color, [(edge_x, edge_y), (spike_x, spike_y), (side_x1, side_y1)])
+            pygame.draw.polygon(surface, spike_color, [(edge_x, edge_y), (spike_x, spike_y), (side_x2, side_y2)])
+    
+    else:  # power-up de velocidade
+        # Círculo azul pulsante
+        color = (50, 150, int(pulse))  # Azul variando na intensidade
+        
+        # Círculo central
+        pygame.draw.circle(surface, color, (int(x + size/2), int(y + size/2)), int(size/2))
+        
+        # Desenhar setas para simbolizar velocidade
+        arrow_color = (200, 250, 255)  # Azul claro
+        center_x = x + size // 2
+        center_y = y + size // 2
+        
+        # Duas setas horizontais (esquerda e direita)
+        arrow_length = size * 0.6
+        arrow_width = size * 0.2
+                        
+        # Calcular componentes da seta que se movem com o tempo
+        offset = math.sin(ticks / 100) * 2
+        
+        # Seta para a direita
+        pygame.draw.polygon(surface, arrow_color, [
+            (center_x - arrow_width + offset, center_y - arrow_width),
+            (center_x + arrow_length/2 + offset, center_y),
+            (center_x - arrow_width + offset, center_y + arrow_width)
+        ])
+        
+        # Seta para a esquerda
+        pygame.draw.polygon(surface, arrow_color, [
+            (center_x + arrow_width - offset, center_y - arrow_width),
+            (center_x - arrow_length/2 - offset, center_y),
+            (center_x + arrow_width - offset, center_y + arrow_width)
+        ])
+        
+        # Círculo brilhante no centro
+        glow_radius = size // 6
+        pygame.draw.circle(surface, (200, 250, 255), (int(center_x), int(center_y)), glow_radius)
+
+
+def powerup_margin(size):
+    """Margem ao redor do power-up ocupada pelos espinhos."""
+    return size // 3 + 2
+
+
+def get_powerup_atlas(powerup_type, size):
+    """
+    Retorna o atlas com as POWERUP_PHASES fases da animação de um tipo.
+    
+    Returns:
+        tuple: (superfície com as fases lado a lado, retângulo de cada fase, margem)
+    """
+    key = (powerup_type, size)
+    atlas = _atlases.get(key)
+    if atlas is None:
+        margin = powerup_margin(size)
+        cell = size + 2 * margin
+        surface = pygame.Surface((cell * POWERUP_PHASES, cell), pygame.SRCALPHA)
+        frames = []
+        for phase in range(POWERUP_PHASES):
+            draw_powerup_frame(surface, powerup_type, phase * cell + margin, margin, size,
+                               phase * PULSE_PERIOD_MS / POWERUP_PHASES)
+            frames.append(pygame.Rect(phase * cell, 0, cell, cell))
+        atlas = _atlases[key] = (surface, tuple(frames), margin)
+    return atlas
+
+
+def powerup_phase(clock_ms):
+    """Retorna a fase da animação (0 a POWERUP_PHASES - 1) no instante informado."""
+    return int(clock_ms * POWERUP_PHASES / PULSE_PERIOD_MS) % POWERUP_PHASES
+
+
 class PowerUp:
     """Classe que representa um power-up na simulação."""
-    def __init__(self, x, y, powerup_type=None):
+    def __init__(self, x, y, powerup_type=None, rng=None):
         """
         Inicializa um power-up em uma posição específica
         
@@ -17,6 +151,7 @@ class PowerUp:
             x (float): Posição x do power-up
             y (float): Posição y do power-up
             powerup_type (str, optional): Tipo de power-up ('spikes' ou 'speed'). Se None, será aleatório.
+            rng (random.Random, optional): Gerador usado para sortear o tipo (o módulo random global se None)
         """
         self.x = x
         self.y = y
@@ -26,7 +161,7 @@ class PowerUp:
         # Definir tipo de power-up (spikes ou speed)
         if powerup_type is None:
             # 50% de chance para cada tipo
-            self.powerup_type = random.choice(['spikes', 'speed'])
+            self.powerup_type = (rng if rng is not None else random).choice(['spikes', 'speed'])
         else:
             self.powerup_type = powerup_type
             
@@ -36,90 +171,29 @@ class PowerUp:
         else:  # speed
             self.base_color = (50, 200, 255)  # Azul claro para velocidade
     
-    def draw(self, surface):
+    def draw(self, surface, clock_ms=None):
         """
         Desenha o power-up na superfície
         
         Args:
             surface: Superfície do pygame para desenhar
+            clock_ms (float, optional): Relógio da simulação em milissegundos,
+                que escolhe a fase da animação (pygame.time.get_ticks() se None)
         """
         if self.active:
-            # Efeito de pulsação para todos os power-ups
-            pulse = (math.sin(pygame.time.get_ticks() / 200) + 1) * 0.5 * 255
-            
-            # Desenhar power-up de acordo com o tipo
-            if self.powerup_type == 'spikes':
-                # Espinhos (amarelo pulsante para laranja)
-                color = (255, int(pulse), 0)
-                
-                # Círculo central
-                pygame.draw.circle(surface, color, (int(self.x + self.size/2), int(self.y + self.size/2)), int(self.size/2))
-                
-                # Desenhar pequenos triângulos ao redor para representar espinhos
-                spike_color = YELLOW
-                spike_length = self.size // 3
-                center_x = self.x + self.size // 2
-                center_y = self.y + self.size // 2
-                radius = self.size // 2
-                
-                # Desenhar 8 espinhos ao redor do círculo
-                for angle in range(0, 360, 45):
-                    rad_angle = math.radians(angle)
-                    # Ponto na borda do círculo
-                    edge_x = center_x + radius * math.cos(rad_angle)
-                    edge_y = center_y + radius * math.sin(rad_angle)
-                    # Ponto da ponta do espinho
-                    spike_x = center_x + (radius + spike_length) * math.cos(rad_angle)
-                    spike_y = center_y + (radius + spike_length) * math.sin(rad_angle)
-                    # Pontos laterais do triângulo
-                    side_angle1 = math.radians(angle + 20)
-                    side_angle2 = math.radians(angle - 20)
-                    side_dist = radius * 0.5
-                    side_x1 = center_x + side_dist * math.cos(side_angle1)
-                    side_y1 = center_y + side_dist * math.sin(side_angle1)
-                    side_x2 = center_x + side_dist * math.cos(side_angle2)
-                    side_y2 = center_y + side_dist * math.sin(side_angle2)
-                    
-                    # Desenhar o triângulo do espinho
-                    pygame.draw.polygon(surface, spike_color, [(edge_x, edge_y), (spike_x, spike_y), (side_x1, side_y1)])
-                    pygame.draw.polygon(surface, spike_color, [(edge_x, edge_y), (spike_x, spike_y), (side_x2, side_y2)])
+            if clock_ms is None:
+                clock_ms = pygame.time.get_ticks()
             
-            else:  # power-up de velocidade
-                # Círculo azul pulsante
-                color = (50, 150, int(pulse))  # Azul variando na intensidade
-                
-                # Círculo central
-                pygame.draw.circle(surface, color, (int(self.x + self.size/2), int(self.y + self.size/2)), int(self.size/2))
-                
-                # Desenhar setas para simbolizar velocidade
-                arrow_color = (200, 250, 255)  # Azul claro
-                center_x = self.x + self.size // 2
-                center_y = self.y + self.size // 2
-                
-                # Duas setas horizontais (esquerda e direita)
-                arrow_length = self.size * 0.6
-                arrow_width = self.size * 0.2
-                                
-                # Calcular componentes da seta que se movem com o tempo
-                offset = math.sin(pygame.time.get_ticks() / 100) * 2
-                
-                # Seta para a direita
-                pygame.draw.polygon(surface, arrow_color, [
-                    (center_x - arrow_width + offset, center_y - arrow_width),
-                    (center_x + arrow_length/2 + offset, center_y),
-                    (center_x - arrow_width + offset, center_y + arrow_width)
-                ])
-                
-                # Seta para a esquerda
-                pygame.draw.polygon(surface, arrow_color, [
-                    (center_x + arrow_width - offset, center_y - arrow_width),
-                    (center_x - arrow_length/2 - offset, center_y),
-                    (center_x + arrow_width - offset, center_y + arrow_width)
-                ])
-                
-                # Círculo brilhante no centro
-                glow_radius = self.size // 6
-                pygame.draw.circle(surface, (200, 250, 255), (int(center_x), int(center_y)), glow_radius)
+            # Um único blit da fase atual do atlas pré-renderizado
+            atlas, frames, margin = get_powerup_atlas(self.powerup_type, self.size)
+            surface.blit(atlas, (int(self.x) - margin, int(self.y) - margin),
+                         frames[powerup_phase(clock_ms)])
+    
+    def get_dirty_rect(self):
+        """Retorna o retângulo que cobre o desenho do power-up (incluindo os espinhos)."""
+        margin = powerup_margin(self.size)
+        return pygame.Rect(int(self.x) - margin, int(self.y) - margin,
+                           self.size + 2 * margin, self.size + 2 * margin)
     
     def check_collision(self, square):
         """
@@ -0,0 +1,166 @@
+"""
+Profiler de frame por subsistema para o jogo DVD Bounce Simulation.
+
+Enquanto o overlay está ligado (tecla F3), o loop principal marca o fim de cada
+etapa do frame com FrameProfiler.lap(). O tempo entre duas marcas é somado à
+etapa do frame atual e, no fim do frame, a linha inteira é copiada para um
+buffer circular NumPy de tamanho fixo: a instrumentação não cresce nem cria
+listas durante o jogo.
+
+O overlay mostra um histograma empilhado dos últimos frames (uma coluna por
+frame, uma cor por etapa) e, para cada etapa, a média e o p95 em milissegundos.
+"""
+import time
+import numpy as np
+import pygame
+from constants import WHITE, LIGHT_GRAY
+from text_cache import render_text
+
+# Etapas medidas, na ordem em que acontecem no frame, com rótulo e cor no overlay
+PROFILER_STAGES = (
+    ('events', "eventos", (200, 200, 200)),
+    ('other', "outros", (110, 110, 110)),
+    ('integrate', "integração", (70, 130, 230)),
+    ('map_collisions', "colisão mapa", (60, 190, 220)),
+    ('particle_update', "partículas (upd)", (240, 170, 60)),
+    ('pair_collisions', "colisão pares", (230, 80, 80)),
+    ('powerup_logic', "power-ups (upd)", (180, 90, 220)),
+    ('map', "render mapa", (80, 160, 80)),
+    ('powerups', "render power-ups", (200, 120, 240)),
+    ('particles', "render partículas", (250, 210, 90)),
+    ('squares', "render quadrados", (90, 200, 140)),
+    ('header', "render cabeçalho", (150, 220, 90)),
+    ('hud', "render HUD", (120, 180, 180)),
+    ('game_over', "render fim de jogo", (220, 140, 140)),
+    ('menu', "render menu", (170, 170, 90)),
+    ('profiler', "overlay", (90, 90, 140)),
+    ('present', "display.flip", (250, 250, 120))
+)
+
+STAGE_INDEX = {name: index for index, (name, _, _) in enumerate(PROFILER_STAGES)}
+
+# Orçamento de um frame a 60 FPS (linha de referência do histograma)
+FRAME_BUDGET_MS = 1000.0 / 60
+
+
+class FrameProfiler:
+    """Tempos por etapa dos últimos frames em um buffer circular."""
+    def __init__(self, history=240, refresh_frames=10):
+        """
+        Pré-aloca os buffers.
+
+        Args:
+            history (int, optional): Número de frames guardados
+            refresh_frames (int, optional): A cada quantos frames o overlay é redesenhado
+        """
+        self.history = np.zeros((history, len(PROFILER_STAGES)), dtype=np.float64)
+        self.current = np.zeros(len(PROFILER_STAGES), dtype=np.float64)
+        self.index = 0  # Próxima linha a ser escrita
+        self.frames = 0  # Frames gravados (até o tamanho do histórico)
+        self.last = time.perf_counter()
+
+        # Overlay em cache, redesenhado a cada refresh_frames frames
+        self.refresh_frames = refresh_frames
+        self.overlay = None
+        self.frames_since_refresh = 0
+
+    def begin_frame(self):
+        """Começa a contar o tempo de um novo frame."""
+        self.last = time.perf_counter()
+
+    def lap(self, stage):
+        """Soma o tempo desde a última marca à etapa informada."""
+        now = time.perf_counter()
+        self.current[STAGE_INDEX[stage]] += now - self.last
+        self.last = now
+
+    def end_frame(self):
+        """Copia os tempos do frame para o buffer circular e zera o frame atual."""
+        self.history[self.index] = self.current
+        self.current[:] = 0.0
+        self.index = (self.index + 1) % len(self.history)
+        self.frames = min(self.frames + 1, len(self.history))
+        self.frames_since_refresh += 1
+
+    def recent(self):
+        """Retorna os tempos (ms) dos frames guardados, do mais antigo ao mais novo."""
+        if self.frames < len(self.history):
+            rows = self.history[:self.frames]
+        else:
+            rows = np.roll(self.history, -self.index, axis=0)
+        return rows * 1000.0
+
+    def stats(self):
+        """Retorna média e p95 (ms) de cada etapa nos frames guardados."""
+        rows = self.recent()
+        if len(rows) == 0:
+            return {}
+        means = rows.mean(axis=0)
+        p95 = np.percentile(rows, 95, axis=0)
+        return {name: {'mean': float(means[i]), 'p95': float(p95[i])}
+                for i, (name, _, _) in enumerate(PROFILER_STAGES)}
+
+    def get_overlay(self, font, width=360, graph_height=90):
+        """
+        Retorna a superfície do overlay, redesenhada a cada refresh_frames frames.
+
+        Args:
+            font (pygame.font.Font): Fonte dos textos
+            width (int, optional): Largura do painel
+            graph_height (int, optional): Altura do histograma
+        """
+        if self.overlay is not None and self.frames_since_refresh < self.refresh_frames:
+            return self.overlay
+        self.frames_since_refresh = 0
+
+        line_height = font.get_linesize()
+        height = graph_height + 30 + line_height * (len(PROFILER_STAGES) + 1)
+        overlay = pygame.Surface((width, height), pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 190))
+
+        rows = self.recent()
+        graph_top = 10
+        graph_bottom = graph_top + graph_height
+
+        # Histograma empilhado: uma coluna por frame, escala de 2x o orçamento
+        if len(rows):
+            scale = graph_height / (FRAME_BUDGET_MS * 2)
+            column_width = (width - 20) / len(self.history)
+            for column, frame in enumerate(rows):
+                x = int(10 + column * column_width)
+                w = max(1, int(column_width))
+                y = graph_bottom
+                for (_, _, color), value in zip(PROFILER_STAGES, frame):
+                    h = value * scale
+                    if h < 0.5:
+                        continue
+                    top = max(graph_top, int(y - h))
+                    pygame.draw.rect(overlay, color, (x, top, w, max(1, int(y) - top)))
+                    y -= h
+                    if y <= graph_top:
+                        break
+
+        # Linha do orçamento de 16.6 ms
+        budget_y = graph_bottom - int(FRAME_BUDGET_MS * graph_height / (FRAME_BUDGET_MS * 2))
+        pygame.draw.line(overlay, WHITE, (10, budget_y), (width - 10, budget_y), 1)
+
+        # Tabela com média e p95 de cada etapa
+        stats = self.stats()
+        total = rows.sum(axis=1) if len(rows) else np.zeros(1)
+        y = graph_bottom + 10
+        # Números mudam a cada atualização: não vale a pena passar pelo cache de textos
+        overlay.blit(render_text(font, "frame (ms)", True, WHITE), (10, y))
+        values = font.render(f"média {total.mean():6.2f}  p95 {np.percentile(total, 95):6.2f}",
+                             True, WHITE)
+        overlay.blit(values, (width - 10 - values.get_width(), y))
+        y += line_height + 4
+        for name, label, color in PROFILER_STAGES:
+            pygame.draw.rect(overlay, color, (10, y + line_height // 4, 10, line_height // 2))
+            entry = stats.get(name, {'mean': 0.0, 'p95': 0.0})
+            overlay.blit(render_text(font, label, True, LIGHT_GRAY), (26, y))
+            values = font.render(f"{entry['mean']:6.2f}  {entry['p95']:6.2f}", True, LIGHT_GRAY)
+            overlay.blit(values, (width - 10 - values.get_width(), y))
+            y += line_height
+
+        self.overlay = overlay
+        return overlay
@@ -0,0 +1,108 @@
+"""
+Gravação e reprodução de partidas para o jogo DVD Bounce Simulation.
+
+Um replay não guarda frames: só a semente da partida, a configuração inicial,
+o backend de física e as ações do jogador (menu, reinício, redimensionamento)
+com o tick em que aconteceram. Como a física usa fluxos aleatórios derivados
+da semente, reexecutar a simulação sem janela reproduz a partida inteira.
+"""
+import json
+
+REPLAY_VERSION = 1
+
+
+class ReplayRecorder:
+    """Acumula os dados de um replay durante uma partida."""
+    def __init__(self, path=None):
+        """
+        Inicializa o gravador.
+        
+        Args:
+            path (str, optional): Arquivo onde o replay é salvo ao final da partida
+        """
+        self.path = path
+        self.data = None
+    
+    def start(self, seed, config, physics='python'):
+        """Registra a semente, a configuração inicial e o backend de física."""
+        self.data = {
+            'version': REPLAY_VERSION,
+            'seed': seed,
+            'physics': physics,
+            'config': dict(config),
+            'events': [],
+            'ticks': 0
+        }
+    
+    def record(self, tick, action, *args):
+        """Registra uma ação do jogador no tick em que ela aconteceu."""
+        if self.data is not None:
+            self.data['events'].append([tick, action, *args])
+    
+    def finish(self, ticks):
+        """Registra a duração total da partida e salva o arquivo (se houver)."""
+        if self.data is None:
+            return
+        self.data['ticks'] = ticks
+        if self.path:
+            save_replay(self.data, self.path)
+            print(f"Replay salvo em: {self.path}")
+
+
+def save_replay(data, path):
+    """Salva um replay em JSON compacto."""
+    with open(path, 'w', encoding='utf-8') as replay_file:
+        json.dump(data, replay_file, separators=(',', ':'))
+
+
+def load_replay(path):
+    """Carrega um replay salvo com save_replay."""
+    with open(path, encoding='utf-8') as replay_file:
+        data = json.load(replay_file)
+    
+    if data.get('version') != REPLAY_VERSION:
+        raise ValueError(f"Versão de replay não suportada: {data.get('version')}")
+    return data
+
+
+def play_replay(data, max_ticks=None):
+    """
+    Reexecuta um replay sem janela, o mais rápido possível.
+    
+    Args:
+        data (dict): Replay carregado com load_replay
+        max_ticks (int, optional): Para a reprodução antes do fim do replay
+        
+    Returns:
+        tuple: (game, ticks) com o jogo no estado final e o número de ticks simulados
+    """
+    from game import Game
+    
+    game = Game(headless=True, physics=data.get('physics', 'python'), seed=data['seed'])
+    game.apply_config(data['config'])
+    game.create_squares()
+    game.running = True
+    
+    total_ticks = data['ticks']
+    if max_ticks is not None:
+        total_ticks = min(total_ticks, max_ticks)
+    
+    events = data['events']
+    next_event = 0
+    
+    for tick in range(total_ticks):
+        game.tick_count = tick
+        
+        # Aplicar as ações registradas antes deste tick
+        while next_event < len(events) and events[next_event][0] <= tick:
+            _, action, *args = events[next_event]
+            game.perform(action, *args)
+            next_event += 1
+        
+        if not game.running:
+            return game, tick
+        
+        game.update()
+    
+    game.tick_count = total_ticks
+    return game, total_ticks
@@ -0,0 +1,36 @@
+"""
+Geradores de números aleatórios por partida para o jogo DVD Bounce Simulation.
+
+Cada partida tem uma semente. A partir dela saem fluxos independentes: um para
+a física (velocidades, colisões, posições de nascimento, power-ups) e sementes
+derivadas para os geradores NumPy, entre eles o das partículas, o único efeito
+cosmético aleatório. Assim os efeitos visuais nunca alteram o resultado da
+partida, e a mesma semente reproduz sempre a mesma simulação.
+"""
+import random
+
+
+class MatchRandom:
+    """Fluxos de números aleatórios de uma partida, derivados de uma única semente."""
+    def __init__(self, seed=None):
+        """
+        Inicializa os fluxos.
+        
+        Args:
+            seed (int, optional): Semente da partida (aleatória se None)
+        """
+        if seed is None:
+            seed = random.SystemRandom().randrange(2 ** 32)
+        self.seed = seed
+        
+        # Fluxo que afeta o resultado da partida
+        self.physics = random.Random(f"{seed}:physics")
+    
+    def derive_seed(self, name):
+        """
+        Retorna uma semente inteira estável para outro gerador (ex.: NumPy).
+        
+        Args:
+            name (str): Nome do fluxo derivado
+        """
+        return random.Random(f"{self.seed}:{name}").getrandbits(64)
@@ -6,88 +6,204 @@ import math
 import pygame
 import os
 from constants import WHITE, YELLOW, COLLISION_FLASH_DURATION
+from assets import ASSETS
+from cache import LRUCache, surface_bytes
 
+# Rastro do speed boost: cópias do quadrado cada vez mais transparentes
+TRAIL_LENGTH = 10
+TRAIL_ALPHA = 30
+TRAIL_COLOR = (50, 150, 255)
 
-class Particle:
-    """Classe para representar uma partícula da explosão."""
-    def __init__(self, x, y, color):
-        self.x = x
-        self.y = y
-        self.color = color
-        self.size = random.randint(2, 5)
-        self.lifetime = random.randint(30, 60)  # Duração em frames
-        
-        # Velocidade aleatória em todas as direções
-        speed = random.uniform(1, 5)
-        angle = random.uniform(0, 2 * math.pi)
-        self.vx = speed * math.cos(angle)
-        self.vy = speed * math.sin(angle)
-        
-        # Fade out gradual
-        self.fade_speed = random.uniform(0.01, 0.05)
-        self.alpha = 1.0  # Transparência inicial
+# Flash na parede: linha de 3 pixels centrada na borda da área (só 2 ficam dentro)
+# cobrindo o lado do quadrado com 20 pixels de folga
+FLASH_WIDTH = 3
+FLASH_MARGIN = 20
+
+# Faixas brancas translúcidas do flash, por (largura, altura, transparência)
+FLASH_STRIPS = LRUCache(max_bytes=1024 * 1024, sizeof=surface_bytes)
+
+# Coroas de espinhos pré-desenhadas, por (tamanho, comprimento dos espinhos)
+SPIKE_SPRITES = LRUCache(max_bytes=4 * 1024 * 1024, sizeof=surface_bytes)
+
+# Retângulos translúcidos do rastro, por tamanho (uma tupla com todos os passos)
+TRAIL_SPRITES = LRUCache(max_bytes=4 * 1024 * 1024, sizeof=lambda sprites: sum(map(surface_bytes, sprites)))
+
+
+def get_trail_sprites(width, height):
+    """
+    Retorna os retângulos do rastro (do mais próximo ao mais distante).
     
-    def update(self):
-        """Atualiza a partícula."""
-        self.x += self.vx
-        self.y += self.vy
-        
-        # Adicionar gravidade leve
-        self.vy += 0.05
-        
-        # Reduzir vida
-        self.lifetime -= 1
-        
-        # Reduzir transparência
-        self.alpha = max(0, self.alpha - self.fade_speed)
-        
-        # Reduzir tamanho gradualmente
-        if self.size > 0.5:
-            self.size -= 0.1
+    Criados uma única vez por tamanho; as superfícies são compartilhadas.
+    """
+    key = (width, height)
+    sprites = TRAIL_SPRITES.get(key)
+    if sprites is None:
+        sprites = []
+        for i in range(1, TRAIL_LENGTH + 1):
+            sprite = pygame.Surface((width, height), pygame.SRCALPHA)
+            sprite.fill((*TRAIL_COLOR, TRAIL_ALPHA - i * 2))
+            sprites.append(sprite)
+        sprites = TRAIL_SPRITES.put(key, tuple(sprites))
+    return sprites
+
+
+def build_flash_sprite(image):
+    """Pré-compõe a imagem com o flash branco de invencibilidade."""
+    sprite = image.copy()
+    white_overlay = pygame.Surface(image.get_size(), pygame.SRCALPHA)
+    white_overlay.fill((255, 255, 255, 150))  # Branco semi-transparente
+    sprite.blit(white_overlay, (0, 0))
+    return sprite
+
+
+def build_glow_sprite(image):
+    """Pré-compõe a imagem com a borda de brilho azul do speed boost."""
+    sprite = image.copy()
+    width, height = image.get_size()
+    glow_surface = pygame.Surface((width, height), pygame.SRCALPHA)
+    pygame.draw.rect(glow_surface, (50, 150, 255, 50), (0, 0, width, height), 5)
+    sprite.blit(glow_surface, (0, 0))
+    return sprite
+
+
+def get_flash_strip(width, height, alpha):
+    """Retorna a faixa branca do flash na parede (criada uma única vez por chave)."""
+    key = (width, height, alpha)
+    strip = FLASH_STRIPS.get(key)
+    if strip is None:
+        strip = pygame.Surface((width, height), pygame.SRCALPHA)
+        strip.fill((255, 255, 255, alpha))
+        strip = FLASH_STRIPS.put(key, strip)
+    return strip
+
+
+def spike_padding(length):
+    """Margem ao redor do quadrado no sprite dos espinhos (ponta + círculo)."""
+    return length + 3
+
+
+def build_spike_sprite(size, length):
+    """
+    Desenha a coroa de espinhos de um quadrado em uma superfície transparente.
     
-    def draw(self, surface):
-        """Desenha a partícula."""
-        if self.lifetime <= 0 or self.alpha <= 0:
-            return
-        
-        # Ajustar cor com base na transparência
-        r, g, b = self.color
-        color_with_alpha = (r, g, b, int(self.alpha * 255))
-        
-        # Criar superfície com suporte a transparência
-        particle_surface = pygame.Surface((int(self.size * 2), int(self.size * 2)), pygame.SRCALPHA)
-        pygame.draw.circle(particle_surface, color_with_alpha, (int(self.size), int(self.size)), int(self.size))
-        
-        # Desenhar na superfície principal
-        surface.blit(particle_surface, (int(self.x - self.size), int(self.y - self.size)))
+    O quadrado ocupa (pad, pad, size, size), com pad = spike_padding(length).
+    
+    Args:
+        size (int): Tamanho do quadrado
+        length (int): Comprimento dos espinhos nesta fase da pulsação
+    """
+    pad = spike_padding(length)
+    sprite = pygame.Surface((size + 2 * pad, size + 2 * pad), pygame.SRCALPHA)
+    left = top = pad
+    base_color = YELLOW
+    tip_color = (255, 150, 0)  # Laranja para a ponta
+    
+    # Número de espinhos por lado
+    num_spikes = 4
+    
+    # Espinhos superiores
+    for i in range(num_spikes):
+        x_pos = left + (i + 1) * size // (num_spikes + 1)
+        # Criar pontos para um espinho mais elegante
+        left_point = (x_pos - length//3, top - length//2)
+        right_point = (x_pos + length//3, top - length//2)
+        tip_point = (x_pos, top - length)
+        
+        # Desenhar o corpo principal do espinho
+        pygame.draw.polygon(sprite, base_color, [
+            (x_pos, top),
+            left_point,
+            tip_point,
+            right_point
+        ])
+        
+        # Desenhar uma linha brilhante no centro do espinho
+        pygame.draw.line(sprite, tip_color, (x_pos, top), tip_point, 2)
+        
+        # Desenhar um pequeno círculo brilhante na ponta
+        pygame.draw.circle(sprite, (255, 255, 200), tip_point, 2)
+    
+    # Espinhos inferiores
+    for i in range(num_spikes):
+        x_pos = left + (i + 1) * size // (num_spikes + 1)
+        # Criar pontos para um espinho mais elegante
+        left_point = (x_pos - length//3, top + size + length//2)
+        right_point = (x_pos + length//3, top + size + length//2)
+        tip_point = (x_pos, top + size + length)
+        
+        # Desenhar o corpo principal do espinho
+        pygame.draw.polygon(sprite, base_color, [
+            (x_pos, top + size),
+            left_point,
+            tip_point,
+            right_point
+        ])
+        
+        # Desenhar uma linha brilhante no centro do espinho
+        pygame.draw.line(sprite, tip_color, (x_pos, top + size), tip_point, 2)
+        
+        # Desenhar um pequeno círculo brilhante na ponta
+        pygame.draw.circle(sprite, (255, 255, 200), tip_point, 2)
+    
+    # Espinhos laterais esquerdos
+    for i in range(num_spikes):
+        y_pos = top + (i + 1) * size // (num_spikes + 1)
+        # Criar pontos para um espinho mais elegante
+        top_point = (left - length//2, y_pos - length//3)
+        bottom_point = (left - length//2, y_pos + length//3)
+        tip_point = (left - length, y_pos)
+        
+        # Desenhar o corpo principal do espinho
+        pygame.draw.polygon(sprite, base_color, [
+            (left, y_pos),
+            top_point,
+            tip_point,
+            bottom_point
+        ])
+        
+        # Desenhar uma linha brilhante no centro do espinho
+        pygame.draw.line(sprite, tip_color, (left, y_pos), tip_point, 2)
+        
+        # Desenhar um pequeno círculo brilhante na ponta
+        pygame.draw.circle(sprite, (255, 255, 200), tip_point, 2)
+    
+    # Espinhos laterais direitos
+    for i in range(num_spikes):
+        y_pos = top + (i + 1) * size // (num_spikes + 1)
+        # Criar pontos para um espinho mais elegante
+        top_point = (left + size + length//2, y_pos - length//3)
+        bottom_point = (left + size + length//2, y_pos + length//3)
+        tip_point = (left + size + length, y_pos)
+        
+        # Desenhar o corpo principal do espinho
+        pygame.draw.polygon(sprite, base_color, [
+            (left + size, y_pos),
+            top_point,
+            tip_point,
+            bottom_point
+        ])
+        
+        # Desenhar uma linha brilhante no centro do espinho
+        pygame.draw.line(sprite, tip_color, (left + size, y_pos), tip_point, 2)
+        
+        # Desenhar um pequeno círculo brilhante na ponta
+        pygame.draw.circle(sprite, (255, 255, 200), tip_point, 2)
     
-    def is_alive(self):
-        """Verifica se a partícula ainda está viva."""
-        return self.lifetime > 0 and self.alpha > 0
+    return sprite
 
 
-class WallParticle(Particle):
-    """Classe para representar uma partícula de colisão com parede."""
-    def __init__(self, x, y, color, angle_range):
-        super().__init__(x, y, color)
-        
-        # Redefinir propriedades para partículas de colisão com parede
-        self.size = random.uniform(1.5, 3.5)
-        self.lifetime = random.randint(15, 25)  # Vida mais curta
-        
-        # Velocidade baseada no ângulo de colisão
-        angle = math.radians(random.uniform(angle_range[0], angle_range[1]))
-        speed = random.uniform(2, 5)
-        self.vx = speed * math.cos(angle)
-        self.vy = speed * math.sin(angle)
-        
-        # Fade mais rápido
-        self.fade_speed = random.uniform(0.05, 0.1)
+def get_spike_sprite(size, length):
+    """Retorna a coroa de espinhos (criada uma única vez por tamanho e fase)."""
+    key = (size, length)
+    sprite = SPIKE_SPRITES.get(key)
+    if sprite is None:
+        sprite = SPIKE_SPRITES.put(key, build_spike_sprite(size, length))
+    return sprite
 
 
 class Square:
     """Classe que representa um quadrado na simulação."""
-    def __init__(self, x, y, size, color, name=None, color_index=0):
+    def __init__(self, x, y, size, color, name=None, color_index=0, rng=None):
         """
         Inicializa um quadrado com posição, tamanho e cor específicos.
         
@@ -98,7 +214,10 @@ class Square:
             color (tuple): Cor RGB do quadrado
             name (str, optional): Nome personalizado do quadrado
             color_index (int, optional): Índice da cor (para nomes padrão)
+            rng (random.Random, optional): Gerador usado pela física deste quadrado
+                (o módulo random global se None)
         """
+        self.rng = rng if rng is not None else random
         self.x = x
         self.y = y
         self.size = size
@@ -117,6 +236,7 @@ class Square:
         
         # Imagem personalizada (opcional)
         self.image = None
+        self.image_path = None  # Arquivo da imagem (chave das variantes no ASSETS)
         self.use_image = False  # Flag para controlar o uso da imagem
         
         # Sistema de vidas
@@ -143,16 +263,16 @@ class Square:
         self.max_speed = 4.5
         
         # Velocidade inicial aleatória
-        angle = random.uniform(0, 2 * math.pi)
-        speed = random.uniform(1.5, 4.5)  # Valores padrão iniciais
+        angle = self.rng.uniform(0, 2 * math.pi)
+        speed = self.rng.uniform(1.5, 4.5)  # Valores padrão iniciais
         self.vx = speed * math.cos(angle)
         self.vy = speed * math.sin(angle)
         
         # Massa (para cálculos de colisão realistas)
         self.mass = size * size  # Proporcional à área
         
-        # Partículas para explosão
-        self.particles = []
+        # Sistema de partículas compartilhado (configurado pelo Game)
+        self.particle_system = None
         
         # Rastreamento de quem eliminou este quadrado
         self.killed_by = None
@@ -162,7 +282,6 @@ class Square:
         self.wall_collision_timer = 0
         self.wall_collision_side = None
         self.wall_collision_position = (0, 0)
-        self.wall_particles = []
         
         # Efeito de compressão ao colidir
         self.compression = 1.0  # 1.0 = sem compressão
@@ -181,9 +300,10 @@ class Square:
             return False
             
         try:
+            # Decodificada uma única vez e compartilhada entre quadrados e partidas
             print(f"Carregando imagem: {image_path}")
-            self.image = pygame.image.load(image_path).convert_alpha()
-            self.image = pygame.transform.scale(self.image, (self.size, self.size))
+            self.image = ASSETS.get_scaled(image_path, (self.size, self.size))
+            self.image_path = image_path
             self.use_image = True
             print(f"Imagem carregada com sucesso: {image_path}")
             return True
@@ -193,6 +313,31 @@ class Square:
             self.use_image = False
             return False
     
+    def get_sprite(self, width, height):
+        """
+        Retorna a imagem do quadrado no tamanho e com o efeito atuais.
+        
+        O flash branco (invencível piscando) tem prioridade sobre o brilho azul
+        do speed boost.
+        
+        Args:
+            width (int): Largura comprimida/esticada
+            height (int): Altura comprimida/esticada
+        """
+        if self.image_path is None:
+            # Imagem atribuída diretamente, sem passar pelo ASSETS
+            if (width, height) == self.image.get_size():
+                return self.image
+            return pygame.transform.scale(self.image, (width, height))
+        
+        base_size = (self.size, self.size)
+        size = (width, height)
+        if self.invincible_timer > 0 and self.invincible_timer % 8 < 4:
+            return ASSETS.get_variant(self.image_path, base_size, size, 'flash', build_flash_sprite)
+        if self.speed_boost:
+            return ASSETS.get_variant(self.image_path, base_size, size, 'glow', build_glow_sprite)
+        return ASSETS.get_variant(self.image_path, base_size, size)
+    
     def set_area(self, area_x, area_y, area_size):
         """Define a área de jogo para colisões."""
         self.area_x = area_x
@@ -237,21 +382,17 @@ class Square:
             # Armazenar qual quadrado eliminou este
             self.killed_by = attacker
     
+    def set_particle_system(self, particle_system):
+        """Define o sistema de partículas usado pelos efeitos do quadrado."""
+        self.particle_system = particle_system
+    
     def explode(self):
         """Cria a animação de explosão quando o quadrado perde todas as vidas."""
-        # Criar partículas a partir do centro do quadrado
-        center_x = self.x + self.size / 2
-        center_y = self.y + self.size / 2
-        
-        # Gerar várias partículas com a cor do quadrado
-        num_particles = 50
-        for _ in range(num_particles):
-            # Posição aleatória dentro do quadrado
-            particle_x = random.uniform(self.x, self.x + self.size)
-            particle_y = random.uniform(self.y, self.y + self.size)
-            
-            # Criar partícula com a cor do quadrado
-            self.particles.append(Particle(particle_x, particle_y, self.original_color))
+        if self.particle_system is None:
+            return
+        
+        # Gerar várias partículas com a cor do quadrado, em posições aleatórias dentro dele
+        self.particle_system.spawn_explosion(self.x, self.y, self.size, self.original_color, 50)
     
     def create_wall_particles(self, side, position):
         """
@@ -261,7 +402,9 @@ class Square:
             side (str): Lado da colisão ('left', 'right', 'top', 'bottom')
             position (tuple): Posição (x, y) da colisão
         """
-        num_particles = random.randint(6, 10)
+        if self.particle_system is None:
+            return
+        
         x, y = position
         
         # Definir ângulo de dispersão baseado no lado da colisão
@@ -274,18 +417,12 @@ class Square:
         else:  # bottom
             angle_range = (240, 300)  # Partículas para cima
         
+        # Cor baseada na cor original do quadrado, mas mais brilhante
+        r, g, b = self.original_color
+        particle_color = (min(255, r + 80), min(255, g + 80), min(255, b + 80))
+        
         # Criar partículas coloridas
-        for _ in range(num_particles):
-            # Variação na posição para efeito mais natural
-            particle_x = x + random.uniform(-5, 5)
-            particle_y = y + random.uniform(-5, 5)
-            
-            # Cor baseada na cor original do quadrado, mas mais brilhante
-            r, g, b = self.original_color
-            particle_color = (min(255, r + 80), min(255, g + 80), min(255, b + 80))
-            
-            # Criar e adicionar a partícula
-            self.wall_particles.append(WallParticle(particle_x, particle_y, particle_color, angle_range))
+        self.particle_system.spawn_wall(x, y, particle_color, angle_range)
     
     def handle_wall_collision(self):
         """Verifica e trata colisões com as paredes da área restrita."""
@@ -388,12 +525,8 @@ class Square:
     
     def update(self):
         """Atualiza a posição e velocidade do quadrado"""
-        # Atualizar partículas se o quadrado explodiu
+        # Quadrados eliminados não se movem (a explosão é do sistema de partículas)
         if not self.is_alive:
-            for particle in self.particles:
-                particle.update()
-            # Remover partículas mortas
-            self.particles = [p for p in self.particles if p.is_alive()]
             return
         
         # Reduzir timer de invencibilidade e aplicar efeito de piscar
@@ -433,12 +566,6 @@ class Square:
                 if self.compression > 0.98:
                     self.compression = 1.0
         
-        # Atualizar partículas de colisão com parede
-        for particle in self.wall_particles:
-            particle.update()
-        # Remover partículas que acabaram
-        self.wall_particles = [p for p in self.wall_particles if p.is_alive()]
-        
         # Atualizar timer de espinhos
         if self.has_spikes and self.spike_timer > 0:
             self.spike_timer -= 1
@@ -474,8 +601,8 @@ class Square:
                     self.vy *= ratio
         
         # Variar levemente a velocidade ao longo do tempo (extra)
-        self.vx += random.uniform(-0.03, 0.03)
-        self.vy += random.uniform(-0.03, 0.03)
+        self.vx += self.rng.uniform(-0.03, 0.03)
+        self.vy += self.rng.uniform(-0.03, 0.03)
         
         # Limitar a velocidade mínima e máxima
         speed = math.sqrt(self.vx**2 + self.vy**2)
@@ -487,17 +614,22 @@ class Square:
             self.vx = self.vx / speed * self.max_speed
             self.vy = self.vy / speed * self.max_speed
     
-    def draw(self, surface):
-        """Desenha o quadrado na superfície"""
-        # Desenhar partículas se o quadrado explodiu
+    def draw(self, surface, clock_ms=None):
+        """
+        Desenha o quadrado na superfície
+        
+        Args:
+            surface: Superfície do pygame para desenhar
+            clock_ms (float, optional): Relógio da simulação em milissegundos, que
+                controla o piscar do speed boost e a pulsação dos espinhos
+                (pygame.time.get_ticks() se None)
+        """
+        # Quadrados eliminados não são desenhados (a explosão é do sistema de partículas)
         if not self.is_alive:
-            for particle in self.particles:
-                particle.draw(surface)
             return
         
-        # Desenhar partículas de colisão com parede
-        for particle in self.wall_particles:
-            particle.draw(surface)
+        if clock_ms is None:
+            clock_ms = pygame.time.get_ticks()
         
         # Calcular dimensões com compressão para efeito de bounce
         width = self.size
@@ -522,195 +654,112 @@ class Square:
         
         # Preparar a cor do quadrado (se tiver speed boost, adicionar efeito azulado)
         current_color = self.color
-        if self.speed_boost and pygame.time.get_ticks() % 10 < 5:  # Piscar rápido
+        if self.speed_boost and clock_ms % 10 < 5:  # Piscar rápido
             # Adicionar um tom azulado
             r, g, b = self.color
             current_color = (max(0, r-30), max(0, g-30), min(255, b+80))
         
         # Desenhar o quadrado base (com imagem ou cor sólida)
         if self.use_image and self.image:
-            # Se estiver com compressão, redimensionar a imagem
-            if self.compression < 1.0:
-                scaled_image = pygame.transform.scale(self.image, (width, height))
-            else:
-                scaled_image = self.image
-                
-            # Se estiver invencível e piscando, mostrar efeito
-            if self.invincible_timer > 0 and self.invincible_timer % 8 < 4:
-                # Criar uma superfície branca semitransparente
-                white_overlay = pygame.Surface((width, height), pygame.SRCALPHA)
-                white_overlay.fill((255, 255, 255, 150))  # Branco semi-transparente
-                
-                # Desenhar primeiro a imagem e depois o overlay
-                surface.blit(scaled_image, (int(adjusted_x), int(adjusted_y)))
-                surface.blit(white_overlay, (int(adjusted_x), int(adjusted_y)))
-            else:
-                # Desenhar apenas a imagem
-                surface.blit(scaled_image, (int(adjusted_x), int(adjusted_y)))
-                
-                # Se tiver speed boost, desenhar um brilho azul ao redor
-                if self.speed_boost:
-                    # Superfície para o brilho
-                    glow_surface = pygame.Surface((width+20, height+20), pygame.SRCALPHA)
-                    pygame.draw.rect(glow_surface, (50, 150, 255, 50), (10, 10, width, height), 5)
-                    surface.blit(glow_surface, (int(adjusted_x-10), int(adjusted_y-10)))
+            # Um único blit: a compressão só gera poucos tamanhos inteiros, e
+            # cada (tamanho, efeito) é pré-renderizado uma vez no ASSETS
+            surface.blit(self.get_sprite(width, height), (int(adjusted_x), int(adjusted_y)))
         else:
             # Usar cor sólida se não tiver imagem ou se use_image for False
             pygame.draw.rect(surface, current_color, (adjusted_x, adjusted_y, width, height))
             
-            # Se tiver speed boost, desenhar um brilho azul ao redor
+            # Se tiver speed boost, desenhar um rastro azul de velocidade
             if self.speed_boost:
-                # Efeito de rastro azul de velocidade
-                trail_length = 10
-                trail_alpha = 30
-                for i in range(1, trail_length+1):
-                    trail_x = adjusted_x - self.vx * i * 0.2
-                    trail_y = adjusted_y - self.vy * i * 0.2
-                    trail_surface = pygame.Surface((width, height), pygame.SRCALPHA)
-                    trail_color = (50, 150, 255, trail_alpha - i * 2)
-                    pygame.draw.rect(trail_surface, trail_color, (0, 0, width, height))
-                    surface.blit(trail_surface, (int(trail_x), int(trail_y)))
+                # Retângulos pré-renderizados: só blits, nenhuma superfície nova
+                vx, vy = self.vx, self.vy
+                blit = surface.blit
+                for i, trail_sprite in enumerate(get_trail_sprites(width, height), 1):
+                    blit(trail_sprite, (int(adjusted_x - vx * i * 0.2), int(adjusted_y - vy * i * 0.2)))
         
         # Desenhar efeito de flash na borda se houve colisão recente
         if self.wall_collision and self.wall_collision_timer > 0:
-            # Intensidade do flash baseada no timer
-            flash_alpha = int(min(200, 255 * (self.wall_collision_timer / COLLISION_FLASH_DURATION)))
-            flash_color = (255, 255, 255, flash_alpha)
-            flash_width = 3  # Espessura da linha do flash
-            
-            # Criar superfície com suporte a transparência
-            flash_surface = pygame.Surface((self.area_size, self.area_size), pygame.SRCALPHA)
-            
-            # Desenhar o flash de acordo com o lado da colisão
-            if self.wall_collision_side == 'left':
-                # Flash na parede esquerda
-                pygame.draw.line(flash_surface, flash_color, 
-                                 (0, max(0, self.y - self.area_y - 20)), 
-                                 (0, min(self.area_size, self.y + self.size - self.area_y + 20)), 
-                                 flash_width)
-            elif self.wall_collision_side == 'right':
-                # Flash na parede direita
-                pygame.draw.line(flash_surface, flash_color, 
-                                 (self.area_size - 1, max(0, self.y - self.area_y - 20)), 
-                                 (self.area_size - 1, min(self.area_size, self.y + self.size - self.area_y + 20)), 
-                                 flash_width)
-            elif self.wall_collision_side == 'top':
-                # Flash na parede superior
-                pygame.draw.line(flash_surface, flash_color, 
-                                 (max(0, self.x - self.area_x - 20), 0), 
-                                 (min(self.area_size, self.x + self.size - self.area_x + 20), 0), 
-                                 flash_width)
-            elif self.wall_collision_side == 'bottom':
-                # Flash na parede inferior
-                pygame.draw.line(flash_surface, flash_color, 
-                                 (max(0, self.x - self.area_x - 20), self.area_size - 1), 
-                                 (min(self.area_size, self.x + self.size - self.area_x + 20), self.area_size - 1), 
-                                 flash_width)
-            
-            # Desenhar a superfície de flash no jogo
-            surface.blit(flash_surface, (self.area_x, self.area_y))
+            flash_rect = self.get_wall_flash_rect()
+            if flash_rect is not None:
+                # Intensidade do flash baseada no timer
+                flash_alpha = int(min(200, 255 * (self.wall_collision_timer / COLLISION_FLASH_DURATION)))
+                surface.blit(get_flash_strip(flash_rect.width, flash_rect.height, flash_alpha), flash_rect)
         
         # Desenhar espinhos se o quadrado tiver espinhos
         if self.has_spikes:
             # Definir parâmetros para os espinhos
             spike_length = self.size // 2.5
-            base_color = YELLOW
-            tip_color = (255, 150, 0)  # Laranja para a ponta
             
             # Adicionar pulsação aos espinhos
-            pulse = (math.sin(pygame.time.get_ticks() / 200) + 1) * 0.2 + 0.8  # 0.8 a 1.2
+            pulse = (math.sin(clock_ms / 200) + 1) * 0.2 + 0.8  # 0.8 a 1.2
             adjusted_length = int(spike_length * pulse)
             
-            # Número de espinhos por lado
-            num_spikes = 4
-            
-            # Espinhos superiores
-            for i in range(num_spikes):
-                x_pos = self.x + (i + 1) * self.size // (num_spikes + 1)
-                # Criar pontos para um espinho mais elegante
-                left_point = (x_pos - adjusted_length//3, self.y - adjusted_length//2)
-                right_point = (x_pos + adjusted_length//3, self.y - adjusted_length//2)
-                tip_point = (x_pos, self.y - adjusted_length)
-                
-                # Desenhar o corpo principal do espinho
-                pygame.draw.polygon(surface, base_color, [
-                    (x_pos, self.y),
-                    left_point,
-                    tip_point,
-                    right_point
-                ])
-                
-                # Desenhar uma linha brilhante no centro do espinho
-                pygame.draw.line(surface, tip_color, (x_pos, self.y), tip_point, 2)
-                
-                # Desenhar um pequeno círculo brilhante na ponta
-                pygame.draw.circle(surface, (255, 255, 200), tip_point, 2)
-            
-            # Espinhos inferiores
-            for i in range(num_spikes):
-                x_pos = self.x + (i + 1) * self.size // (num_spikes + 1)
-                # Criar pontos para um espinho mais elegante
-                left_point = (x_pos - adjusted_length//3, self.y + self.size + adjusted_length//2)
-                right_point = (x_pos + adjusted_length//3, self.y + self.size + adjusted_length//2)
-                tip_point = (x_pos, self.y + self.size + adjusted_length)
-                
-                # Desenhar o corpo principal do espinho
-                pygame.draw.polygon(surface, base_color, [
-                    (x_pos, self.y + self.size),
-                    left_point,
-                    tip_point,
-                    right_point
-                ])
-                
-                # Desenhar uma linha brilhante no centro do espinho
-                pygame.draw.line(surface, tip_color, (x_pos, self.y + self.size), tip_point, 2)
-                
-                # Desenhar um pequeno círculo brilhante na ponta
-                pygame.draw.circle(surface, (255, 255, 200), tip_point, 2)
-            
-            # Espinhos laterais esquerdos
-            for i in range(num_spikes):
-                y_pos = self.y + (i + 1) * self.size // (num_spikes + 1)
-                # Criar pontos para um espinho mais elegante
-                top_point = (self.x - adjusted_length//2, y_pos - adjusted_length//3)
-                bottom_point = (self.x - adjusted_length//2, y_pos + adjusted_length//3)
-                tip_point = (self.x - adjusted_length, y_pos)
-                
-                # Desenhar o corpo principal do espinho
-                pygame.draw.polygon(surface, base_color, [
-                    (self.x, y_pos),
-                    top_point,
-                    tip_point,
-                    bottom_point
-                ])
-                
-                # Desenhar uma linha brilhante no centro do espinho
-                pygame.draw.line(surface, tip_color, (self.x, y_pos), tip_point, 2)
-                
-                # Desenhar um pequeno círculo brilhante na ponta
-                pygame.draw.circle(surface, (255, 255, 200), tip_point, 2)
-            
-            # Espinhos laterais direitos
-            for i in range(num_spikes):
-                y_pos = self.y + (i + 1) * self.size // (num_spikes + 1)
-                # Criar pontos para um espinho mais elegante
-                top_point = (self.x + self.size + adjusted_length//2, y_pos - adjusted_length//3)
-                bottom_point = (self.x + self.size + adjusted_length//2, y_pos + adjusted_length//3)
-                tip_point = (self.x + self.size + adjusted_length, y_pos)
-                
-                # Desenhar o corpo principal do espinho
-                pygame.draw.polygon(surface, base_color, [
-                    (self.x + self.size, y_pos),
-                    top_point,
-                    tip_point,
-                    bottom_point
-                ])
-                
-                # Desenhar uma linha brilhante no centro do espinho
-                pygame.draw.line(surface, tip_color, (self.x + self.size, y_pos), tip_point, 2)
-                
-                # Desenhar um pequeno círculo brilhante na ponta
-                pygame.draw.circle(surface, (255, 255, 200), tip_point, 2)
+            # A pulsação só produz poucos comprimentos inteiros: cada fase é
+            # desenhada uma vez e reaproveitada
+            pad = spike_padding(adjusted_length)
+            surface.blit(get_spike_sprite(self.size, adjusted_length),
+                         (int(self.x) - pad, int(self.y) - pad))
+    
+    def get_dirty_rects(self):
+        """
+        Retorna os retângulos que cobrem tudo o que draw() desenha neste frame.
+        
+        Os retângulos são conservadores: incluem a compressão, o brilho, os
+        espinhos, o rastro do speed boost e o flash na parede.
+        """
+        if not self.is_alive:
+            return []
+        
+        # Espinhos saem até ~0.48 * size e a compressão estica até 15% de cada lado
+        margin = int(self.size * 0.5) + 12
+        rect = pygame.Rect(int(self.x) - margin, int(self.y) - margin,
+                           self.size + 2 * margin, self.size + 2 * margin)
+        
+        # Rastro do speed boost (10 cópias recuando até 2 * velocidade)
+        if self.speed_boost:
+            rect.union_ip(rect.move(-int(self.vx * 2), -int(self.vy * 2)))
+        
+        rects = [rect]
+        
+        # Flash na parede atingida
+        if self.wall_collision and self.wall_collision_timer > 0:
+            flash_rect = self.get_wall_flash_rect()
+            if flash_rect is not None:
+                rects.append(flash_rect)
+        
+        return rects
+    
+    def get_wall_flash_rect(self):
+        """
+        Retorna o retângulo (na tela) do flash na parede atingida.
+        
+        É a região que pygame.draw.line com espessura FLASH_WIDTH cobriria na
+        borda da área, já recortada à área. Retorna None se não houver lado.
+        """
+        side = self.wall_collision_side
+        if side in ('left', 'right'):
+            along_start = self.y - self.area_y
+            edge = 0 if side == 'left' else self.area_size - 1
+        elif side in ('top', 'bottom'):
+            along_start = self.x - self.area_x
+            edge = 0 if side == 'top' else self.area_size - 1
+        else:
+            return None
+        
+        # Ao longo da parede: do início ao fim inclusive (coordenadas truncadas)
+        start = int(max(0, along_start - FLASH_MARGIN))
+        end = min(self.area_size - 1, int(min(self.area_size, along_start + self.size + FLASH_MARGIN)))
+        # Na espessura: linha centrada na borda, recortada à área
+        half = FLASH_WIDTH // 2
+        across_start = max(0, edge - half)
+        across_end = min(self.area_size - 1, edge + half)
+        if end < start:
+            return None
+        
+        length = end - start + 1
+        thickness = across_end - across_start + 1
+        if side in ('left', 'right'):
+            return pygame.Rect(self.area_x + across_start, self.area_y + start, thickness, length)
+        return pygame.Rect(self.area_x + start, self.area_y + across_start, length, thickness)
     
     def check_collision(self, other):
         """
@@ -810,7 +859,7 @@ class Square:
                 other.vy += j * ny / m2
                 
                 # Adicionar um pequeno componente aleatório para evitar comportamentos repetitivos
-                angle = random.uniform(0, math.pi/4)  # Pequena variação aleatória
+                angle = self.rng.uniform(0, math.pi/4)  # Pequena variação aleatória
                 self.vx += 0.2 * math.cos(angle)
                 self.vy += 0.2 * math.sin(angle)
                 other.vx += 0.2 * math.cos(angle + math.pi)
@@ -910,15 +959,15 @@ class Square:
             # aproximadamente na mesma direção
             if dot_product > 0.7:  # Limiar arbitrário para "mesma direção"
                 # Decidir aleatoriamente qual quadrado mudar de direção
-                if random.random() < 0.5:
+                if self.rng.random() < 0.5:
                     # Mudar a direção deste quadrado por um ângulo significativo
-                    angle = random.uniform(math.pi/2, math.pi)
+                    angle = self.rng.uniform(math.pi/2, math.pi)
                     speed = math.sqrt(self.vx**2 + self.vy**2)
                     self.vx = speed * math.cos(angle)
                     self.vy = speed * math.sin(angle)
                 else:
                     # Mudar a direção do outro quadrado
-                    angle = random.uniform(math.pi/2, math.pi)
+                    angle = self.rng.uniform(math.pi/2, math.pi)
                     speed = math.sqrt(other.vx**2 + other.vy**2)
                     other.vx = speed * math.cos(angle)
                     other.vy = speed * math.sin(angle)
@@ -951,16 +1000,16 @@ class Square:
                 other.vy = new_v2n * ny + v2ty
                 
                 # Adicionar um pequeno componente aleatório para evitar comportamentos repetitivos
-                self.vx += random.uniform(-0.1, 0.1)
-                self.vy += random.uniform(-0.1, 0.1)
-                other.vx += random.uniform(-0.1, 0.1)
-                other.vy += random.uniform(-0.1, 0.1)
+                self.vx += self.rng.uniform(-0.1, 0.1)
+                self.vy += self.rng.uniform(-0.1, 0.1)
+                other.vx += self.rng.uniform(-0.1, 0.1)
+                other.vy += self.rng.uniform(-0.1, 0.1)
         else:
             # Caso um dos quadrados tenha velocidade zero, aplicar um impulso simples
-            self.vx = -self.vx * 0.9 + random.uniform(-0.2, 0.2)
-            self.vy = -self.vy * 0.9 + random.uniform(-0.2, 0.2)
-            other.vx = -other.vx * 0.9 + random.uniform(-0.2, 0.2)
-            other.vy = -other.vy * 0.9 + random.uniform(-0.2, 0.2)
+            self.vx = -self.vx * 0.9 + self.rng.uniform(-0.2, 0.2)
+            self.vy = -self.vy * 0.9 + self.rng.uniform(-0.2, 0.2)
+            other.vx = -other.vx * 0.9 + self.rng.uniform(-0.2, 0.2)
+            other.vy = -other.vy * 0.9 + self.rng.uniform(-0.2, 0.2)
         
         # Remover espinhos na colisão
         if self.has_spikes:
@@ -0,0 +1,43 @@
+"""
+Medição do tempo de inicialização do jogo DVD Bounce Simulation.
+
+Cada fase da inicialização (imports, subsistemas do pygame, janela, imagens,
+resolução de fontes, primeiro frame) é registrada em STARTUP, e o relatório
+pode ser impresso com `python main.py --tempo-inicio`.
+"""
+import time
+from contextlib import contextmanager
+
+
+class StartupTimer:
+    """Registra a duração de cada fase da inicialização."""
+    def __init__(self):
+        """Começa a contar a partir da criação (importação deste módulo)."""
+        self.start = time.perf_counter()
+        self.phases = []
+
+    @contextmanager
+    def phase(self, name):
+        """Mede o bloco with como uma fase com o nome informado."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, time.perf_counter() - started))
+
+    def add(self, name, seconds):
+        """Registra uma fase medida por fora."""
+        self.phases.append((name, seconds))
+
+    def report(self):
+        """Retorna o relatório das fases, em milissegundos, como texto."""
+        total = time.perf_counter() - self.start
+        lines = ["Tempo de inicialização:"]
+        for name, seconds in self.phases:
+            lines.append(f"  {name:<32} {seconds * 1000:8.1f} ms")
+        lines.append(f"  {'total desde o início':<32} {total * 1000:8.1f} ms")
+        return "\n".join(lines)
+
+
+# Instância única usada por todos os módulos
+STARTUP = StartupTimer()
@@ -0,0 +1,32 @@
+"""
+Cache de textos renderizados para o jogo DVD Bounce Simulation.
+
+Font.render rasteriza o texto inteiro a cada chamada. Como o jogo e o menu
+desenham sempre as mesmas frases, as superfícies ficam guardadas por
+(fonte, texto, antialias, cor) em um cache LRU compartilhado.
+"""
+from cache import LRUCache
+
+# Cache compartilhado pelo jogo e pelo menu
+TEXT_CACHE = LRUCache(max_items=512)
+
+
+def render_text(font, text, antialias, color):
+    """
+    Equivalente a font.render(text, antialias, color), usando o cache.
+    
+    A superfície retornada é compartilhada e não deve ser modificada.
+    
+    Args:
+        font (pygame.font.Font): Fonte usada
+        text (str): Texto a renderizar
+        antialias (bool): Se o texto deve ser suavizado
+        color (tuple): Cor RGB do texto
+    """
+    key = (font, text, antialias, tuple(color))
+    return TEXT_CACHE.get_or_create(key, lambda: font.render(text, antialias, color))
+
+
+def text_cache_stats():
+    """Retorna as estatísticas (acertos, falhas, itens) do cache de textos."""
+    return TEXT_CACHE.stats()
@@ -0,0 +1,151 @@
+"""
+Torneios de partidas sem janela para o jogo DVD Bounce Simulation.
+
+Um torneio é uma grade de partidas (mapas × vidas × faixas de velocidade ×
+sementes) distribuída entre vários processos com ProcessPoolExecutor. Cada
+processo joga partidas completas com o loop headless de Game, e os resultados
+voltam ao processo principal assim que cada partida termina, para que uma
+varredura longa possa ser acompanhada (e gravada) enquanto roda.
+"""
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from maps import AVAILABLE_MAPS
+
+# Valores padrão da grade
+DEFAULT_LIVES = (1, 3, 5)
+DEFAULT_SPEED_RANGES = ((1.5, 4.5), (2.0, 6.0), (3.0, 8.0))
+
+# Limite de frames por partida quando nenhum é dado (10 minutos de jogo a 60 Hz):
+# algumas sementes nunca terminam e prenderiam o processo para sempre
+DEFAULT_MAX_FRAMES = 36000
+
+
+def build_grid(map_indices=None, lives=DEFAULT_LIVES, speed_ranges=DEFAULT_SPEED_RANGES,
+               seeds=range(10)):
+    """
+    Monta a lista de partidas do torneio.
+
+    Args:
+        map_indices (iterable, optional): Índices em AVAILABLE_MAPS (todos se None)
+        lives (iterable, optional): Números de vidas a testar
+        speed_ranges (iterable, optional): Pares (velocidade mínima, velocidade máxima)
+        seeds (iterable, optional): Sementes; cada combinação é jogada uma vez por semente
+
+    Returns:
+        list: Dicionários com 'map_index', 'lives', 'min_speed', 'max_speed' e 'seed'
+    """
+    if map_indices is None:
+        map_indices = range(len(AVAILABLE_MAPS))
+
+    return [
+        {
+            'map_index': map_index,
+            'lives': match_lives,
+            'min_speed': min_speed,
+            'max_speed': max_speed,
+            'seed': seed
+        }
+        for map_index, match_lives, (min_speed, max_speed), seed
+        in itertools.product(map_indices, lives, speed_ranges, seeds)
+    ]
+
+
+def play_match(match, physics='python', max_frames=None):
+    """
+    Joga uma partida do torneio (executado dentro dos processos de trabalho).
+
+    Args:
+        match (dict): Partida no formato de build_grid
+        physics (str, optional): Backend de física ('python' ou 'numpy')
+        max_frames (int, optional): Limite de frames antes de desistir da partida
+            (DEFAULT_MAX_FRAMES se None)
+
+    Returns:
+        dict: A partida com 'map', 'winner', 'frames', 'collisions' e
+              'powerups_collected' acrescentados; 'winner' é None se a partida
+              atingiu o limite de frames
+    """
+    # Importado aqui para que o processo principal não precise criar um jogo
+    from game import Game
+
+    if max_frames is None:
+        max_frames = DEFAULT_MAX_FRAMES
+
+    game = Game(headless=True, physics=physics, seed=match['seed'])
+    game.apply_config({key: value for key, value in match.items() if key != 'seed'})
+    winner, frames = game.simulate(max_frames)
+
+    result = dict(match)
+    result.update({
+        'map': game.current_map.name,
+        'winner': winner.name if winner else None,
+        'frames': frames,
+        'collisions': game.collision_count,
+        'powerups_collected': game.powerups_collected
+    })
+    return result
+
+
+def run_tournament(matches, workers=None, physics='python', max_frames=None):
+    """
+    Joga as partidas em paralelo e devolve cada resultado assim que fica pronto.
+
+    Args:
+        matches (list): Partidas no formato de build_grid
+        workers (int, optional): Número de processos (os.cpu_count() se None)
+        physics (str, optional): Backend de física ('python' ou 'numpy')
+        max_frames (int, optional): Limite de frames por partida
+            (DEFAULT_MAX_FRAMES se None)
+
+    Yields:
+        dict: Resultado de play_match, na ordem em que as partidas terminam
+    """
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1:
+        # Sem processos extras: útil para depuração e máquinas de um núcleo
+        for match in matches:
+            yield play_match(match, physics, max_frames)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(play_match, match, physics, max_frames) for match in matches]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def summarize(results):
+    """
+    Agrupa os resultados por mapa e configuração.
+
+    Args:
+        results (iterable): Resultados de run_tournament
+
+    Returns:
+        dict: Para cada (mapa, vidas, velocidade mínima, velocidade máxima), o número
+              de partidas, as vitórias por jogador (None conta as partidas que
+              atingiram o limite de frames) e as médias de frames, colisões e
+              power-ups coletados
+    """
+    summary = {}
+    for result in results:
+        key = (result['map'], result['lives'], result['min_speed'], result['max_speed'])
+        entry = summary.setdefault(key, {
+            'matches': 0,
+            'wins': {},
+            'frames': 0,
+            'collisions': 0,
+            'powerups_collected': 0
+        })
+        entry['matches'] += 1
+        entry['wins'][result['winner']] = entry['wins'].get(result['winner'], 0) + 1
+        entry['frames'] += result['frames']
+        entry['collisions'] += result['collisions']
+        entry['powerups_collected'] += result['powerups_collected']
+
+    for entry in summary.values():
+        for field in ('frames', 'collisions', 'powerups_collected'):
+            entry[field] /= entry['matches']
+    return summary
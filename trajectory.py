@@ -0,0 +1,330 @@
+"""
+Gravador de trajetórias em arquivos mapeados em memória para o jogo DVD Bounce Simulation.
+
+A cada frame (ou a cada stride frames), o estado de todos os quadrados e
+power-ups é copiado para arrays estruturados do NumPy ligados a arquivos com
+np.memmap. Os arquivos crescem em blocos pré-alocados à medida que a partida
+avança, então longas simulações sem janela podem ser analisadas depois sem
+serializar objetos Python.
+
+Com o motor NumPy, cada frame custa três cópias (floats, ints e bools do motor)
+para buffers pré-alocados de flush_frames frames. Com o backend Python, ler os
+atributos de cada quadrado já custa alguns por cento do update: DEFAULT_STRIDES
+guarda o passo padrão de cada backend que mantém o custo em poucos por cento.
+
+Estrutura do diretório gravado:
+    squares.dat   linhas SQUARE_DTYPE (uma por quadrado por frame)
+    powerups.dat  linhas POWERUP_DTYPE (uma por power-up por frame)
+    meta.json     número de linhas, frames e nomes dos quadrados
+"""
+import json
+import os
+from operator import attrgetter
+import numpy as np
+
+SQUARE_DTYPE = np.dtype([
+    ('frame', np.int32),
+    ('square', np.int16),
+    ('x', np.float32),
+    ('y', np.float32),
+    ('vx', np.float32),
+    ('vy', np.float32),
+    ('lives', np.int32),
+    ('is_alive', np.bool_),
+    ('has_spikes', np.bool_),
+    ('speed_boost', np.bool_)
+])
+
+POWERUP_DTYPE = np.dtype([
+    ('frame', np.int32),
+    ('x', np.float32),
+    ('y', np.float32),
+    ('type', np.int8),  # Índice em POWERUP_TYPES
+    ('active', np.bool_)
+])
+
+POWERUP_TYPES = ('spikes', 'speed')
+
+# Campos de SQUARE_DTYPE lidos dos quadrados (frame e square são preenchidos na gravação)
+SQUARE_FIELDS = ('x', 'y', 'vx', 'vy', 'lives', 'is_alive', 'has_spikes', 'speed_boost')
+# Os mesmos campos por matriz do motor NumPy (linhas seguidas de cada matriz)
+ENGINE_FIELDS = (
+    ('floats', ('x', 'y', 'vx', 'vy')),
+    ('ints', ('lives',)),
+    ('bools', ('is_alive', 'has_spikes', 'speed_boost'))
+)
+
+# Passo padrão por backend de física: com ele, gravar custa poucos por cento do
+# update (medido com "python benchmark.py --trajetoria")
+DEFAULT_STRIDES = {'numpy': 1, 'python': 10}
+
+# Campos de POWERUP_DTYPE lidos dos power-ups (o tipo é convertido em índice na gravação)
+POWERUP_FIELDS = ('x', 'y', 'powerup_type', 'active')
+
+_square_state = attrgetter(*SQUARE_FIELDS)
+_powerup_state = attrgetter(*POWERUP_FIELDS)
+
+
+class MemmapTable:
+    """Array estruturado em arquivo que cresce em blocos."""
+    def __init__(self, path, dtype, block_rows):
+        """
+        Cria o arquivo com o primeiro bloco pré-alocado.
+
+        Args:
+            path (str): Arquivo de dados
+            dtype (np.dtype): Tipo estruturado das linhas
+            block_rows (int): Linhas acrescentadas cada vez que o arquivo enche
+        """
+        self.path = path
+        self.dtype = dtype
+        self.block_rows = block_rows
+        self.rows = 0
+        self.capacity = 0
+        self.data = None
+        self._grow(block_rows)
+
+    def _grow(self, capacity):
+        """Aumenta o arquivo e remapeia o array."""
+        if self.data is not None:
+            # Sem flush: o que já foi escrito fica no cache de páginas do arquivo
+            del self.data
+        with open(self.path, 'ab') as data_file:
+            data_file.truncate(capacity * self.dtype.itemsize)
+        self.data = np.memmap(self.path, dtype=self.dtype, mode='r+', shape=(capacity,))
+        self.capacity = capacity
+
+    def append(self, rows):
+        """Acrescenta um array de linhas ao final da tabela."""
+        count = len(rows)
+        if self.rows + count > self.capacity:
+            blocks = (self.rows + count - self.capacity) // self.block_rows + 1
+            self._grow(self.capacity + blocks * self.block_rows)
+        self.data[self.rows:self.rows + count] = rows
+        self.rows += count
+
+    def close(self):
+        """Grava o que falta e corta o arquivo no número real de linhas."""
+        if self.data is None:
+            return
+        self.data.flush()
+        del self.data
+        self.data = None
+        with open(self.path, 'r+b') as data_file:
+            data_file.truncate(self.rows * self.dtype.itemsize)
+
+
+class TrajectoryRecorder:
+    """Grava o estado por frame de quadrados e power-ups em arquivos np.memmap."""
+    def __init__(self, directory, block_frames=4096, flush_frames=1024, stride=1):
+        """
+        Prepara o diretório de gravação.
+
+        Args:
+            directory (str): Diretório onde os arquivos são criados
+            block_frames (int, optional): Frames pré-alocados por bloco de arquivo
+            flush_frames (int, optional): Frames acumulados em memória antes de
+                copiar para o arquivo (reduz o custo por frame)
+            stride (int, optional): Grava um frame a cada stride frames simulados
+                (a coluna frame guarda o número real do frame; ver DEFAULT_STRIDES)
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.block_frames = block_frames
+        self.flush_frames = flush_frames
+        self.stride = max(1, int(stride))
+        self.squares = None  # Criadas no primeiro frame, quando o número de quadrados é conhecido
+        self.powerups = MemmapTable(os.path.join(directory, 'powerups.dat'),
+                                    POWERUP_DTYPE, block_frames * 2)
+        self.frame = 0  # Frames simulados (gravados ou não)
+        self.square_names = []
+        self._rows = 0  # Frames acumulados em memória
+        self._first_frame = 0  # Número do primeiro frame acumulado
+        self._square_values = []  # Valores de SQUARE_FIELDS em sequência (backend Python)
+        self._last_powerups = []
+        self._powerup_changes = []  # (frame acumulado, linhas) a cada mudança dos power-ups
+        self._current_squares = None  # Lista de quadrados sendo gravada
+        self._current_count = 0
+        self._table = None  # Linhas SQUARE_DTYPE de um flush, reaproveitadas
+        self._engine = None  # Motor NumPy e, para ele, os índices e buffers abaixo
+        self._engine_slots = None  # Posições dos quadrados (fatia se forem seguidas)
+        self._engine_rows = []  # (matriz, linhas dos campos) para cada grupo de ENGINE_FIELDS
+        self._engine_buffers = []  # Buffer (flush_frames, campos, quadrados) de cada grupo
+
+    def record(self, game):
+        """
+        Registra o estado atual do jogo como um novo frame.
+
+        Args:
+            game (Game): Jogo cujo estado deve ser gravado
+        """
+        frame = self.frame
+        self.frame = frame + 1
+        if frame % self.stride:
+            return
+
+        squares = game.squares
+        if squares is not self._current_squares or len(squares) != self._current_count:
+            self._start_squares(squares, game.physics)
+
+        row = self._rows
+        if not row:
+            self._first_frame = frame
+        if self._engine is not None:
+            # Motor NumPy: uma cópia por matriz, direto para o buffer pré-alocado
+            # (as propriedades de ArraySquare custariam uma chamada Python por campo)
+            engine = self._engine
+            slots = self._engine_slots
+            for (group, fields), buffer in zip(self._engine_rows, self._engine_buffers):
+                buffer[row] = getattr(engine, group)[fields, slots]
+        else:
+            # Backend Python: ler os atributos é o custo mínimo; uma lista plana é
+            # mais barata de preencher que uma linha de array NumPy
+            extend = self._square_values.extend
+            for square in squares:
+                extend(_square_state(square))
+
+        # Power-ups mudam raramente: guardar as linhas só quando a lista muda
+        powerups = game.powerups
+        if powerups != self._last_powerups:
+            self._last_powerups = list(powerups)
+            self._powerup_changes.append((row, [_powerup_state(powerup) for powerup in powerups]))
+
+        self._rows = row + 1
+        if row + 1 == self.flush_frames:
+            self.flush()
+
+    def _start_squares(self, squares, engine):
+        """Prepara a gravação de uma nova lista de quadrados (início de partida)."""
+        # As linhas pendentes usam o número de quadrados antigo: gravá-las antes
+        self.flush()
+        count = len(squares)
+        self._current_squares = squares
+        self._current_count = count
+
+        if self.squares is None:
+            self.squares = MemmapTable(os.path.join(self.directory, 'squares.dat'),
+                                       SQUARE_DTYPE, self.block_frames * max(1, count))
+        if count > len(self.square_names):
+            self.square_names = [square.name for square in squares]
+
+        # Linhas de um flush completo, com o índice de cada quadrado já preenchido
+        self._table = np.zeros(self.flush_frames * count, dtype=SQUARE_DTYPE)
+        self._table['square'] = np.tile(np.arange(count, dtype=np.int16), self.flush_frames)
+
+        self._engine = engine
+        if engine is None:
+            return
+        from physics import FIELD_GROUPS
+        slots = np.array([square._slot for square in squares], dtype=np.int64)
+        if count and np.array_equal(slots, np.arange(slots[0], slots[0] + count)):
+            slots = slice(int(slots[0]), int(slots[0]) + count)  # Cópia sem indexação avançada
+        self._engine_slots = slots
+        self._engine_rows = []
+        self._engine_buffers = []
+        dtypes = {group: (fields, dtype) for group, fields, dtype in FIELD_GROUPS}
+        for group, names in ENGINE_FIELDS:
+            fields, dtype = dtypes[group]
+            first = fields.index(names[0])
+            if fields[first:first + len(names)] != names:
+                raise ValueError(f"Campos de {group} fora de ordem para a gravação: {names}")
+            self._engine_rows.append((group, slice(first, first + len(names))))
+            self._engine_buffers.append(np.zeros((self.flush_frames, len(names), count), dtype=dtype))
+
+    def _square_table(self):
+        """Preenche as linhas SQUARE_DTYPE dos frames acumulados em memória."""
+        frames = self._rows
+        count = self._current_count
+        table = self._table[:frames * count]
+
+        # Frames gravados seguidos (o número de quadrados não muda entre flushes)
+        numbers = self._first_frame + np.arange(frames, dtype=np.int32) * self.stride
+        table['frame'] = np.repeat(numbers, count)
+
+        if self._engine is not None:
+            for (_, names), buffer in zip(ENGINE_FIELDS, self._engine_buffers):
+                for column, name in enumerate(names):
+                    table[name] = buffer[:frames, column].reshape(-1)
+        else:
+            # Valores homogêneos em float64 (exato para os ints e bools gravados)
+            values = np.fromiter(self._square_values, np.float64, len(self._square_values))
+            values = values.reshape(frames * count, len(SQUARE_FIELDS))
+            for column, name in enumerate(SQUARE_FIELDS):
+                table[name] = values[:, column]
+        return table
+
+    def _powerup_table(self):
+        """Monta as linhas POWERUP_DTYPE dos frames acumulados em memória."""
+        frames = self._first_frame + np.arange(self._rows, dtype=np.int32) * self.stride
+        changes = self._powerup_changes
+        parts = []
+        for k, (start, rows) in enumerate(changes):
+            stop = changes[k + 1][0] if k + 1 < len(changes) else len(frames)
+            if not rows or stop == start:
+                continue
+            segment = np.zeros(len(rows), dtype=POWERUP_DTYPE)
+            x, y, types, active = zip(*rows)
+            segment['x'] = x
+            segment['y'] = y
+            segment['type'] = [POWERUP_TYPES.index(powerup_type) for powerup_type in types]
+            segment['active'] = active
+            segment = np.tile(segment, stop - start)
+            segment['frame'] = np.repeat(frames[start:stop], len(rows))
+            parts.append(segment)
+        if not parts:
+            return np.zeros(0, dtype=POWERUP_DTYPE)
+        return np.concatenate(parts)
+
+    def flush(self):
+        """Copia os frames acumulados em memória para os arquivos."""
+        if not self._rows:
+            return
+        if self._current_count:
+            self.squares.append(self._square_table())
+        self.powerups.append(self._powerup_table())
+
+        # Os power-ups atuais continuam valendo a partir do primeiro frame do próximo flush
+        if self._powerup_changes:
+            self._powerup_changes = [(0, self._powerup_changes[-1][1])]
+        self._rows = 0
+        self._square_values = []
+
+    def close(self):
+        """Finaliza a gravação e escreve os metadados."""
+        if self.squares is None:
+            self.squares = MemmapTable(os.path.join(self.directory, 'squares.dat'),
+                                       SQUARE_DTYPE, 1)
+        self.flush()
+        self.squares.close()
+        self.powerups.close()
+
+        meta = {
+            'frames': self.frame,
+            'stride': self.stride,
+            'square_rows': self.squares.rows,
+            'powerup_rows': self.powerups.rows,
+            'square_names': self.square_names,
+            'powerup_types': list(POWERUP_TYPES)
+        }
+        with open(os.path.join(self.directory, 'meta.json'), 'w', encoding='utf-8') as meta_file:
+            json.dump(meta, meta_file)
+
+
+def load_trajectory(directory):
+    """
+    Abre uma trajetória gravada, sem copiar os dados para a memória.
+
+    Returns:
+        tuple: (squares, powerups, meta) com os arrays estruturados somente leitura
+    """
+    with open(os.path.join(directory, 'meta.json'), encoding='utf-8') as meta_file:
+        meta = json.load(meta_file)
+
+    def open_table(name, dtype, rows):
+        if rows == 0:
+            return np.zeros(0, dtype=dtype)
+        return np.memmap(os.path.join(directory, name), dtype=dtype, mode='r', shape=(rows,))
+
+    squares = open_table('squares.dat', SQUARE_DTYPE, meta['square_rows'])
+    powerups = open_table('powerups.dat', POWERUP_DTYPE, meta['powerup_rows'])
+    return squares, powerups, meta